@@ -0,0 +1,97 @@
+"""
+활동 히트맵 (요일 × 시간대 매치 수, 증분 갱신)
+- 플레이어 ID를 정수로 인턴하고 (플레이어 수 + 1) × 168 NumPy 정수 배열에 누적 (0번 행은 전체)
+- 매치 추가 시 배치 단위로 np.add.at 한 번에 반영, 조회는 해당 행을 7 × 24로 reshape
+- 요일/시간은 매치 날짜 문자열 기준 (로컬 시각), 날짜를 알 수 없는 매치는 제외
+"""
+
+from datetime import datetime
+from typing import List, Dict, Any, Callable, Iterable, Tuple
+
+WEEKDAYS = 7
+HOURS = 24
+CELLS = WEEKDAYS * HOURS
+
+GLOBAL_ROW = 0          # 전체 활동 행
+_INITIAL_ROWS = 64      # 배열 초기 행 수 (부족하면 2배씩 확장)
+
+
+class ActivityHeatmap:
+    """플레이어별 / 전체 요일 × 시간대 매치 수"""
+
+    def __init__(self, timestamp: Callable[[Dict[str, Any]], float]):
+        """
+        Args:
+            timestamp: 매치 dict → Unix timestamp (날짜를 알 수 없으면 -inf)
+        """
+        import numpy as np
+
+        self.timestamp = timestamp
+        self.index: Dict[str, int] = {}
+        self.counts = np.zeros((_INITIAL_ROWS, CELLS), dtype=np.int64)
+        self.rows = 1       # 사용 중인 행 수 (0번 = 전체)
+
+    def _intern(self, user_id: str) -> int:
+        """플레이어 ID → 행 번호 (처음 보는 ID면 행 추가, 배열이 차면 2배 확장)"""
+        import numpy as np
+
+        row = self.index.get(user_id)
+        if row is None:
+            row = self.index[user_id] = self.rows
+            self.rows += 1
+            if self.rows > len(self.counts):
+                grown = np.zeros((len(self.counts) * 2, CELLS), dtype=self.counts.dtype)
+                grown[:len(self.counts)] = self.counts
+                self.counts = grown
+        return row
+
+    def add_matches(self, matches: Iterable[Dict[str, Any]]) -> None:
+        """매치 dict 목록 반영 (배치 전체를 한 번의 배열 연산으로 누적)"""
+        import numpy as np
+
+        rows: List[int] = []
+        cells: List[int] = []
+        for m in matches:
+            ts = self.timestamp(m)
+            if ts == float("-inf"):
+                continue
+            played = datetime.fromtimestamp(ts)
+            cell = played.weekday() * HOURS + played.hour
+
+            rows.append(GLOBAL_ROW)
+            cells.append(cell)
+            for player in {m.get("player1", "").lower(), m.get("player2", "").lower()} - {""}:
+                rows.append(self._intern(player))
+                cells.append(cell)
+
+        if rows:
+            np.add.at(self.counts, (np.asarray(rows), np.asarray(cells)), 1)
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+    def grid(self, player_id: str = "") -> Any:
+        """
+        요일 × 시간대 매치 수 (7 × 24 ndarray 사본, 0행 = 월요일)
+        player_id가 비어 있으면 전체 (전체는 매치당 1회, 플레이어는 자신이 뛴 매치 수)
+        """
+        import numpy as np
+
+        if not player_id:
+            return self.counts[GLOBAL_ROW].reshape(WEEKDAYS, HOURS).copy()
+        row = self.index.get(player_id.lower())
+        if row is None:
+            return np.zeros((WEEKDAYS, HOURS), dtype=self.counts.dtype)
+        return self.counts[row].reshape(WEEKDAYS, HOURS).copy()
+
+    def peaks(self, player_id: str = "", k: int = 3) -> List[Tuple[int, int, int]]:
+        """가장 활발한 시간대 상위 K개 [(요일, 시, 매치 수), ...] (매치가 있는 칸만)"""
+        import numpy as np
+
+        flat = self.grid(player_id).ravel()
+        k = min(k, int(np.count_nonzero(flat)))
+        if k <= 0:
+            return []
+        top = np.argpartition(flat, -k)[-k:]
+        top = top[np.argsort(-flat[top], kind="stable")]
+        return [(int(cell) // HOURS, int(cell) % HOURS, int(flat[cell])) for cell in top]
@@ -11,8 +11,10 @@ import streamlit as st
 from datetime import datetime
 from config import PAGE_TITLE, PAGE_ICON
 from data_manager import (
-    export_all_data, import_all_data, load_match_history, load_badmanner_list,
-    increment_visit_count, get_visit_count, recalculate_all_ratings
+    export_backup_bytes, decode_backup_bytes, get_data_version,
+    import_all_data, load_match_history, load_badmanner_list,
+    increment_visit_count, get_visit_count, recalculate_all_ratings,
+    ratings_need_rebuild
 )
 
 # =============================================================================
@@ -116,21 +118,53 @@ if "visit_counted" not in st.session_state:
     st.session_state.visit_counted = True
     increment_visit_count()
 
-# Rating 초기화 (기존 데이터가 있고 Rating이 없으면 자동 계산)
+# Rating 초기화 (기존 데이터가 있고 Rating/게임별 Rating/Rating 시계열이 없거나 오래되면 자동 계산)
 if "rating_initialized" not in st.session_state:
     st.session_state.rating_initialized = True
-    from data_manager import load_player_ratings
-    if not load_player_ratings() and load_match_history():
+    if ratings_need_rebuild():
         recalculate_all_ratings()
 
 # =============================================================================
 # 모듈 임포트
 # =============================================================================
-from quadrant_1_winrate import render_quadrant_1
+from quadrant_1_winrate import render_quadrant_1, render_ingest_status
 from quadrant_2_ranking import render_quadrant_2
 from quadrant_3_badmanner import render_quadrant_3
 from quadrant_4_tbd import render_quadrant_4
 
+# =============================================================================
+# 사분면 Fragment
+# =============================================================================
+# 각 사분면은 독립적으로 rerun되는 fragment로 실행
+# - 한 사분면의 위젯 조작은 해당 사분면만 다시 실행
+# - 데이터가 바뀌는 동작(1사분면 저장 완료, 3사분면 추가/삭제, 복원)은
+#   st.rerun()(scope="app")으로 앱 전체를 다시 실행해 다른 사분면과 헤더를 무효화
+@st.fragment
+def _quadrant_1_fragment():
+    render_quadrant_1()
+
+
+@st.fragment
+def _quadrant_2_fragment():
+    render_quadrant_2()
+
+
+@st.fragment
+def _quadrant_3_fragment():
+    render_quadrant_3()
+
+
+@st.fragment
+def _quadrant_4_fragment():
+    render_quadrant_4()
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _get_data_counts(data_version: str) -> tuple:
+    """(매치 수, 비매너 수) - 데이터 버전이 바뀔 때만 파일 로드"""
+    return len(load_match_history()), len(load_badmanner_list())
+
+
 # =============================================================================
 # 메인 레이아웃
 # =============================================================================
@@ -154,13 +188,15 @@ with header_right:
     )
     
     # 현재 데이터 상태 표시
-    match_count = len(load_match_history())
-    badmanner_count = len(load_badmanner_list())
+    match_count, badmanner_count = _get_data_counts(get_data_version())
     st.markdown(
         f"<p style='color: rgba(255,255,255,0.5); font-size: 0.85rem; text-align: right; margin: 0;'>"
         f"📊 매치: {match_count} | 🚫 비매너: {badmanner_count}</p>",
         unsafe_allow_html=True
     )
+    
+    # 백그라운드 저장 진행 상태 (완료 시 앱 전체 갱신)
+    render_ingest_status()
 
 st.markdown("<hr style='border-color: rgba(255,255,255,0.1); margin: 0.5rem 0 1rem 0;'>", unsafe_allow_html=True)
 
@@ -170,19 +206,19 @@ bottom_left, bottom_right = st.columns(2, gap="large")
 
 with top_left:
     with st.container(border=True):
-        render_quadrant_1()
+        _quadrant_1_fragment()
 
 with top_right:
     with st.container(border=True):
-        render_quadrant_2()
+        _quadrant_2_fragment()
 
 with bottom_left:
     with st.container(border=True):
-        render_quadrant_3()
+        _quadrant_3_fragment()
 
 with bottom_right:
     with st.container(border=True):
-        render_quadrant_4()
+        _quadrant_4_fragment()
 
 # =============================================================================
 # 하단: 백업/복원 버튼
@@ -195,24 +231,35 @@ with footer_right:
     backup_col, restore_col = st.columns(2)
     
     with backup_col:
-        # 다운로드 버튼
-        backup_data = export_all_data()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        st.download_button(
-            label="💾 백업",
-            data=backup_data,
-            file_name=f"fightcade_backup_{timestamp}.json",
-            mime="application/json",
-            use_container_width=True,
-            key="backup_btn"
-        )
+        # 2단계 백업: 버튼 클릭 시에만 백업 생성 → 다운로드 버튼 표시
+        backup = st.session_state.get("backup_payload")
+        
+        if backup and backup["version"] == get_data_version():
+            st.download_button(
+                label="⬇️ 다운로드",
+                data=backup["data"],
+                file_name=backup["file_name"],
+                mime=backup["mime"],
+                use_container_width=True,
+                key="backup_btn"
+            )
+        elif st.button("💾 백업", key="backup_prepare_btn", use_container_width=True):
+            backup_data, compressed = export_backup_bytes()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            st.session_state.backup_payload = {
+                "version": get_data_version(),
+                "data": backup_data,
+                "file_name": f"fightcade_backup_{timestamp}.json" + (".gz" if compressed else ""),
+                "mime": "application/gzip" if compressed else "application/json"
+            }
+            st.rerun()
     
     with restore_col:
         # 복원 팝오버
         with st.popover("📂 복원", use_container_width=True):
             uploaded_file = st.file_uploader(
                 "백업 파일 선택",
-                type=["json"],
+                type=["json", "gz"],
                 key="restore_file",
                 label_visibility="collapsed"
             )
@@ -220,7 +267,7 @@ with footer_right:
             if uploaded_file is not None:
                 if st.button("✅ 복원 실행", key="restore_confirm", use_container_width=True):
                     try:
-                        json_str = uploaded_file.read().decode("utf-8")
+                        json_str = decode_backup_bytes(uploaded_file.read())
                         success, message = import_all_data(json_str)
                         
                         if success:
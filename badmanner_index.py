@@ -0,0 +1,187 @@
+"""
+비매너 리스트 인덱스
+- 소문자 ID 해시맵: O(1) 등록 여부 확인
+- 트라이그램(3-gram) 역색인: 부분 문자열 / 유사 ID 검색 (여러 결과, 점수순)
+- dict 변환으로 JSON 저장/복원 가능 (data_manager가 리스트와 함께 저장)
+- SubstringIndex: 임의 ID 목록(랭킹 등)의 부분 문자열 필터용 트라이그램 역색인 (목록 순서 유지)
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+
+FUZZY_MIN_SIMILARITY = 0.3   # 유사 검색 최소 유사도 (트라이그램 Jaccard)
+
+
+def _trigrams(text: str) -> List[str]:
+    """문자열의 트라이그램 목록 (중복 제거, 양끝 패딩 포함)"""
+    padded = f"  {text} "
+    return sorted({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+class BadmannerIndex:
+    """비매너 리스트 검색 인덱스 (리스트 위치 기반)"""
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+        self.ids = [entry.get("user_id", "").lower() for entry in entries]
+        self.by_id: Dict[str, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self._sorted: Dict[str, List[int]] = {}
+
+        for pos, user_id in enumerate(self.ids):
+            self.by_id.setdefault(user_id, pos)
+            for gram in _trigrams(user_id):
+                self.postings.setdefault(gram, []).append(pos)
+
+    # -------------------------------------------------------------------------
+    # 직렬화
+    # -------------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """저장용 dict (엔트리 본문은 리스트 파일에 있으므로 제외)"""
+        return {
+            "ids": self.ids,
+            "postings": self.postings
+        }
+
+    @classmethod
+    def from_dict(cls, entries: List[Dict[str, Any]], data: Dict[str, Any]) -> Optional["BadmannerIndex"]:
+        """저장된 인덱스 복원 (리스트와 맞지 않으면 None)"""
+        ids = data.get("ids")
+        postings = data.get("postings")
+        if not isinstance(ids, list) or not isinstance(postings, dict) or len(ids) != len(entries):
+            return None
+
+        index = cls.__new__(cls)
+        index.entries = entries
+        index.ids = ids
+        index.by_id = {}
+        for pos, user_id in enumerate(ids):
+            index.by_id.setdefault(user_id, pos)
+        index.postings = postings
+        index._sorted = {}
+        return index
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 엔트리 조회 (대소문자 무시)"""
+        pos = self.by_id.get(user_id.lower())
+        return None if pos is None else self.entries[pos]
+
+    def contains(self, user_id: str) -> bool:
+        """등록 여부"""
+        return user_id.lower() in self.by_id
+
+    def position(self, user_id: str) -> Optional[int]:
+        """리스트 내 위치"""
+        return self.by_id.get(user_id.lower())
+
+    def sorted_positions(self, order: str = "recent") -> List[int]:
+        """
+        정렬된 리스트 위치 (정렬 순서별로 한 번만 계산)
+
+        order: "recent" 최근 등록순 / "name" 이름순 / "oldest" 등록순
+        """
+        if order not in self._sorted:
+            positions = list(range(len(self.entries)))
+            if order == "name":
+                positions.sort(key=lambda pos: self.ids[pos])
+            elif order == "recent":
+                # added_date가 같으면 나중에 추가된 항목이 먼저
+                positions.sort(key=lambda pos: (self.entries[pos].get("added_date", ""), pos), reverse=True)
+            self._sorted[order] = positions
+        return self._sorted[order]
+
+    def page(self, page: int, page_size: int, order: str = "recent",
+             query: str = "") -> Tuple[List[Dict[str, Any]], int]:
+        """
+        페이지 조회 (필터가 있으면 검색 점수순)
+
+        Returns:
+            (해당 페이지 엔트리 목록, 전체 결과 수)
+        """
+        if query.strip():
+            matched = [entry for entry, _ in self.search(query, limit=len(self.entries))]
+            total = len(matched)
+            start = (page - 1) * page_size
+            return matched[start:start + page_size], total
+
+        positions = self.sorted_positions(order)
+        start = (page - 1) * page_size
+        return [self.entries[pos] for pos in positions[start:start + page_size]], len(positions)
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        부분 문자열 + 유사 검색 (점수 내림차순)
+
+        점수: 정확히 일치 3.0 > 접두사 2.x > 부분 문자열 1.x > 유사 (0~1, 트라이그램 Jaccard)
+        같은 등급 안에서는 쿼리가 차지하는 비율이 클수록(짧은 ID일수록) 높음
+
+        Returns:
+            [(엔트리, 점수), ...]
+        """
+        query = query.strip().lower()
+        if not query or not self.ids:
+            return []
+
+        query_grams = _trigrams(query)
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for pos in self.postings.get(gram, ()):
+                shared[pos] = shared.get(pos, 0) + 1
+
+        # 짧은 쿼리는 패딩 트라이그램만으로 후보가 누락될 수 있으므로 전체 ID 대상
+        candidates = range(len(self.ids)) if len(query) < 3 else shared.keys()
+
+        scored: List[Tuple[int, float]] = []
+        for pos in candidates:
+            user_id = self.ids[pos]
+            coverage = len(query) / max(len(user_id), 1)
+
+            if user_id == query:
+                score = 3.0
+            elif user_id.startswith(query):
+                score = 2.0 + coverage
+            elif query in user_id:
+                score = 1.0 + coverage
+            elif fuzzy and pos in shared:
+                union = len(query_grams) + len(_trigrams(user_id)) - shared[pos]
+                score = shared[pos] / union if union else 0.0
+                if score < FUZZY_MIN_SIMILARITY:
+                    continue
+            else:
+                continue
+
+            scored.append((pos, score))
+
+        scored.sort(key=lambda item: (-item[1], self.ids[item[0]]))
+        return [(self.entries[pos], round(score, 3)) for pos, score in scored[:limit]]
+
+
+class SubstringIndex:
+    """ID 목록 부분 문자열 필터 (트라이그램 역색인, 결과는 목록 순서)"""
+
+    def __init__(self, ids: List[str]):
+        self.ids = [user_id.lower() for user_id in ids]
+        self.postings: Dict[str, List[int]] = {}
+
+        for pos, user_id in enumerate(self.ids):
+            for gram in {user_id[i:i + 3] for i in range(len(user_id) - 2)}:
+                self.postings.setdefault(gram, []).append(pos)
+
+    def find(self, query: str) -> List[int]:
+        """
+        쿼리를 부분 문자열로 포함하는 ID의 위치 (오름차순)
+
+        쿼리의 트라이그램 중 가장 짧은 포스팅 목록만 확인 → 후보 수에 비례
+        (3글자 미만 쿼리는 트라이그램이 없으므로 전체 확인)
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(range(len(self.ids)))
+        if len(query) < 3:
+            return [pos for pos, user_id in enumerate(self.ids) if query in user_id]
+
+        grams = {query[i:i + 3] for i in range(len(query) - 2)}
+        candidates = min((self.postings.get(gram, []) for gram in grams), key=len)
+        return [pos for pos in candidates if query in self.ids[pos]]
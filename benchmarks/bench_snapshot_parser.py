@@ -0,0 +1,63 @@
+"""
+오프라인 스냅샷 파서 벤치마크 (tests/fixtures/replay_page.html 기반)
+
+픽스처 페이지를 임시 디렉토리에 N개 복제한 뒤 parse_snapshot_files로 일괄 파싱하여
+- 페이지당 파싱 시간
+- 초당 매치 행 수
+를 출력합니다.
+
+사용법:
+    python benchmarks/bench_snapshot_parser.py [--pages 200] [--repeat 3]
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# 저장소 루트 (app.py가 있는 디렉토리)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE = os.path.join(REPO_ROOT, "tests", "fixtures", "replay_page.html")
+
+sys.path.insert(0, REPO_ROOT)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="오프라인 스냅샷 파서 벤치마크")
+    parser.add_argument("--pages", type=int, default=200, help="파싱할 스냅샷 파일 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 출력)")
+    args = parser.parse_args()
+
+    from snapshot_parser import LXML_AVAILABLE, find_snapshot_files, parse_snapshot_files
+
+    if not LXML_AVAILABLE:
+        print("❌ lxml이 설치되어 있지 않습니다. (pip install lxml)")
+        return 1
+
+    workdir = tempfile.mkdtemp(prefix="snapshot_bench_")
+    try:
+        for i in range(args.pages):
+            shutil.copyfile(FIXTURE, os.path.join(workdir, f"page_{i:05d}.html"))
+        paths = find_snapshot_files(workdir)
+
+        best = float("inf")
+        result = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = parse_snapshot_files(paths)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    rows = len(result["matches"])
+    print(f"파일: {result['files']}개 (실패 {len(result['failed'])}개), 매치 행: {rows}개")
+    print(f"전체: {best * 1000:.1f} ms, 페이지당: {best / max(len(paths), 1) * 1000:.3f} ms, "
+          f"초당 행: {rows / best:,.0f}")
+
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
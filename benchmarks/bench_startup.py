@@ -0,0 +1,113 @@
+"""
+콜드 스타트 임포트 시간 벤치마크 (python -X importtime 기반)
+
+앱 모듈을 새 인터프리터에서 임포트하여
+- 모듈별 누적 임포트 시간 (상위 N개)
+- 시작 시 로드되면 안 되는 무거운 의존성(PIL, selenium 등) 로드 여부
+를 출력합니다.
+
+사용법:
+    python benchmarks/bench_startup.py [--top 15] [--budget-ms 0]
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+from typing import List, Tuple
+
+# 저장소 루트 (app.py가 있는 디렉토리)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 앱 시작 시 임포트되는 모듈 (app.py 상단과 동일)
+STARTUP_MODULES = [
+    "config",
+    "data_manager",
+    "ranking",
+    "quadrant_1_winrate",
+    "quadrant_2_ranking",
+    "quadrant_3_badmanner",
+    "quadrant_4_tbd",
+    "crawler",
+    "snapshot_parser",
+]
+
+# 첫 사용 시점까지 로드되면 안 되는 무거운 의존성
+LAZY_MODULES = [
+    "PIL",
+    "selenium",
+    "selenium_stealth",
+    "webdriver_manager",
+    "lxml",
+    "numpy",
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_importtime(modules: List[str]) -> Tuple[List[Tuple[str, int, int, int]], str]:
+    """
+    새 인터프리터에서 모듈 임포트 후 -X importtime 출력 파싱
+
+    Returns:
+        ([(모듈명, self_us, cumulative_us, 깊이), ...], stderr 원문)
+    """
+    code = "import " + ", ".join(modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if m:
+            depth = (len(m.group(3)) - 1) // 2
+            entries.append((m.group(4), int(m.group(1)), int(m.group(2)), depth))
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"임포트 실패:\n{proc.stderr[-2000:]}")
+
+    return entries, proc.stderr
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="콜드 스타트 임포트 시간 벤치마크")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    parser.add_argument("--budget-ms", type=float, default=0,
+                        help="전체 임포트 시간 상한 (0이면 검사 안 함)")
+    args = parser.parse_args()
+
+    entries, _ = run_importtime(STARTUP_MODULES)
+
+    # 최상위 임포트의 누적 시간 합 = 전체 콜드 스타트 임포트 시간 (중첩 중복 제외)
+    app_total_us = sum(cum for _, _, cum, depth in entries if depth == 0)
+    loaded = {name.split(".")[0] for name, _, _, _ in entries}
+    eager_heavy = [name for name in LAZY_MODULES if name in loaded]
+
+    print(f"{'module':<45} {'self(ms)':>10} {'cumulative(ms)':>15}")
+    print("-" * 72)
+    for name, self_us, cum_us, _ in sorted(entries, key=lambda e: -e[2])[:args.top]:
+        print(f"{name:<45} {self_us / 1000:>10.1f} {cum_us / 1000:>15.1f}")
+    print("-" * 72)
+    print(f"전체 임포트 시간: {app_total_us / 1000:.1f} ms")
+
+    failed = False
+    if eager_heavy:
+        print(f"❌ 시작 시 로드된 무거운 의존성: {', '.join(eager_heavy)}")
+        failed = True
+    else:
+        print("✅ 무거운 의존성은 첫 사용 시점까지 로드되지 않습니다.")
+
+    if args.budget_ms and app_total_us / 1000 > args.budget_ms:
+        print(f"❌ 예산 초과: {app_total_us / 1000:.1f} ms > {args.budget_ms:.1f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Bradley-Terry 랭킹 엔진 (일괄 적합)
+- 플레이어 쌍별 누적 라운드 승수로 강도(strength) 추정 → 매치 순서와 무관
+- 쌍 목록을 희소 배열(COO: a, b, a 승수, b 승수)로 두고 Newton 반복을 NumPy로 벡터화
+- 가상 상대(강도 1)와의 무승부 라운드를 prior로 더해 전승/전패 플레이어도 유한한 값으로 수렴
+- 결과는 Elo 척도(400 * log10)로 변환해 기존 랭킹과 같은 형식으로 사용
+"""
+
+from typing import List, Dict, Tuple, Sequence, Any
+
+BT_PRIOR_ROUNDS = 1.0    # 가상 상대와의 승/패 라운드 수 (정규화 강도)
+BT_MAX_ITER = 50         # 최대 Newton 반복 횟수
+BT_CG_ITER = 200         # Newton 1회당 최대 켤레기울기(CG) 반복 횟수
+BT_TOLERANCE = 1e-8      # 수렴 기준 (log 강도 최대 변화량)
+BT_MAX_STEP = 2.0        # Newton 1회당 log 강도 최대 변화량 (초기 발산 방지)
+
+
+def fit_strengths(
+    num_players: int,
+    pair_a: Sequence[int],
+    pair_b: Sequence[int],
+    wins_a: Sequence[float],
+    wins_b: Sequence[float],
+    prior: float = BT_PRIOR_ROUNDS,
+    max_iter: int = BT_MAX_ITER,
+    tol: float = BT_TOLERANCE
+) -> Tuple[Any, int]:
+    """
+    Bradley-Terry 강도 추정 (log 강도에 대한 Newton 법)
+
+    - 헤시안은 쌍 가중치 n_ab·q(1-q)의 그래프 라플라시안 + prior 대각 성분
+    - 헤시안을 만들지 않고 쌍 배열 위의 bincount로 곱만 계산 (희소, O(쌍 수))
+    - Newton 방향은 대각 전처리 켤레기울기(CG)로 풂
+
+    Args:
+        num_players: 플레이어 수 (인덱스 0..n-1)
+        pair_a, pair_b: 쌍별 플레이어 인덱스 (쌍마다 한 번씩)
+        wins_a, wins_b: 쌍별 각 플레이어의 라운드 승수
+        prior: 가상 상대와의 승/패 라운드 수
+        max_iter, tol: 반복 종료 조건
+
+    Returns:
+        (강도 ndarray (기하평균 1로 정규화), Newton 반복 횟수)
+    """
+    import numpy as np
+
+    a = np.asarray(pair_a, dtype=np.int64)
+    b = np.asarray(pair_b, dtype=np.int64)
+    wa = np.asarray(wins_a, dtype=np.float64)
+    wb = np.asarray(wins_b, dtype=np.float64)
+    rounds = wa + wb
+
+    total_wins = (
+        np.bincount(a, weights=wa, minlength=num_players)
+        + np.bincount(b, weights=wb, minlength=num_players)
+        + prior
+    )
+
+    theta = np.zeros(num_players, dtype=np.float64)
+    iterations = 0
+
+    for iterations in range(1, max_iter + 1):
+        # 쌍별 승리 확률 q = σ(θa - θb), 가상 상대(θ=0) 상대 승리 확률 r = σ(θ)
+        q = 1 / (1 + np.exp(theta[b] - theta[a]))
+        r = 1 / (1 + np.exp(-theta))
+
+        expected = (
+            np.bincount(a, weights=rounds * q, minlength=num_players)
+            + np.bincount(b, weights=rounds * (1 - q), minlength=num_players)
+            + 2 * prior * r
+        )
+        grad = total_wins - expected
+
+        pair_weight = rounds * q * (1 - q)
+        diag = (
+            np.bincount(a, weights=pair_weight, minlength=num_players)
+            + np.bincount(b, weights=pair_weight, minlength=num_players)
+            + 2 * prior * r * (1 - r)
+        )
+
+        def hess_mul(v):
+            return (
+                diag * v
+                - np.bincount(a, weights=pair_weight * v[b], minlength=num_players)
+                - np.bincount(b, weights=pair_weight * v[a], minlength=num_players)
+            )
+
+        step = _conjugate_gradient(hess_mul, grad, diag)
+
+        largest = np.max(np.abs(step), initial=0.0)
+        if largest > BT_MAX_STEP:
+            step *= BT_MAX_STEP / largest
+        theta += step
+
+        if largest < tol:
+            break
+
+    theta -= theta.mean()
+    return np.exp(theta), iterations
+
+
+def _conjugate_gradient(mul, rhs, diag, max_iter: int = BT_CG_ITER, rtol: float = 1e-10):
+    """대각 전처리 켤레기울기법으로 A x = rhs 풀이 (A는 곱 함수로만 주어짐, 대칭 양정치)"""
+    import numpy as np
+
+    x = np.zeros_like(rhs)
+    residual = rhs.copy()
+    precond = 1 / diag
+    z = precond * residual
+    direction = z.copy()
+    rz = residual @ z
+    threshold = rtol * (rhs @ rhs)
+
+    for _ in range(max_iter):
+        if residual @ residual <= threshold:
+            break
+        a_dir = mul(direction)
+        alpha = rz / (direction @ a_dir)
+        x += alpha * direction
+        residual -= alpha * a_dir
+        z = precond * residual
+        rz_next = residual @ z
+        direction = z + (rz_next / rz) * direction
+        rz = rz_next
+
+    return x
+
+
+def fit_ratings(
+    tallies: Dict[Tuple[str, str], List[int]],
+    base_rating: float = 1200,
+    prior: float = BT_PRIOR_ROUNDS
+) -> Dict[str, float]:
+    """
+    쌍별 라운드 집계로 Bradley-Terry Rating 계산 (Elo 척도)
+
+    Args:
+        tallies: {(a, b): [a 라운드 승, b 라운드 승, ...]}
+        base_rating: 평균 강도 플레이어의 Rating
+
+    Returns:
+        {플레이어 ID: Rating}
+    """
+    import numpy as np
+
+    players = sorted({player for pair in tallies for player in pair})
+    if not players:
+        return {}
+
+    index = {player: idx for idx, player in enumerate(players)}
+    pair_a = [index[a] for a, _ in tallies]
+    pair_b = [index[b] for _, b in tallies]
+    wins_a = [tally[0] for tally in tallies.values()]
+    wins_b = [tally[1] for tally in tallies.values()]
+
+    strengths, _ = fit_strengths(len(players), pair_a, pair_b, wins_a, wins_b, prior)
+    ratings = base_rating + 400 * np.log10(strengths)
+
+    return {player: round(float(rating), 1) for player, rating in zip(players, ratings)}
@@ -18,6 +18,8 @@ API_BASE_URL = "https://www.fightcade.com/api"
 MAX_PAGES_TO_CRAWL = 5  # 최대 크롤링 페이지 수
 ROWS_PER_PAGE = 15      # 페이지당 라인 수
 CRAWL_TIMEOUT = 30000   # 타임아웃 (ms)
+CRAWL_CACHE_TTL = 3600  # 크롤링 캐시 유효 시간 (초)
+CRAWL_CACHE_MIN_ANCHOR_ROWS = 5  # 조기 중단 기준(캐시 최신 행 묶음)에 필요한 최소 행 수
 
 # =============================================================================
 # XPath 설정 (견고성을 위해 CSS Selector도 병행 사용 권장)
@@ -50,6 +52,7 @@ DATA_DIR = "data"
 USER_LIST_FILE = f"{DATA_DIR}/user_list.json"
 MATCH_HISTORY_FILE = f"{DATA_DIR}/match_history.json"
 RANKING_FILE = f"{DATA_DIR}/ranking.json"
+CRAWL_CACHE_FILE = f"{DATA_DIR}/crawl_cache.json"
 
 # =============================================================================
 # UI 설정
@@ -5,39 +5,33 @@
 """
 
 import time
-from typing import List, Dict, Any, Optional
+import importlib.util
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+# selenium 계열은 브라우저를 실제로 띄울 때 임포트 (앱 콜드 스타트 단축)
+if TYPE_CHECKING:
+    from selenium import webdriver
 
-try:
-    from selenium_stealth import stealth
-    STEALTH_AVAILABLE = True
-except ImportError:
-    STEALTH_AVAILABLE = False
+STEALTH_AVAILABLE = importlib.util.find_spec("selenium_stealth") is not None
+WEBDRIVER_MANAGER_AVAILABLE = importlib.util.find_spec("webdriver_manager") is not None
 
-try:
-    from webdriver_manager.chrome import ChromeDriverManager
-    from webdriver_manager.core.os_manager import ChromeType
-    WEBDRIVER_MANAGER_AVAILABLE = True
-except ImportError:
-    WEBDRIVER_MANAGER_AVAILABLE = False
-
-from config import MAX_PAGES_TO_CRAWL, ROWS_PER_PAGE, XPATH
+from config import (
+    MAX_PAGES_TO_CRAWL, ROWS_PER_PAGE, XPATH,
+    CRAWL_CACHE_FILE, CRAWL_CACHE_TTL, CRAWL_CACHE_MIN_ANCHOR_ROWS
+)
+from data_manager import load_data_file, save_data_file
 
 
 # =============================================================================
 # 브라우저 설정 (Stealth 모드)
 # =============================================================================
 
-def _create_stealth_driver() -> webdriver.Chrome:
+def _create_stealth_driver() -> "webdriver.Chrome":
     """Selenium Stealth 드라이버 생성"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    
     options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
@@ -56,6 +50,8 @@ def _create_stealth_driver() -> webdriver.Chrome:
     
     try:
         if WEBDRIVER_MANAGER_AVAILABLE:
+            from webdriver_manager.chrome import ChromeDriverManager
+            from webdriver_manager.core.os_manager import ChromeType
             try:
                 service = Service(ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install())
                 driver = webdriver.Chrome(service=service, options=options)
@@ -69,6 +65,7 @@ def _create_stealth_driver() -> webdriver.Chrome:
         driver = webdriver.Chrome(options=options)
     
     if STEALTH_AVAILABLE and driver:
+        from selenium_stealth import stealth
         stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -91,8 +88,11 @@ def _create_stealth_driver() -> webdriver.Chrome:
 # 헬퍼 함수
 # =============================================================================
 
-def _safe_get_text(driver: webdriver.Chrome, xpath: str) -> Optional[str]:
+def _safe_get_text(driver: "webdriver.Chrome", xpath: str) -> Optional[str]:
     """XPath로 텍스트 안전하게 가져오기"""
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+    
     try:
         element = driver.find_element(By.XPATH, xpath)
         return element.text.strip()
@@ -102,8 +102,12 @@ def _safe_get_text(driver: webdriver.Chrome, xpath: str) -> Optional[str]:
         return None
 
 
-def _safe_click(driver: webdriver.Chrome, xpath: str, timeout: int = 10) -> bool:
+def _safe_click(driver: "webdriver.Chrome", xpath: str, timeout: int = 10) -> bool:
     """XPath 요소 안전하게 클릭"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    
     try:
         wait = WebDriverWait(driver, timeout)
         element = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
@@ -113,8 +117,13 @@ def _safe_click(driver: webdriver.Chrome, xpath: str, timeout: int = 10) -> bool
         return False
 
 
-def _wait_for_element(driver: webdriver.Chrome, xpath: str, timeout: int = 10) -> bool:
+def _wait_for_element(driver: "webdriver.Chrome", xpath: str, timeout: int = 10) -> bool:
     """요소 대기"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    
     try:
         wait = WebDriverWait(driver, timeout)
         wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
@@ -127,7 +136,7 @@ def _wait_for_element(driver: webdriver.Chrome, xpath: str, timeout: int = 10) -
 # 페이지 크롤링
 # =============================================================================
 
-def _parse_match_row(driver: webdriver.Chrome, row_idx: int) -> Optional[Dict[str, Any]]:
+def _parse_match_row(driver: "webdriver.Chrome", row_idx: int) -> Optional[Dict[str, Any]]:
     """단일 행에서 매치 데이터 추출"""
     try:
         # XPath 템플릿에 행 인덱스 적용
@@ -160,7 +169,7 @@ def _parse_match_row(driver: webdriver.Chrome, row_idx: int) -> Optional[Dict[st
         return None
 
 
-def _parse_current_page(driver: webdriver.Chrome, user_a: str, user_b: str) -> List[Dict[str, Any]]:
+def _parse_current_page(driver: "webdriver.Chrome", user_a: str, user_b: str) -> List[Dict[str, Any]]:
     """현재 페이지의 매치 데이터 파싱"""
     matches = []
     
@@ -178,14 +187,151 @@ def _parse_current_page(driver: webdriver.Chrome, user_a: str, user_b: str) -> L
     return matches
 
 
+# =============================================================================
+# 크롤링 캐시 (유저 쌍별 TTL + 증분 크롤링)
+# =============================================================================
+
+def _pair_cache_key(user_a: str, user_b: str) -> str:
+    """유저 쌍 캐시 키 (순서 무관)"""
+    players = sorted([user_a.lower(), user_b.lower()])
+    return f"{players[0]}|{players[1]}"
+
+
+def _match_signature(match: Dict[str, Any]) -> Tuple[str, str, int, int]:
+    """매치 행 식별용 시그니처"""
+    return (
+        match["id1"].lower(),
+        match["id2"].lower(),
+        match["score1"],
+        match["score2"]
+    )
+
+
+def _load_crawl_cache() -> Dict[str, Dict[str, Any]]:
+    """크롤링 캐시 로드"""
+    data = load_data_file(CRAWL_CACHE_FILE)
+    if data is None or not isinstance(data, dict):
+        return {}
+    return data
+
+
+def get_cached_crawl(user_a: str, user_b: str) -> Optional[Dict[str, Any]]:
+    """
+    유저 쌍의 캐시 항목 조회
+
+    Returns:
+        {"crawled_at": float, "matches": [...]} (최신 매치가 앞) 또는 None
+    """
+    entry = _load_crawl_cache().get(_pair_cache_key(user_a, user_b))
+    if not isinstance(entry, dict) or not isinstance(entry.get("matches"), list):
+        return None
+    return entry
+
+
+def _save_crawl_cache_entry(user_a: str, user_b: str, matches: List[Dict[str, Any]]) -> bool:
+    """유저 쌍의 크롤링 결과를 캐시에 저장"""
+    cache = _load_crawl_cache()
+    cache[_pair_cache_key(user_a, user_b)] = {
+        "crawled_at": time.time(),
+        "matches": matches
+    }
+    return save_data_file(CRAWL_CACHE_FILE, cache)
+
+
+def clear_crawl_cache() -> bool:
+    """크롤링 캐시 초기화"""
+    return save_data_file(CRAWL_CACHE_FILE, {})
+
+
+def _find_known_anchor(matches: List[Dict[str, Any]], cached: List[Dict[str, Any]]) -> Optional[int]:
+    """
+    새로 크롤링한 매치 목록에서 캐시의 최신 행 묶음(기준 행)이 연속으로 나타나는 시작 위치 찾기
+
+    행에는 날짜/리플레이 ID가 없고 한 쌍의 스코어는 몇 가지 값뿐이라 최신 몇 행만으로는
+    우연히 일치할 수 있음 → 캐시 앞쪽 최대 한 페이지 분량(ROWS_PER_PAGE)이 통째로 일치해야 하고,
+    그 분량이 CRAWL_CACHE_MIN_ANCHOR_ROWS보다 적으면 판단하지 않음
+    (캐시가 병합으로 크롤링 범위보다 길어져도 기준 행 수는 일정 → 조기 중단 유지)
+    """
+    anchor_rows = min(len(cached), ROWS_PER_PAGE)
+    if anchor_rows < CRAWL_CACHE_MIN_ANCHOR_ROWS:
+        return None
+
+    anchor = [_match_signature(m) for m in cached[:anchor_rows]]
+    signatures = [_match_signature(m) for m in matches]
+    for start in range(len(signatures) - len(anchor) + 1):
+        if signatures[start:start + len(anchor)] == anchor:
+            return start
+    return None
+
+
+def _cache_overlap(matches: List[Dict[str, Any]], cached: List[Dict[str, Any]]) -> int:
+    """크롤링 목록의 끝부분과 캐시 목록의 앞부분이 겹치는 최대 길이"""
+    signatures = [_match_signature(m) for m in matches]
+    anchor = [_match_signature(m) for m in cached]
+    for size in range(min(len(signatures), len(anchor)), 0, -1):
+        if signatures[-size:] == anchor[:size]:
+            return size
+    return 0
+
+
+def _merge_with_cache(
+    matches: List[Dict[str, Any]],
+    cached: List[Dict[str, Any]],
+    complete: bool
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    크롤링 결과와 캐시 병합
+
+    Args:
+        matches: 이번에 크롤링한 매치 (최신이 앞)
+        cached: 캐시된 매치 (최신이 앞)
+        complete: 마지막 페이지까지 읽었는지 (max_pages에서 끊기지 않음)
+
+    Returns:
+        (병합된 매치 목록, 새 매치 수)
+    """
+    known_idx = _find_known_anchor(matches, cached)
+    if known_idx is not None:
+        # 캐시 기준 행 앞부분만 새 매치, 이후는 캐시 (크롤링 범위보다 오래된 캐시 매치도 유지)
+        return matches[:known_idx] + cached, known_idx
+    if complete or not cached:
+        # 끝까지 읽었으면 크롤링 결과가 전체 기록
+        return matches, max(len(matches) - len(cached), 0)
+
+    # 페이지 제한으로 끊김 → 겹치는 구간 이후의 캐시(더 오래된 매치)를 뒤에 이어붙임
+    overlap = _cache_overlap(matches, cached)
+    return matches + cached[overlap:], len(matches) - overlap
+
+
+def _summarize_matches(matches: List[Dict[str, Any]], user_a: str, user_b: str) -> Dict[str, Any]:
+    """매치 목록 집계"""
+    user_a_wins = sum(1 for m in matches if m["winner"].lower() == user_a.lower())
+    user_b_wins = sum(1 for m in matches if m["winner"].lower() == user_b.lower())
+    return {
+        "total_matches": len(matches),
+        "user_a_wins": user_a_wins,
+        "user_b_wins": user_b_wins,
+        "user_a_id": user_a,
+        "user_b_id": user_b
+    }
+
+
 # =============================================================================
 # 메인 크롤링 함수
 # =============================================================================
 
 def crawl_head_to_head_sync(user_a: str, user_b: str, 
                             max_pages: int = MAX_PAGES_TO_CRAWL,
-                            progress_callback=None) -> Dict[str, Any]:
-    """두 유저 간의 대전 기록 조회 (직접 페이지 크롤링)"""
+                            progress_callback=None,
+                            use_cache: bool = True,
+                            cache_ttl: int = CRAWL_CACHE_TTL) -> Dict[str, Any]:
+    """
+    두 유저 간의 대전 기록 조회 (직접 페이지 크롤링)
+
+    - TTL 이내에 크롤링한 쌍이면 캐시 결과를 바로 반환
+    - TTL이 지났으면 캐시의 최신 행 묶음(최대 한 페이지)이 이어서 나타나는 즉시 페이지 이동을 멈춤
+    - 페이지 제한으로 끝까지 읽지 못하면 더 오래된 캐시 매치를 뒤에 병합 (버리지 않음)
+    """
     
     result = {
         "success": False,
@@ -198,13 +344,30 @@ def crawl_head_to_head_sync(user_a: str, user_b: str,
             "user_b_id": user_b
         },
         "error": None,
-        "debug": []
+        "debug": [],
+        "cache": "miss",
+        "new_matches": 0
     }
     
     def log(msg):
         if progress_callback:
             progress_callback(msg)
     
+    cached = get_cached_crawl(user_a, user_b) if use_cache else None
+    cached_matches: List[Dict[str, Any]] = cached["matches"] if cached else []
+    
+    if cached and time.time() - cached.get("crawled_at", 0) < cache_ttl:
+        log("⚡ 캐시된 결과를 사용합니다.")
+        result["success"] = True
+        result["cache"] = "hit"
+        result["matches"] = cached_matches
+        result["summary"] = _summarize_matches(cached_matches, user_a, user_b)
+        if not cached_matches:
+            result["error"] = f"'{user_a}'와 '{user_b}' 간의 대전 기록이 없습니다."
+        return result
+    
+    complete = False
+    
     driver = None
     
     try:
@@ -253,6 +416,11 @@ def crawl_head_to_head_sync(user_a: str, user_b: str,
         # 3. 검색창에 상대방 ID 입력
         log(f"🔍 {user_b} 검색 중...")
         
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
             wait = WebDriverWait(driver, 10)
             search_input = wait.until(
@@ -296,38 +464,46 @@ def crawl_head_to_head_sync(user_a: str, user_b: str,
                 
                 if page_num == 1:
                     log("⚠️ 첫 페이지에 데이터가 없습니다.")
+                complete = True
                 break
             
             all_matches.extend(page_matches)
             log(f"   → {len(page_matches)}개 매치 발견 (누적: {len(all_matches)}개)")
             
+            # 캐시의 최신 행 묶음이 나타나면 이후 페이지는 이미 알고 있는 데이터
+            if _find_known_anchor(all_matches, cached_matches) is not None:
+                log("   → 이전에 크롤링한 매치에 도달했습니다.")
+                break
+            
             # 다음 페이지로 이동
             if page_num < max_pages:
                 if not _safe_click(driver, XPATH["next_page"], timeout=5):
                     log(f"   → 마지막 페이지입니다.")
+                    complete = True
                     break
                 time.sleep(2)
         
+        # 캐시 병합 (델타만 앞에 추가되거나, 끊긴 크롤링 뒤에 오래된 캐시 매치 보존)
+        if cached_matches:
+            result["cache"] = "delta"
+        all_matches, result["new_matches"] = _merge_with_cache(all_matches, cached_matches, complete)
+        
+        if use_cache:
+            _save_crawl_cache_entry(user_a, user_b, all_matches)
+        
         # 결과 집계
         if not all_matches:
             result["error"] = f"'{user_a}'와 '{user_b}' 간의 대전 기록이 없습니다."
             result["success"] = True
             return result
         
-        user_a_wins = sum(1 for m in all_matches if m["winner"].lower() == user_a.lower())
-        user_b_wins = sum(1 for m in all_matches if m["winner"].lower() == user_b.lower())
+        summary = _summarize_matches(all_matches, user_a, user_b)
         
         result["success"] = True
         result["matches"] = all_matches
-        result["summary"] = {
-            "total_matches": len(all_matches),
-            "user_a_wins": user_a_wins,
-            "user_b_wins": user_b_wins,
-            "user_a_id": user_a,
-            "user_b_id": user_b
-        }
+        result["summary"] = summary
         
-        log(f"✅ 완료! 총 {len(all_matches)}경기, {user_a}: {user_a_wins}승, {user_b}: {user_b_wins}승")
+        log(f"✅ 완료! 총 {len(all_matches)}경기, {user_a}: {summary['user_a_wins']}승, {user_b}: {summary['user_b_wins']}승")
         
     except Exception as e:
         result["error"] = f"오류: {str(e)}"
@@ -5,10 +5,31 @@
 - 중복 제거 (날짜 + 유저ID 기반)
 """
 
-import json
+import io
 import os
-from typing import List, Dict, Any, Optional, Set, Tuple
-from datetime import datetime
+import re
+import math
+import bisect
+import gzip
+import json
+import time
+import atexit
+import threading
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterable, Callable
+from datetime import datetime, date, timedelta
+
+from badmanner_index import BadmannerIndex
+from leaderboard import Leaderboard
+from h2h_matrix import HeadToHeadMatrix
+from game_stats import GameStats
+from win_trends import WinTrends
+from window_leaderboard import DailyBuckets
+from streaks import StreakTracker, FORM_LENGTH
+from match_feed import MatchFeed
+from activity_heatmap import ActivityHeatmap
+import bradley_terry
+import glicko2
+import rating_history
 
 # =============================================================================
 # 파일 경로 설정
@@ -17,6 +38,12 @@ DATA_DIR = "data"
 MATCH_HISTORY_FILE = f"{DATA_DIR}/match_history.json"
 BADMANNER_FILE = f"{DATA_DIR}/badmanner_list.json"
 PLAYER_RATINGS_FILE = f"{DATA_DIR}/player_ratings.json"
+GAME_RATINGS_FILE = f"{DATA_DIR}/game_ratings.json"
+BADMANNER_INDEX_FILE = f"{DATA_DIR}/badmanner_index.json"
+GAME_STATS_FILE = f"{DATA_DIR}/game_stats.json"
+
+# 백업 설정
+BACKUP_COMPRESS_THRESHOLD = 2000   # 매치 수가 이 이상이면 gzip 압축 백업
 
 # =============================================================================
 # 랭킹 설정
@@ -26,6 +53,38 @@ DEFAULT_RD = 350            # 초기 Rating Deviation (신뢰도)
 K_FACTOR = 32               # Elo K값
 MIN_GAMES_FOR_RANKING = 9   # 랭킹 반영 최소 판수
 
+# 랭킹 엔진
+ENGINE_ELO = "elo"                      # 매치 순서대로 누적 갱신 (player_ratings.json)
+ENGINE_BRADLEY_TERRY = "bradley_terry"  # 쌍별 라운드 집계 일괄 적합
+ENGINE_GLICKO2 = "glicko2"              # 레이팅 기간 단위 일괄 갱신
+
+# 기간 랭킹 (최근 N일 / 시즌)
+LEADERBOARD_WINDOWS = {"7d": 7, "30d": 30}   # 윈도우 키 → 일수 (오늘 포함)
+WINDOW_MIN_GAMES = 3                          # 기간 랭킹 반영 최소 판수
+
+GLICKO2_PERIOD_DAYS = 7         # Glicko-2 레이팅 기간 (일)
+GLICKO2_PROVISIONAL_RD = 110    # RD가 이보다 크면 잠정 Rating으로 보고 랭킹에서 제외
+GLICKO2_UNDATED_PERIOD_MATCHES = 50   # 날짜를 하나도 파싱 못 하면 수집 순서로 이 매치 수마다 기간 구분
+
+# 매치업 예측: Rating이 학습된 매치의 대표 세트 길이 (히스토리 최빈값 FT3)
+# Elo 기대 승률 = 이 길이의 세트 승률로 보고 라운드 승률을 역산
+RATED_FIRST_TO = 3
+
+# 마진 가중치: 스코어 차이 → (긴 경기(승자 3점 이상) 가중치, 짧은 경기 가중치)
+# 차이 3 이상은 3으로 취급, 무승부는 1.0
+MARGIN_MULTIPLIERS: Dict[int, Tuple[float, float]] = {
+    3: (1.5, 1.5),
+    2: (1.3, 1.25),
+    1: (1.0, 1.1),
+}
+
+# 매치 히스토리/Rating 파일 쓰기 직렬화 (백그라운드 저장 워커와 UI 스레드 공용)
+_history_lock = threading.RLock()
+
+# 비매너 리스트 쓰기 직렬화 + 인덱스 메모리 캐시 (리스트 파일 버전 기준)
+_badmanner_lock = threading.RLock()
+_badmanner_index_cache: Dict[str, Any] = {"version": None, "index": None}
+
 
 # =============================================================================
 # 초기화
@@ -47,17 +106,30 @@ def _load_json(filepath: str) -> Any:
         return None
 
 
-def _save_json(filepath: str, data: Any) -> bool:
-    """JSON 파일 저장"""
+def _save_json(filepath: str, data: Any, compact: bool = False) -> bool:
+    """JSON 파일 저장 (compact=True면 들여쓰기/공백 없이 - 사람이 볼 일 없는 캐시 파일용)"""
     try:
         init_data_directory()
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            if compact:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         return True
     except IOError:
         return False
 
 
+def load_data_file(filepath: str) -> Any:
+    """데이터 파일(JSON) 로드 - 다른 모듈의 캐시 파일용 (없거나 깨졌으면 None)"""
+    return _load_json(filepath)
+
+
+def save_data_file(filepath: str, data: Any) -> bool:
+    """데이터 파일(JSON) 저장 - 다른 모듈의 캐시 파일용"""
+    return _save_json(filepath, data)
+
+
 # =============================================================================
 # 매치 히스토리 관리
 # =============================================================================
@@ -68,6 +140,61 @@ def _create_match_key(date: str, player1: str, player2: str, score1: int, score2
     return f"{date}|{players[0]}|{players[1]}|{score1}|{score2}"
 
 
+# Fightcade 날짜 형식: "2025. 12. 3. 오후 11:51:07" (로케일에 따라 AM/PM, 구분자 -, / 도 허용)
+_MATCH_DATE_PATTERN = re.compile(
+    r'(\d{4})\s*[.\-/]\s*(\d{1,2})\s*[.\-/]\s*(\d{1,2})\.?'
+    r'(?:\s*(오전|오후|AM|PM|am|pm))?'
+    r'(?:\s*(\d{1,2}):(\d{2})(?::(\d{2}))?)?'
+    r'(?:\s*(AM|PM|am|pm))?'
+)
+
+
+def parse_match_datetime(date_str: str) -> Optional[datetime]:
+    """매치 날짜 문자열을 datetime으로 변환 (실패 시 None)"""
+    m = _MATCH_DATE_PATTERN.search(date_str or "")
+    if not m:
+        return None
+    
+    year, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    hour = int(m.group(5) or 0)
+    minute = int(m.group(6) or 0)
+    second = int(m.group(7) or 0)
+    
+    meridiem = (m.group(4) or m.group(8) or "").upper()
+    if meridiem in ("오후", "PM") and hour < 12:
+        hour += 12
+    elif meridiem in ("오전", "AM") and hour == 12:
+        hour = 0
+    
+    try:
+        return datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+
+
+def match_sort_key(match: Dict[str, Any]) -> datetime:
+    """매치 시간순 정렬 키 (날짜 파싱 실패 시 가장 오래된 것으로 취급)"""
+    return parse_match_datetime(match.get("date", "")) or datetime.min
+
+
+def match_timestamp(match: Dict[str, Any]) -> float:
+    """매치 Unix timestamp (날짜 파싱 실패 시 현재 시각)"""
+    parsed = parse_match_datetime(match.get("date", ""))
+    return parsed.timestamp() if parsed else time.time()
+
+
+def match_played_date(match: Dict[str, Any]) -> str:
+    """매치를 치른 날짜 문자열 (YYYY-MM-DD, 날짜 파싱 실패 시 오늘) - last_played 기록용"""
+    parsed = parse_match_datetime(match.get("date", ""))
+    return parsed.strftime("%Y-%m-%d") if parsed else get_today_str()
+
+
+def _timeline_timestamp(match: Dict[str, Any]) -> float:
+    """시간순 정렬용 timestamp (날짜 파싱 실패 시 -inf → 가장 오래된 것으로 취급)"""
+    parsed = parse_match_datetime(match.get("date", ""))
+    return parsed.timestamp() if parsed else float("-inf")
+
+
 def load_match_history() -> List[Dict[str, Any]]:
     """매치 히스토리 불러오기"""
     data = _load_json(MATCH_HISTORY_FILE)
@@ -81,64 +208,110 @@ def save_match_history(history: List[Dict[str, Any]]) -> bool:
     return _save_json(MATCH_HISTORY_FILE, history)
 
 
-def save_match_data(matches: List[Any]) -> Tuple[int, int]:
+def _match_to_dict(match: Any) -> Dict[str, Any]:
+    """MatchResult 객체 또는 dict를 저장용 dict로 변환"""
+    if hasattr(match, 'date'):
+        return {
+            "date": match.date,
+            "game": match.game,
+            "player1": match.player1,
+            "score1": match.score1,
+            "player2": match.player2,
+            "score2": match.score2,
+            "match_type": match.match_type
+        }
+    return match
+
+
+def _match_dict_key(match_dict: Dict[str, Any]) -> str:
+    """저장용 dict의 매치 고유 키"""
+    return _create_match_key(
+        match_dict.get("date", ""),
+        match_dict.get("player1", ""),
+        match_dict.get("player2", ""),
+        match_dict.get("score1", 0),
+        match_dict.get("score2", 0)
+    )
+
+
+def _merge_matches(
+    history: List[Dict[str, Any]],
+    existing_keys: Set[str],
+    matches: List[Any]
+) -> Tuple[List[Dict[str, Any]], int]:
     """
-    매치 데이터 저장 (중복 제거)
+    매치 목록을 히스토리에 병합 (메모리 내, 중복 제거)
     
     Returns:
-        (새로 추가된 수, 중복으로 스킵된 수)
+        (새로 추가된 매치 dict 목록, 중복으로 스킵된 수)
     """
-    history = load_match_history()
-    
-    # 기존 키 세트 생성
-    existing_keys: Set[str] = set()
-    for m in history:
-        key = _create_match_key(
-            m.get("date", ""),
-            m.get("player1", ""),
-            m.get("player2", ""),
-            m.get("score1", 0),
-            m.get("score2", 0)
-        )
-        existing_keys.add(key)
-    
-    added = 0
+    added: List[Dict[str, Any]] = []
     skipped = 0
     
     for match in matches:
-        # MatchResult 객체 또는 dict 처리
-        if hasattr(match, 'date'):
-            match_dict = {
-                "date": match.date,
-                "game": match.game,
-                "player1": match.player1,
-                "score1": match.score1,
-                "player2": match.player2,
-                "score2": match.score2,
-                "match_type": match.match_type
-            }
-        else:
-            match_dict = match
-        
-        key = _create_match_key(
-            match_dict.get("date", ""),
-            match_dict.get("player1", ""),
-            match_dict.get("player2", ""),
-            match_dict.get("score1", 0),
-            match_dict.get("score2", 0)
-        )
+        match_dict = _match_to_dict(match)
+        key = _match_dict_key(match_dict)
         
         if key not in existing_keys:
             history.append(match_dict)
             existing_keys.add(key)
-            added += 1
+            added.append(match_dict)
         else:
             skipped += 1
     
-    save_match_history(history)
     return added, skipped
 
 
+def save_match_data(matches: List[Any]) -> Tuple[int, int]:
+    """
+    매치 데이터 저장 (중복 제거)
+    
+    Returns:
+        (새로 추가된 수, 중복으로 스킵된 수)
+    """
+    with _history_lock:
+        current_aggregates = _current_match_aggregates()
+        history = load_match_history()
+        existing_keys = {_match_dict_key(m) for m in history}
+        
+        added, skipped = _merge_matches(history, existing_keys, matches)
+        
+        save_match_history(history)
+        _update_match_aggregates(current_aggregates, added)
+    
+    return len(added), skipped
+
+
+def ingest_match_batches(batches: List[List[Any]]) -> List[Tuple[int, int]]:
+    """
+    여러 세션에서 들어온 매치 배치를 한 번에 저장 (그룹 커밋)
+    - 히스토리 로드/저장 1회
+    - 새로 추가된 매치만 Rating에 반영 (Rating 로드/저장 1회)
+    
+    Returns:
+        배치별 (새로 추가된 수, 중복으로 스킵된 수)
+    """
+    results: List[Tuple[int, int]] = []
+    all_added: List[Dict[str, Any]] = []
+    
+    with _history_lock:
+        current_aggregates = _current_match_aggregates()
+        history = load_match_history()
+        existing_keys = {_match_dict_key(m) for m in history}
+        
+        for batch in batches:
+            added, skipped = _merge_matches(history, existing_keys, batch)
+            all_added.extend(added)
+            results.append((len(added), skipped))
+        
+        if all_added:
+            save_match_history(history)
+            _update_match_aggregates(current_aggregates, all_added)
+            update_ratings_from_matches(all_added)
+    
+    return results
+
+
 def get_all_players() -> List[str]:
     """모든 플레이어 목록 (중복 제거)"""
     history = load_match_history()
@@ -154,39 +327,19 @@ def get_all_players() -> List[str]:
 
 def get_head_to_head(player_a: str, player_b: str) -> Dict[str, int]:
     """
-    두 플레이어 간 직접 대결 결과
+    두 플레이어 간 직접 대결 결과 (상대 전적 행렬에서 O(1) 조회)
     
     Returns:
         {"player_a_rounds": int, "player_b_rounds": int, "games": int}
     """
-    history = load_match_history()
-    a_lower = player_a.lower()
-    b_lower = player_b.lower()
-    
-    a_rounds = 0
-    b_rounds = 0
-    games = 0
-    
-    for m in history:
-        p1 = m.get("player1", "").lower()
-        p2 = m.get("player2", "").lower()
-        s1 = m.get("score1", 0)
-        s2 = m.get("score2", 0)
+    with _history_lock:
+        tally = get_h2h_index().pair(player_a, player_b) or [0, 0, 0]
         
-        if (p1 == a_lower and p2 == b_lower):
-            a_rounds += s1
-            b_rounds += s2
-            games += 1
-        elif (p1 == b_lower and p2 == a_lower):
-            a_rounds += s2
-            b_rounds += s1
-            games += 1
-    
-    return {
-        "player_a_rounds": a_rounds,
-        "player_b_rounds": b_rounds,
-        "games": games
-    }
+        return {
+            "player_a_rounds": tally[0],
+            "player_b_rounds": tally[1],
+            "games": tally[2]
+        }
 
 
 def get_player_total_stats() -> Dict[str, Dict[str, int]]:
@@ -222,328 +375,950 @@ def get_player_total_stats() -> Dict[str, Dict[str, int]]:
 
 
 # =============================================================================
-# 비매너 리스트 관리
+# 매치 집계 (히스토리 파생 인덱스, 매치 추가 시 증분 갱신)
 # =============================================================================
-def load_badmanner_list() -> List[Dict[str, Any]]:
-    """비매너 리스트 불러오기"""
-    data = _load_json(BADMANNER_FILE)
-    if data is None or not isinstance(data, list):
-        return []
-    return data
+# 이름 → {"factory", "file", "version", "value"}
+# 집계 객체는 add_matches(list)를 제공하고, 파일 저장 대상이면 to_dict()/from_dict()도 제공
+# (파일 저장 대상의 add_matches는 반영한 매치 수를 반환 → 0이면 저장 생략)
+_match_aggregates: Dict[str, Dict[str, Any]] = {}
 
 
-def save_badmanner_list(badmanner_list: List[Dict[str, Any]]) -> bool:
-    """비매너 리스트 저장"""
-    return _save_json(BADMANNER_FILE, badmanner_list)
+def _register_match_aggregate(name: str, factory: Callable[[], Any], filepath: Optional[str] = None) -> None:
+    """
+    매치 집계 등록
+    filepath가 있으면 히스토리 버전과 함께 저장 → 재시작 후에도 히스토리 재순회 없이 복원
+    """
+    _match_aggregates[name] = {"factory": factory, "file": filepath, "version": None, "value": None}
 
 
-def add_badmanner(user_id: str, reason: str = "") -> bool:
-    """비매너 유저 추가 (중복 체크)"""
-    badmanner_list = load_badmanner_list()
-    
-    # 중복 체크
-    for entry in badmanner_list:
-        if entry.get("user_id", "").lower() == user_id.lower():
-            return False
-    
-    badmanner_list.append({
-        "user_id": user_id,
-        "reason": reason,
-        "added_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-    
-    return save_badmanner_list(badmanner_list)
+def _save_match_aggregate(entry: Dict[str, Any]) -> None:
+    """파일 저장 대상 집계 저장 (_history_lock 보유 상태에서 호출, 압축 JSON)"""
+    if entry["file"]:
+        _save_json(
+            entry["file"],
+            {"history_version": entry["version"], "data": entry["value"].to_dict()},
+            compact=True
+        )
 
 
-def remove_badmanner(user_id: str) -> bool:
-    """비매너 유저 삭제"""
-    badmanner_list = load_badmanner_list()
-    
-    for i, entry in enumerate(badmanner_list):
-        if entry.get("user_id", "").lower() == user_id.lower():
-            badmanner_list.pop(i)
-            return save_badmanner_list(badmanner_list)
-    
-    return False
+def _current_match_aggregates() -> List[str]:
+    """현재 히스토리 파일과 일치하는 집계 이름 (히스토리 저장 직전에 호출)"""
+    version = _file_version(MATCH_HISTORY_FILE)
+    return [
+        name for name, entry in _match_aggregates.items()
+        if entry["value"] is not None and entry["version"] == version
+    ]
 
 
-def is_badmanner(user_id: str) -> bool:
-    """비매너 유저인지 확인"""
-    badmanner_list = load_badmanner_list()
-    for entry in badmanner_list:
-        if entry.get("user_id", "").lower() == user_id.lower():
-            return True
-    return False
+def _update_match_aggregates(names: List[str], added: List[Dict[str, Any]]) -> None:
+    """
+    새로 저장된 매치만 최신 집계에 반영 (_history_lock 보유, 히스토리 저장 직후 호출)
+    파일 저장 대상은 이번 배치로 바뀐 내용이 있을 때만 다시 저장
+    (건너뛰면 저장본 버전이 어긋나 재시작 시 한 번 재구성)
+    """
+    version = _file_version(MATCH_HISTORY_FILE)
+    for name in names:
+        entry = _match_aggregates[name]
+        applied = entry["value"].add_matches(added)
+        entry["version"] = version
+        if applied:
+            _save_match_aggregate(entry)
 
 
-def search_badmanner(query: str) -> Optional[Dict[str, Any]]:
-    """비매너 유저 검색"""
-    badmanner_list = load_badmanner_list()
-    query_lower = query.lower()
-    
-    for entry in badmanner_list:
-        if query_lower in entry.get("user_id", "").lower():
-            return entry
-    
-    return None
+def _get_match_aggregate(name: str) -> Any:
+    """
+    매치 집계 조회
+    히스토리 파일이 외부에서 바뀐 경우(복원/초기화 등)에만 저장본 복원 또는 한 번 순회로 재구성
+    """
+    with _history_lock:
+        entry = _match_aggregates[name]
+        version = _file_version(MATCH_HISTORY_FILE)
+        if entry["value"] is not None and entry["version"] == version:
+            return entry["value"]
+        
+        value = None
+        if entry["file"]:
+            stored = _load_json(entry["file"])
+            if isinstance(stored, dict) and stored.get("history_version") == version:
+                value = entry["factory"].from_dict(stored.get("data") or {})
+        
+        rebuilt = value is None
+        if rebuilt:
+            value = entry["factory"]()
+            value.add_matches(load_match_history())
+        
+        entry["value"] = value
+        entry["version"] = version
+        if rebuilt:
+            _save_match_aggregate(entry)
+        return value
 
 
-def get_all_reasons() -> List[str]:
+def _set_match_aggregate(name: str, value: Any) -> None:
+    """현재 히스토리 전체로 만든 집계로 교체 (_history_lock 보유, 재계산 등 전체 순회 중에 함께 만든 경우)"""
+    entry = _match_aggregates[name]
+    entry["value"] = value
+    entry["version"] = _file_version(MATCH_HISTORY_FILE)
+    _save_match_aggregate(entry)
+
+
+_register_match_aggregate("h2h", HeadToHeadMatrix)
+_register_match_aggregate("game_stats", GameStats, GAME_STATS_FILE)
+_register_match_aggregate("win_trends", lambda: WinTrends(_timeline_timestamp))
+_register_match_aggregate("daily_buckets", lambda: DailyBuckets(_timeline_timestamp))
+_register_match_aggregate("streaks", lambda: StreakTracker(_timeline_timestamp))
+_register_match_aggregate("match_feed", lambda: MatchFeed(_timeline_timestamp))
+_register_match_aggregate("activity", lambda: ActivityHeatmap(_timeline_timestamp))
+
+
+# =============================================================================
+# 상대 전적 행렬 (희소, 매치 추가 시 증분 갱신)
+# =============================================================================
+def get_h2h_index() -> HeadToHeadMatrix:
+    """상대 전적 행렬 조회"""
+    return _get_match_aggregate("h2h")
+
+
+def get_opponent_table(player_id: str) -> List[Dict[str, Any]]:
     """
-    기존에 등록된 모든 사유 목록 (중복 제거, 정렬)
+    한 플레이어의 상대별 전적 (매치 수 내림차순)
     
     Returns:
-        사유 문자열 리스트 (빈 문자열 제외)
+        [{"opponent": str, "wins": int, "losses": int, "games": int, "win_rate": float}, ...]
     """
-    badmanner_list = load_badmanner_list()
-    reasons: Set[str] = set()
+    # 수집 워커가 같은 행렬을 갱신하므로 결과를 다 만들 때까지 잠금 유지
+    table = []
+    with _history_lock:
+        for opponent, (wins, losses, games) in get_h2h_index().opponents(player_id):
+            rounds = wins + losses
+            table.append({
+                "opponent": opponent,
+                "wins": wins,
+                "losses": losses,
+                "games": games,
+                "win_rate": round(wins / rounds * 100, 1) if rounds else 0.0
+            })
     
-    for entry in badmanner_list:
-        reason = entry.get("reason", "").strip()
-        if reason:
-            reasons.add(reason)
+    table.sort(key=lambda row: (-row["games"], row["opponent"]))
+    return table
+
+
+def get_h2h_matrix(players: List[str]) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """
+    여러 플레이어끼리의 상대 전적 표 (대전 기록이 있는 쌍만 포함)
     
-    return sorted(list(reasons))
+    Returns:
+        {a: {b: {"wins": a 라운드 승, "losses": a 라운드 패, "games": 매치 수}}} (소문자 ID)
+    """
+    with _history_lock:
+        return {
+            player: {
+                opponent: {"wins": wins, "losses": losses, "games": games}
+                for opponent, (wins, losses, games) in cells.items()
+            }
+            for player, cells in get_h2h_index().submatrix(players).items()
+        }
 
 
 # =============================================================================
-# 데이터 백업/복원 (Export/Import)
+# 게임별 통계
 # =============================================================================
-def export_all_data() -> str:
+def get_game_stats_overview() -> List[Dict[str, Any]]:
     """
-    모든 데이터를 JSON 문자열로 내보내기
+    게임별 요약 (매치 수 내림차순)
     
     Returns:
-        JSON 문자열 (match_history + badmanner_list)
+        [{"game", "matches", "rounds", "players", "avg_margin"}, ...]
     """
-    data = {
-        "version": "2.0",
-        "exported_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "match_history": load_match_history(),
-        "badmanner_list": load_badmanner_list()
-    }
-    return json.dumps(data, ensure_ascii=False, indent=2)
+    with _history_lock:
+        return _get_match_aggregate("game_stats").overview()
 
 
-def import_all_data(json_str: str) -> Tuple[bool, str]:
+def get_game_stats(game: str, top_k: int = 5) -> Dict[str, Any]:
     """
-    JSON 문자열에서 모든 데이터 가져오기 (기존 데이터 덮어쓰기)
+    게임 상세 통계 (매치 타입별 분포 + 상위 플레이어)
     
-    Args:
-        json_str: JSON 형식 문자열
-        
     Returns:
-        (성공 여부, 메시지)
+        {"game", "matches", "rounds", "players", "avg_rounds", "avg_margin",
+         "match_types": [...], "top_players": [...]}
     """
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        return False, f"JSON 파싱 오류: {str(e)}"
-    
-    # 데이터 검증
-    if not isinstance(data, dict):
-        return False, "올바른 백업 파일 형식이 아닙니다."
-    
-    match_history = data.get("match_history", [])
-    badmanner_list = data.get("badmanner_list", [])
-    
-    if not isinstance(match_history, list) or not isinstance(badmanner_list, list):
-        return False, "데이터 형식이 올바르지 않습니다."
-    
-    # 데이터 저장 (기존 데이터 덮어쓰기)
-    save_match_history(match_history)
-    save_badmanner_list(badmanner_list)
-    
-    match_count = len(match_history)
-    badmanner_count = len(badmanner_list)
-    
-    return True, f"복원 완료: 매치 {match_count}건, 비매너 {badmanner_count}명"
-
-
-def clear_all_data() -> bool:
-    """모든 데이터 초기화"""
-    save_match_history([])
-    save_badmanner_list([])
-    return True
+    with _history_lock:
+        stats = _get_match_aggregate("game_stats")
+        summary = stats.summary(game)
+        summary["top_players"] = stats.top_players(game, top_k)
+    return summary
 
 
 # =============================================================================
-# 일일 방문수 카운터
+# 롤링 승률 추이
 # =============================================================================
-VISIT_COUNT_FILE = f"{DATA_DIR}/visit_count.json"
+def get_recent_win_rate(
+    player_id: str,
+    matches: Optional[int] = None,
+    days: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    최근 N판 또는 최근 N일 라운드 승률 (누적합으로 O(1) / O(log n))
+    
+    Returns:
+        {"matches": int, "wins": int, "losses": int, "win_rate": float | None}
+    """
+    with _history_lock:
+        trends = _get_match_aggregate("win_trends")
+        if days is not None:
+            return trends.last_days(player_id, days, time.time())
+        return trends.last_matches(player_id, matches or trends.match_count(player_id))
+
+
+def get_win_rate_trend(
+    player_id: str,
+    window_matches: Optional[int] = None,
+    window_days: Optional[float] = None,
+    max_points: int = 200
+) -> Dict[str, List[Any]]:
+    """
+    매치 시점별 롤링 승률 시계열 (차트용)
+    
+    Returns:
+        {"ts": [Unix timestamp, ...], "win_rate": [%, ...]}
+    """
+    with _history_lock:
+        return _get_match_aggregate("win_trends").rolling_series(
+            player_id, window_matches, window_days, max_points
+        )
 
 
-def get_today_str() -> str:
-    """오늘 날짜 문자열 반환 (YYYY-MM-DD)"""
-    return datetime.now().strftime("%Y-%m-%d")
+# =============================================================================
+# 연승/연패 + 최근 폼
+# =============================================================================
+def get_player_streak(player_id: str, form_length: int = FORM_LENGTH) -> Dict[str, Any]:
+    """
+    플레이어 연속 기록 (매치 승패 기준)
+    
+    Returns:
+        {"matches", "current" (+연승/-연패), "best_win", "best_loss", "form": "WWLDW" (오래된 → 최근)}
+    """
+    with _history_lock:
+        return _get_match_aggregate("streaks").player(player_id, form_length)
 
 
-def load_visit_count() -> Dict[str, Any]:
-    """방문수 데이터 로드"""
-    data = _load_json(VISIT_COUNT_FILE)
-    if data is None or not isinstance(data, dict):
-        return {"date": get_today_str(), "count": 0}
-    return data
+def get_pair_streak(player_a: str, player_b: str, form_length: int = FORM_LENGTH) -> Dict[str, Any]:
+    """두 플레이어 맞대결 연속 기록 (player_a 기준, 형식은 get_player_streak과 같음)"""
+    with _history_lock:
+        return _get_match_aggregate("streaks").pair(player_a, player_b, form_length)
 
 
-def save_visit_count(data: Dict[str, Any]) -> bool:
-    """방문수 데이터 저장"""
-    return _save_json(VISIT_COUNT_FILE, data)
+def annotate_streaks(rows: List[Dict[str, Any]], id_field: str = "user_id") -> List[Dict[str, Any]]:
+    """
+    행 목록(랭킹 등)에 연속 기록 필드 추가 (제자리 수정)
+    - "streak": int (+연승/-연패)
+    - "best_streak": int (최장 연승)
+    - "form": str
+    """
+    # 행 전체가 같은 시점의 기록이 되도록 루프 내내 잠금 유지
+    with _history_lock:
+        tracker = _get_match_aggregate("streaks")
+        for row in rows:
+            summary = tracker.player(row.get(id_field, ""))
+            row["streak"] = summary["current"]
+            row["best_streak"] = summary["best_win"]
+            row["form"] = summary["form"]
+    return rows
 
 
-def increment_visit_count() -> int:
+# =============================================================================
+# 기간 랭킹 (일 단위 버킷 + 슬라이딩 윈도우)
+# =============================================================================
+def get_window_range(window: str, today: Optional[date] = None) -> Tuple[date, date]:
+    """최근 N일 윈도우의 (시작일, 종료일) - 오늘 포함"""
+    today = today or date.today()
+    return today - timedelta(days=LEADERBOARD_WINDOWS[window] - 1), today
+
+
+def get_window_ranking(
+    start: date,
+    end: date,
+    window: str = "season",
+    limit: Optional[int] = None,
+    min_games: int = WINDOW_MIN_GAMES
+) -> List[Dict[str, Any]]:
     """
-    방문수 증가 및 반환
-    날짜가 바뀌면 리셋
+    기간 랭킹 (라운드 승률 > 라운드 승 > 매치 수)
+    같은 window 키로 구간을 옮기면 빠지는/들어오는 날짜 버킷만 반영
+    
+    Args:
+        start, end: 기간 (양 끝 포함)
+        window: 윈도우 키 ("7d", "30d", "season" 등 - 키마다 합계를 따로 유지)
+        limit: 최대 인원 (None이면 전체)
+        min_games: 기간 내 최소 매치 수
     
     Returns:
-        오늘의 방문수
+        [{"user_id", "games", "wins", "losses", "win_rate"}, ...]
     """
-    data = load_visit_count()
-    today = get_today_str()
+    with _history_lock:
+        buckets = _get_match_aggregate("daily_buckets")
+        rows = buckets.ranking(window, start.toordinal(), end.toordinal(), min_games)
+        return [dict(row) for row in rows[:limit]]
+
+
+# =============================================================================
+# 최근 매치 피드 (timestamp 인덱스 + 키셋 페이지네이션)
+# =============================================================================
+def get_recent_matches(
+    player: Optional[str] = None,
+    game: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    cursor: Optional[str] = None,
+    page_size: int = 20
+) -> Dict[str, Any]:
+    """
+    저장된 매치 최신순 조회 (페이지당 비용은 히스토리 크기와 무관)
     
-    if data.get("date") != today:
-        # 날짜가 바뀌면 리셋
-        data = {"date": today, "count": 1}
-    else:
-        data["count"] = data.get("count", 0) + 1
+    Args:
+        player: 플레이어 ID (None이면 전체)
+        game: 게임 (None이면 전체)
+        start, end: 기간 (양 끝 포함)
+        cursor: 이전 결과의 next_cursor (None이면 첫 페이지)
+        page_size: 페이지 크기
     
-    save_visit_count(data)
-    return data["count"]
+    Returns:
+        {"matches": [매치 dict, ...], "next_cursor": str | None (마지막 페이지면 None)}
+    """
+    with _history_lock:
+        result = _get_match_aggregate("match_feed").page(player, game, start, end, cursor, page_size)
+        result["matches"] = [dict(m) for m in result["matches"]]
+        return result
 
 
-def get_visit_count() -> int:
+# =============================================================================
+# 활동 히트맵 (요일 × 시간대)
+# =============================================================================
+def get_activity_heatmap(player_id: Optional[str] = None) -> Any:
+    """
+    요일 × 시간대 매치 수 (7 × 24 NumPy 배열, 행 0 = 월요일 / 열 = 시)
+    player_id가 None이면 전체 매치 기준
     """
-    현재 방문수 반환 (증가 없이)
+    with _history_lock:
+        return _get_match_aggregate("activity").grid(player_id or "")
+
+
+def get_activity_peaks(player_id: Optional[str] = None, k: int = 3) -> List[Dict[str, int]]:
+    """
+    가장 활발한 시간대 상위 K개
     
     Returns:
-        오늘의 방문수
+        [{"weekday": 0(월)~6(일), "hour": 0~23, "matches": int}, ...]
     """
-    data = load_visit_count()
-    today = get_today_str()
-    
-    if data.get("date") != today:
-        return 0
-    
-    return data.get("count", 0)
+    with _history_lock:
+        peaks = _get_match_aggregate("activity").peaks(player_id or "", k)
+    return [{"weekday": weekday, "hour": hour, "matches": count} for weekday, hour, count in peaks]
 
 
 # =============================================================================
-# 플레이어 Rating 관리
+# 비매너 리스트 관리
 # =============================================================================
-def load_player_ratings() -> Dict[str, Dict[str, Any]]:
-    """플레이어 Rating 데이터 로드"""
-    data = _load_json(PLAYER_RATINGS_FILE)
-    if data is None or not isinstance(data, dict):
-        return {}
+def load_badmanner_list() -> List[Dict[str, Any]]:
+    """비매너 리스트 불러오기"""
+    data = _load_json(BADMANNER_FILE)
+    if data is None or not isinstance(data, list):
+        return []
     return data
 
 
-def save_player_ratings(ratings: Dict[str, Dict[str, Any]]) -> bool:
-    """플레이어 Rating 데이터 저장"""
-    return _save_json(PLAYER_RATINGS_FILE, ratings)
+def save_badmanner_list(badmanner_list: List[Dict[str, Any]]) -> bool:
+    """비매너 리스트 저장 (인덱스도 함께 재생성/저장)"""
+    with _badmanner_lock:
+        if not _save_json(BADMANNER_FILE, badmanner_list):
+            return False
+        _rebuild_badmanner_index(badmanner_list)
+    return True
 
 
-def get_player_rating(player_id: str) -> Dict[str, Any]:
-    """
-    특정 플레이어의 Rating 정보 조회
-    없으면 기본값 반환
-    """
-    ratings = load_player_ratings()
-    player_lower = player_id.lower()
+def _rebuild_badmanner_index(badmanner_list: List[Dict[str, Any]]) -> BadmannerIndex:
+    """인덱스 생성 + 저장 + 메모리 캐시 갱신 (_badmanner_lock 보유 상태에서 호출)"""
+    index = BadmannerIndex(badmanner_list)
+    version = _file_version(BADMANNER_FILE)
     
-    if player_lower in ratings:
-        return ratings[player_lower]
+    _save_json(BADMANNER_INDEX_FILE, {"source_version": version, **index.to_dict()})
+    _badmanner_index_cache["version"] = version
+    _badmanner_index_cache["index"] = index
     
-    return {
-        "rating": DEFAULT_RATING,
+    return index
+
+
+def get_badmanner_index() -> BadmannerIndex:
+    """
+    비매너 리스트 인덱스 조회
+    - 리스트 파일이 그대로면 메모리 캐시 사용 (파일 stat만 수행)
+    - 저장된 인덱스가 리스트 버전과 맞으면 복원, 아니면 재생성
+    """
+    with _badmanner_lock:
+        version = _file_version(BADMANNER_FILE)
+        if _badmanner_index_cache["version"] == version:
+            return _badmanner_index_cache["index"]
+        
+        badmanner_list = load_badmanner_list()
+        stored = _load_json(BADMANNER_INDEX_FILE)
+        
+        index = None
+        if isinstance(stored, dict) and stored.get("source_version") == version:
+            index = BadmannerIndex.from_dict(badmanner_list, stored)
+        
+        if index is None:
+            return _rebuild_badmanner_index(badmanner_list)
+        
+        _badmanner_index_cache["version"] = version
+        _badmanner_index_cache["index"] = index
+        return index
+
+
+def add_badmanner(user_id: str, reason: str = "") -> bool:
+    """비매너 유저 추가 (중복 체크)"""
+    with _badmanner_lock:
+        index = get_badmanner_index()
+        
+        # 중복 체크
+        if index.contains(user_id):
+            return False
+        
+        badmanner_list = list(index.entries)
+        badmanner_list.append({
+            "user_id": user_id,
+            "reason": reason,
+            "added_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+        
+        return save_badmanner_list(badmanner_list)
+
+
+def remove_badmanner(user_id: str) -> bool:
+    """비매너 유저 삭제"""
+    with _badmanner_lock:
+        index = get_badmanner_index()
+        pos = index.position(user_id)
+        
+        if pos is None:
+            return False
+        
+        badmanner_list = list(index.entries)
+        badmanner_list.pop(pos)
+        return save_badmanner_list(badmanner_list)
+
+
+def is_badmanner(user_id: str) -> bool:
+    """비매너 유저인지 확인"""
+    return get_badmanner_index().contains(user_id)
+
+
+def get_badmanner_entry(user_id: str) -> Optional[Dict[str, Any]]:
+    """비매너 유저 엔트리 조회 (정확히 일치, 대소문자 무시)"""
+    return get_badmanner_index().get(user_id)
+
+
+def check_badmanner_bulk(user_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    여러 유저의 비매너 여부를 한 번에 확인 (인덱스 1회 조회)
+    
+    Returns:
+        {"소문자 user_id": 비매너 엔트리 또는 None}
+    """
+    index = get_badmanner_index()
+    return {user_id.lower(): index.get(user_id) for user_id in user_ids}
+
+
+def annotate_badmanner(rows: List[Dict[str, Any]], id_field: str = "user_id") -> List[Dict[str, Any]]:
+    """
+    행 목록(랭킹 등)에 비매너 여부/사유 필드 추가 (제자리 수정)
+    - "badmanner": bool
+    - "badmanner_reason": str
+    """
+    flags = check_badmanner_bulk(row.get(id_field, "") for row in rows)
+    
+    for row in rows:
+        entry = flags.get(row.get(id_field, "").lower())
+        row["badmanner"] = entry is not None
+        row["badmanner_reason"] = entry.get("reason", "") if entry else ""
+    
+    return rows
+
+
+def get_badmanner_page(
+    page: int,
+    page_size: int,
+    order: str = "recent",
+    query: str = ""
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    비매너 리스트 페이지 조회 (인덱스 기반 정렬/필터)
+    
+    Returns:
+        (해당 페이지 엔트리 목록, 전체 결과 수)
+    """
+    return get_badmanner_index().page(page, page_size, order, query)
+
+
+def search_badmanner(query: str) -> Optional[Dict[str, Any]]:
+    """비매너 유저 검색 (가장 잘 맞는 1명)"""
+    results = search_badmanner_ranked(query, limit=1)
+    return results[0] if results else None
+
+
+def search_badmanner_ranked(query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    비매너 유저 검색 (부분 문자열 + 유사 검색, 점수순)
+    
+    Returns:
+        [{"user_id", "reason", "added_date", "score"}, ...]
+    """
+    return [
+        {**entry, "score": score}
+        for entry, score in get_badmanner_index().search(query, limit=limit)
+    ]
+
+
+def get_all_reasons() -> List[str]:
+    """
+    기존에 등록된 모든 사유 목록 (중복 제거, 정렬)
+    
+    Returns:
+        사유 문자열 리스트 (빈 문자열 제외)
+    """
+    badmanner_list = load_badmanner_list()
+    reasons: Set[str] = set()
+    
+    for entry in badmanner_list:
+        reason = entry.get("reason", "").strip()
+        if reason:
+            reasons.add(reason)
+    
+    return sorted(list(reasons))
+
+
+# =============================================================================
+# 데이터 버전 (캐시 무효화용)
+# =============================================================================
+def _file_version(filepath: str) -> str:
+    """파일 버전 문자열 (수정 시각 + 크기, 없으면 '0')"""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return "0"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def get_data_version() -> str:
+    """
+    매치 히스토리 + 비매너 리스트의 데이터 버전
+    파일을 읽지 않고 stat만 사용하므로 매 rerun마다 호출해도 저렴함
+    """
+    return f"{_file_version(MATCH_HISTORY_FILE)}|{_file_version(BADMANNER_FILE)}"
+
+
+def get_badmanner_version() -> str:
+    """비매너 리스트 버전"""
+    return _file_version(BADMANNER_FILE)
+
+
+def get_ratings_version() -> str:
+    """랭킹 데이터 버전 (Rating 파일 + 게임별 Rating 파일 + 매치 히스토리)"""
+    return (
+        f"{_file_version(PLAYER_RATINGS_FILE)}|{_file_version(GAME_RATINGS_FILE)}"
+        f"|{_file_version(MATCH_HISTORY_FILE)}"
+    )
+
+
+# =============================================================================
+# 데이터 백업/복원 (Export/Import)
+# =============================================================================
+_backup_cache: Dict[str, Any] = {"version": None, "body": None, "compressed": False}
+BACKUP_FORMAT_VERSION = "2.0"
+
+
+def _encode_backup_body(data: Dict[str, Any], compact: bool) -> Iterable[str]:
+    """백업 본문 JSON 청크 (여는 중괄호 제외 → 헤더 뒤에 이어붙임)"""
+    if compact:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+    chunks = encoder.iterencode(data)
+    yield next(chunks)[1:]
+    yield from chunks
+
+
+def _backup_header(compact: bool) -> bytes:
+    """백업 헤더 (버전 + 내보낸 시각) - 내보낼 때마다 새로 생성"""
+    exported_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if compact:
+        header = f'{{"version":"{BACKUP_FORMAT_VERSION}","exported_at":"{exported_at}",'
+    else:
+        header = f'{{\n  "version": "{BACKUP_FORMAT_VERSION}",\n  "exported_at": "{exported_at}",'
+    return header.encode('utf-8')
+
+
+def export_backup_bytes() -> Tuple[bytes, bool]:
+    """
+    백업 파일 바이트 생성
+    - 본문(match_history + badmanner_list)은 데이터 버전별로 캐시, exported_at 헤더만 매번 새로 생성
+    - 매치 수가 BACKUP_COMPRESS_THRESHOLD 이상이면 gzip 스트림으로 직렬화
+      (헤더와 본문은 각각 gzip 멤버 → 이어붙인 파일도 표준 gzip으로 한 번에 풀림)
+    
+    Returns:
+        (백업 바이트, gzip 압축 여부)
+    """
+    version = get_data_version()
+    if _backup_cache["version"] != version or _backup_cache["body"] is None:
+        history = load_match_history()
+        data = {
+            "match_history": history,
+            "badmanner_list": load_badmanner_list()
+        }
+        
+        compressed = len(history) >= BACKUP_COMPRESS_THRESHOLD
+        buffer = io.BytesIO()
+        
+        if compressed:
+            # 청크 단위로 압축 스트림에 기록 (전체 문자열을 만들지 않음)
+            with gzip.GzipFile(fileobj=buffer, mode='wb') as gz:
+                with io.TextIOWrapper(gz, encoding='utf-8') as writer:
+                    writer.writelines(_encode_backup_body(data, compact=True))
+        else:
+            buffer.write("".join(_encode_backup_body(data, compact=False)).encode('utf-8'))
+        
+        _backup_cache.update({"version": version, "body": buffer.getvalue(), "compressed": compressed})
+    
+    compressed = _backup_cache["compressed"]
+    header = _backup_header(compact=compressed)
+    if compressed:
+        header = gzip.compress(header)
+    
+    return header + _backup_cache["body"], compressed
+
+
+def decode_backup_bytes(raw: bytes) -> str:
+    """백업 파일 바이트를 JSON 문자열로 변환 (gzip 자동 감지)"""
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return raw.decode("utf-8")
+
+
+def import_all_data(json_str: str) -> Tuple[bool, str]:
+    """
+    JSON 문자열에서 모든 데이터 가져오기 (기존 데이터 덮어쓰기)
+    
+    Args:
+        json_str: JSON 형식 문자열
+        
+    Returns:
+        (성공 여부, 메시지)
+    """
+    try:
+        data = json.loads(json_str)
+    except json.JSONDecodeError as e:
+        return False, f"JSON 파싱 오류: {str(e)}"
+    
+    # 데이터 검증
+    if not isinstance(data, dict):
+        return False, "올바른 백업 파일 형식이 아닙니다."
+    
+    match_history = data.get("match_history", [])
+    badmanner_list = data.get("badmanner_list", [])
+    
+    if not isinstance(match_history, list) or not isinstance(badmanner_list, list):
+        return False, "데이터 형식이 올바르지 않습니다."
+    
+    # 데이터 저장 (기존 데이터 덮어쓰기)
+    with _history_lock:
+        save_match_history(match_history)
+        save_badmanner_list(badmanner_list)
+    
+    match_count = len(match_history)
+    badmanner_count = len(badmanner_list)
+    
+    return True, f"복원 완료: 매치 {match_count}건, 비매너 {badmanner_count}명"
+
+
+def clear_all_data() -> bool:
+    """모든 데이터 초기화"""
+    with _history_lock:
+        save_match_history([])
+        save_badmanner_list([])
+    return True
+
+
+# =============================================================================
+# 일일 방문수 카운터 (프로세스 공용 메모리 버퍼 + 주기적 flush)
+# =============================================================================
+VISIT_COUNT_FILE = f"{DATA_DIR}/visit_count.json"
+VISIT_FLUSH_INTERVAL = 30     # 방문수 파일 flush 주기 (초)
+VISIT_HISTORY_DAYS = 365      # 보관할 일별 방문 기록 일수
+
+_visit_lock = threading.Lock()
+_visit_daily: Optional[Dict[str, int]] = None   # 마지막 flush 시점의 파일 내용
+_visit_pending: Dict[str, int] = {}             # 아직 flush되지 않은 증가분
+_visit_flusher: Optional[threading.Thread] = None
+
+
+def get_today_str() -> str:
+    """오늘 날짜 문자열 반환 (YYYY-MM-DD)"""
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def load_visit_count() -> Dict[str, int]:
+    """
+    방문수 데이터 로드 (파일)
+    
+    Returns:
+        {"YYYY-MM-DD": count, ...}
+    """
+    data = _load_json(VISIT_COUNT_FILE)
+    if not isinstance(data, dict):
+        return {}
+    
+    # 구버전 형식: {"date": ..., "count": ...}
+    if "date" in data and "count" in data:
+        return {data["date"]: data.get("count", 0)}
+    
+    daily = data.get("daily", {})
+    return daily if isinstance(daily, dict) else {}
+
+
+def save_visit_count(daily: Dict[str, int]) -> bool:
+    """방문수 데이터 저장 (오래된 날짜는 정리)"""
+    kept = sorted(daily.items())[-VISIT_HISTORY_DAYS:]
+    return _save_json(VISIT_COUNT_FILE, {"daily": dict(kept)})
+
+
+def flush_visit_count() -> bool:
+    """
+    메모리에 쌓인 방문수 증가분을 파일에 반영
+    파일을 다시 읽어 증가분만 더하므로 다른 프로세스의 기록을 덮어쓰지 않음
+    """
+    global _visit_daily
+    
+    with _visit_lock:
+        if not _visit_pending:
+            return True
+        
+        daily = load_visit_count()
+        for day_key, count in _visit_pending.items():
+            daily[day_key] = daily.get(day_key, 0) + count
+        
+        if not save_visit_count(daily):
+            return False
+        
+        _visit_daily = daily
+        _visit_pending.clear()
+        return True
+
+
+def _visit_flush_loop() -> None:
+    """백그라운드 flush 루프"""
+    while True:
+        time.sleep(VISIT_FLUSH_INTERVAL)
+        flush_visit_count()
+
+
+def _ensure_visit_state() -> None:
+    """방문수 메모리 상태 초기화 + flush 스레드 시작 (_visit_lock 보유 상태에서 호출)"""
+    global _visit_daily, _visit_flusher
+    
+    if _visit_daily is None:
+        _visit_daily = load_visit_count()
+    
+    if _visit_flusher is None:
+        _visit_flusher = threading.Thread(target=_visit_flush_loop, name="visit-flush", daemon=True)
+        _visit_flusher.start()
+        atexit.register(flush_visit_count)
+
+
+def increment_visit_count() -> int:
+    """
+    방문수 증가 및 반환 (메모리에만 반영, 파일은 주기적으로 flush)
+    
+    Returns:
+        오늘의 방문수
+    """
+    today = get_today_str()
+    
+    with _visit_lock:
+        _ensure_visit_state()
+        _visit_pending[today] = _visit_pending.get(today, 0) + 1
+        return _visit_daily.get(today, 0) + _visit_pending[today]
+
+
+def get_visit_count() -> int:
+    """
+    현재 방문수 반환 (증가 없이, 메모리에서 조회)
+    
+    Returns:
+        오늘의 방문수
+    """
+    today = get_today_str()
+    
+    with _visit_lock:
+        _ensure_visit_state()
+        return _visit_daily.get(today, 0) + _visit_pending.get(today, 0)
+
+
+def get_visit_history(days: int = 30) -> List[Tuple[str, int]]:
+    """
+    최근 일별 방문수 (flush 전 증가분 포함)
+    
+    Returns:
+        [("YYYY-MM-DD", count), ...] (날짜 오름차순)
+    """
+    with _visit_lock:
+        _ensure_visit_state()
+        merged = dict(_visit_daily)
+        for day_key, count in _visit_pending.items():
+            merged[day_key] = merged.get(day_key, 0) + count
+    
+    return sorted(merged.items())[-days:]
+
+
+# =============================================================================
+# 플레이어 Rating 관리
+# =============================================================================
+def load_player_ratings() -> Dict[str, Dict[str, Any]]:
+    """플레이어 Rating 데이터 로드"""
+    data = _load_json(PLAYER_RATINGS_FILE)
+    if data is None or not isinstance(data, dict):
+        return {}
+    return data
+
+
+def save_player_ratings(ratings: Dict[str, Dict[str, Any]]) -> bool:
+    """플레이어 Rating 데이터 저장"""
+    return _save_json(PLAYER_RATINGS_FILE, ratings)
+
+
+def load_game_ratings() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """게임별 Rating 데이터 로드 ({게임: {플레이어 ID: Rating 데이터}})"""
+    data = _load_json(GAME_RATINGS_FILE)
+    if data is None or not isinstance(data, dict):
+        return {}
+    return data
+
+
+def save_game_ratings(game_ratings: Dict[str, Dict[str, Dict[str, Any]]]) -> bool:
+    """게임별 Rating 데이터 저장"""
+    return _save_json(GAME_RATINGS_FILE, game_ratings)
+
+
+def _match_game(match: Dict[str, Any]) -> str:
+    """게임별 래더 키 (게임 정보가 없으면 빈 문자열 → 전체 Rating에만 반영)"""
+    return (match.get("game") or "").strip()
+
+
+def get_player_rating(player_id: str) -> Dict[str, Any]:
+    """
+    특정 플레이어의 Rating 정보 조회
+    없으면 기본값 반환
+    """
+    ratings = load_player_ratings()
+    player_lower = player_id.lower()
+    
+    if player_lower in ratings:
+        return ratings[player_lower]
+    
+    return {
+        "rating": DEFAULT_RATING,
         "rd": DEFAULT_RD,
         "games": 0,
         "last_played": None
     }
 
 
-def _calculate_expected_win_rate(my_rating: float, opp_rating: float) -> float:
-    """기대 승률 계산 (Elo 공식)"""
+def expected_score(my_rating: Any, opp_rating: Any) -> Any:
+    """
+    매치 기대 점수 (Elo 공식, float 또는 NumPy 배열)
+    - 승 1 / 무 0.5 / 패 0 기준의 기대값 = 매치 단위 기대 승률
+    """
     return 1 / (1 + 10 ** ((opp_rating - my_rating) / 400))
 
 
-def _calculate_margin_multiplier(winner_score: int, loser_score: int) -> float:
+def _calculate_margin_multiplier(
+    winner_score: int,
+    loser_score: int,
+    table: Optional[Dict[int, Tuple[float, float]]] = None
+) -> float:
     """
-    마진 가중치 계산
+    마진 가중치 계산 (기본 테이블: MARGIN_MULTIPLIERS)
     - 3:0 완승 → 1.5
-    - 3:1 → 1.25
+    - 3:1 → 1.3
     - 3:2 신승 → 1.0
-    - 2:0 → 1.3
+    - 2:0 → 1.25
     - 2:1 → 1.1
     - 기타 → 1.0
     """
     diff = winner_score - loser_score
     total = winner_score + loser_score
     
-    if total == 0:
+    if total == 0 or diff <= 0:
         return 1.0
     
-    # 스코어 차이에 따른 가중치
-    if diff >= 3:
-        return 1.5
-    elif diff == 2:
-        return 1.3 if winner_score >= 3 else 1.25
-    elif diff == 1:
-        return 1.1 if winner_score <= 2 else 1.0
-    else:
-        return 1.0
-
-
-def update_ratings_from_match(
-    player1: str, 
-    score1: int, 
-    player2: str, 
-    score2: int
+    if table is None:
+        table = MARGIN_MULTIPLIERS
+    
+    long_weight, short_weight = table.get(min(diff, 3), (1.0, 1.0))
+    return long_weight if winner_score >= 3 else short_weight
+
+
+def apply_rating_update(
+    ratings: Dict[str, Dict[str, Any]],
+    player1: str,
+    score1: int,
+    player2: str,
+    score2: int,
+    played_date: str = "",
+    k_factor: float = K_FACTOR,
+    default_rating: float = DEFAULT_RATING,
+    margin_table: Optional[Dict[int, Tuple[float, float]]] = None
 ) -> Tuple[float, float]:
     """
-    매치 결과로 양쪽 플레이어 Rating 업데이트
+    매치 1건의 결과를 Rating 테이블(메모리)에 반영 (파일 저장 없음)
+    (k_factor/default_rating/margin_table은 파라미터 시뮬레이션용, 기본값은 실제 설정)
     
     Returns:
         (player1 변동량, player2 변동량)
     """
-    ratings = load_player_ratings()
     p1_lower = player1.lower()
     p2_lower = player2.lower()
     
     # 기존 Rating 조회 (없으면 기본값)
     p1_data = ratings.get(p1_lower, {
-        "rating": DEFAULT_RATING,
+        "rating": default_rating,
         "rd": DEFAULT_RD,
         "games": 0
     })
     p2_data = ratings.get(p2_lower, {
-        "rating": DEFAULT_RATING,
+        "rating": default_rating,
         "rd": DEFAULT_RD,
         "games": 0
     })
     
-    r1 = p1_data.get("rating", DEFAULT_RATING)
-    r2 = p2_data.get("rating", DEFAULT_RATING)
+    r1 = p1_data.get("rating", default_rating)
+    r2 = p2_data.get("rating", default_rating)
     
     # 기대 승률
-    exp1 = _calculate_expected_win_rate(r1, r2)
-    exp2 = _calculate_expected_win_rate(r2, r1)
+    exp1 = expected_score(r1, r2)
+    exp2 = expected_score(r2, r1)
     
     # 실제 결과 (승리=1, 패배=0, 무승부=0.5)
     if score1 > score2:
         actual1, actual2 = 1, 0
-        margin = _calculate_margin_multiplier(score1, score2)
+        margin = _calculate_margin_multiplier(score1, score2, margin_table)
     elif score2 > score1:
         actual1, actual2 = 0, 1
-        margin = _calculate_margin_multiplier(score2, score1)
+        margin = _calculate_margin_multiplier(score2, score1, margin_table)
     else:
         actual1, actual2 = 0.5, 0.5
         margin = 1.0
     
     # Rating 변동 계산
-    delta1 = K_FACTOR * (actual1 - exp1) * margin
-    delta2 = K_FACTOR * (actual2 - exp2) * margin
+    delta1 = k_factor * (actual1 - exp1) * margin
+    delta2 = k_factor * (actual2 - exp2) * margin
     
     # 새 Rating 적용
     new_r1 = r1 + delta1
@@ -553,26 +1328,227 @@ def update_ratings_from_match(
     new_rd1 = max(50, p1_data.get("rd", DEFAULT_RD) * 0.95)
     new_rd2 = max(50, p2_data.get("rd", DEFAULT_RD) * 0.95)
     
-    # 저장
-    today = get_today_str()
     ratings[p1_lower] = {
         "rating": round(new_r1, 1),
         "rd": round(new_rd1, 1),
         "games": p1_data.get("games", 0) + 1,
-        "last_played": today
+        "wins": p1_data.get("wins", 0) + score1,
+        "losses": p1_data.get("losses", 0) + score2,
+        "last_played": played_date
     }
     ratings[p2_lower] = {
         "rating": round(new_r2, 1),
         "rd": round(new_rd2, 1),
         "games": p2_data.get("games", 0) + 1,
-        "last_played": today
+        "wins": p2_data.get("wins", 0) + score2,
+        "losses": p2_data.get("losses", 0) + score1,
+        "last_played": played_date
     }
     
-    save_player_ratings(ratings)
-    
     return round(delta1, 1), round(delta2, 1)
 
 
+def _rating_point(
+    ratings: Dict[str, Dict[str, Any]],
+    player_id: str,
+    ts: float,
+    ref: int
+) -> Tuple[str, float, float, float, int]:
+    """Rating 시계열 기록 1건 (player_id, timestamp, rating, rd, match_ref)"""
+    data = ratings[player_id]
+    return (player_id, ts, data["rating"], data["rd"], ref)
+
+
+def _backfill_round_records(
+    ratings: Dict[str, Dict[str, Any]],
+    applying: List[Dict[str, Any]]
+) -> None:
+    """
+    라운드 승/패(wins/losses)가 없는 구버전 Rating 항목을 히스토리 집계로 채움 (제자리 수정)
+    증분 반영 직전에 호출 → 0부터 다시 세지 않도록 함
+    이번에 반영할 매치(applying) 중 이미 히스토리에 저장된 것은 집계에서 제외 (이중 계산 방지)
+    """
+    legacy = {
+        player_id for player_id, data in ratings.items()
+        if "wins" not in data or "losses" not in data
+    }
+    if not legacy:
+        return
+    
+    skip = {_match_dict_key(m) for m in applying}
+    totals = {player_id: [0, 0] for player_id in legacy}
+    for m in load_match_history():
+        if _match_dict_key(m) in skip:
+            continue
+        p1 = m.get("player1", "").lower()
+        p2 = m.get("player2", "").lower()
+        s1 = m.get("score1", 0)
+        s2 = m.get("score2", 0)
+        if p1 in totals:
+            totals[p1][0] += s1
+            totals[p1][1] += s2
+        if p2 in totals:
+            totals[p2][0] += s2
+            totals[p2][1] += s1
+    
+    for player_id, (wins, losses) in totals.items():
+        ratings[player_id] = {**ratings[player_id], "wins": wins, "losses": losses}
+
+
+def update_ratings_from_match(
+    player1: str, 
+    score1: int, 
+    player2: str, 
+    score2: int,
+    game: str = "",
+    date: str = ""
+) -> Tuple[float, float]:
+    """
+    매치 결과로 양쪽 플레이어 Rating 업데이트
+    game이 있으면 해당 게임 래더에도 반영
+    Rating 시계열은 매치 날짜(date) 시각과 매치 키로 기록 (일괄 반영과 동일)
+    
+    Returns:
+        (전체 Rating 기준 player1 변동량, player2 변동량)
+    """
+    match = {"date": date, "player1": player1, "score1": score1,
+             "player2": player2, "score2": score2}
+    played_date = match_played_date(match)
+    
+    with _history_lock:
+        board_current = _is_leaderboard_current()
+        ratings = load_player_ratings()
+        _backfill_round_records(ratings, [match])
+        deltas = apply_rating_update(ratings, player1, score1, player2, score2, played_date)
+        save_player_ratings(ratings)
+        
+        game = game.strip()
+        if game:
+            games_current = _is_game_leaderboards_current()
+            game_ratings = load_game_ratings()
+            apply_rating_update(
+                game_ratings.setdefault(game, {}), player1, score1, player2, score2, played_date
+            )
+            save_game_ratings(game_ratings)
+            if games_current:
+                _update_game_leaderboards(
+                    game_ratings, {(game, player1.lower()), (game, player2.lower())}
+                )
+        
+        # Rating 시계열 기록 (매치 시각 기준)
+        ts = match_timestamp(match)
+        ref = rating_history.match_ref(_match_dict_key(match))
+        rating_history.append_points([
+            _rating_point(ratings, player.lower(), ts, ref) for player in (player1, player2)
+        ])
+        
+        if board_current:
+            _update_leaderboard(ratings, {player1.lower(), player2.lower()})
+    
+    return deltas
+
+
+def update_ratings_from_matches(
+    matches: List[Dict[str, Any]],
+    streaks: Optional[StreakTracker] = None
+) -> int:
+    """
+    여러 매치를 시간순으로 Rating에 반영 (Rating 파일 로드/저장 1회)
+    전체 Rating과 게임별 래더를 같은 패스에서 함께 갱신
+    streaks가 주어지면 연속 기록도 같은 시간순 루프에서 함께 쌓음 (전체 재계산용)
+    
+    Returns:
+        반영된 매치 수
+    """
+    applied = 0
+    changed: Set[str] = set()
+    changed_games: Set[Tuple[str, str]] = set()
+    points: List[Tuple[str, float, float, float, int]] = []
+    
+    with _history_lock:
+        board_current = _is_leaderboard_current()
+        games_current = _is_game_leaderboards_current()
+        ratings = load_player_ratings()
+        _backfill_round_records(ratings, matches)
+        game_ratings = load_game_ratings()
+        
+        for match in sorted(matches, key=match_sort_key):
+            player1 = match.get("player1", "")
+            player2 = match.get("player2", "")
+            
+            if player1 and player2:
+                played_date = match_played_date(match)
+                apply_rating_update(
+                    ratings, player1, match.get("score1", 0),
+                    player2, match.get("score2", 0), played_date
+                )
+                changed.add(player1.lower())
+                changed.add(player2.lower())
+                applied += 1
+                
+                game = _match_game(match)
+                if game:
+                    apply_rating_update(
+                        game_ratings.setdefault(game, {}), player1, match.get("score1", 0),
+                        player2, match.get("score2", 0), played_date
+                    )
+                    changed_games.add((game, player1.lower()))
+                    changed_games.add((game, player2.lower()))
+                
+                # Rating 시계열 기록 (매치 시각 기준, 날짜 파싱 실패 시 현재 시각)
+                timeline_ts = _timeline_timestamp(match)
+                ts = timeline_ts if timeline_ts != float("-inf") else time.time()
+                ref = rating_history.match_ref(_match_dict_key(match))
+                points.append(_rating_point(ratings, player1.lower(), ts, ref))
+                points.append(_rating_point(ratings, player2.lower(), ts, ref))
+                
+                if streaks is not None and player1.lower() != player2.lower():
+                    streaks.add_result(
+                        timeline_ts, player1.lower(), player2.lower(),
+                        match.get("score1", 0), match.get("score2", 0)
+                    )
+        
+        # 게임 매치가 없어도 게임별 Rating 파일을 함께 저장
+        # → 파일 시각이 히스토리보다 오래되면 재계산이 필요하다는 기준(ratings_need_rebuild)이 유지됨
+        save_player_ratings(ratings)
+        save_game_ratings(game_ratings)
+        rating_history.append_points(points)
+        
+        # 리더보드가 최신이었으면 바뀐 플레이어만 갱신
+        if board_current:
+            _update_leaderboard(ratings, changed)
+        if games_current:
+            _update_game_leaderboards(game_ratings, changed_games)
+    
+    return applied
+
+
+def _is_older_than_history(filepath: str) -> bool:
+    """파생 파일이 없거나 매치 히스토리 파일보다 먼저 저장되었는지"""
+    try:
+        return os.stat(filepath).st_mtime_ns < os.stat(MATCH_HISTORY_FILE).st_mtime_ns
+    except OSError:
+        return True
+
+
+def ratings_need_rebuild() -> bool:
+    """
+    Rating 파생 데이터를 히스토리 전체로 다시 계산해야 하는지 (앱 시작 시 확인)
+    - 전체 Rating 파일이 비어 있음
+    - 게임별 Rating 파일이 없거나 히스토리보다 오래됨 (게임별 래더 도입 전 데이터)
+    - Rating 시계열 로그가 없거나 비어 있음 (시계열 기록 도입 전 데이터)
+    """
+    if not os.path.exists(MATCH_HISTORY_FILE):
+        return False
+    stale = (
+        not load_player_ratings()
+        or _is_older_than_history(GAME_RATINGS_FILE)
+        or not os.path.exists(rating_history.RATING_HISTORY_FILE)
+        or os.path.getsize(rating_history.RATING_HISTORY_FILE) == 0
+    )
+    return stale and bool(load_match_history())
+
+
 def recalculate_all_ratings() -> int:
     """
     모든 매치 히스토리를 기반으로 Rating 재계산
@@ -581,67 +1557,626 @@ def recalculate_all_ratings() -> int:
     Returns:
         처리된 매치 수
     """
-    # Rating 초기화
-    save_player_ratings({})
-    
-    # 매치 히스토리 로드
-    history = load_match_history()
+    with _history_lock:
+        # 매치 히스토리 로드
+        history = load_match_history()
+        
+        # Rating/시계열 초기화 후 날짜순(오래된 것부터)으로 메모리에서 재계산, 저장은 1회
+        save_player_ratings({})
+        save_game_ratings({})
+        rating_history.reset_history()
+        
+        if not history:
+            return 0
+        
+        # 연속 기록도 같은 시간순 루프에서 재구성 (추가 순회/로드 없음)
+        streaks = StreakTracker(_timeline_timestamp)
+        update_ratings_from_matches(history, streaks)
+        _set_match_aggregate("streaks", streaks)
     
-    if not history:
-        return 0
+    return len(history)
+
+
+# =============================================================================
+# 리더보드 인덱스 (Rating 변경 시 증분 갱신)
+# =============================================================================
+_leaderboard_cache: Dict[str, Any] = {"version": None, "board": None}
+
+
+def _player_row(player_id: str, data: Dict[str, Any], stats: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    리더보드 행 생성
+    라운드 승/패는 Rating 데이터에 누적된 값을 사용 (구버전 데이터는 stats로 보완)
+    """
+    if stats is None:
+        stats = {"wins": data.get("wins", 0), "losses": data.get("losses", 0)}
     
-    # 날짜순 정렬 (오래된 것부터)
-    sorted_history = sorted(history, key=lambda x: x.get("date", ""))
+    win_rate = 0.0
+    if stats["wins"] + stats["losses"] > 0:
+        win_rate = (stats["wins"] / (stats["wins"] + stats["losses"])) * 100
     
-    # 각 매치마다 Rating 업데이트
-    for match in sorted_history:
-        player1 = match.get("player1", "")
-        player2 = match.get("player2", "")
-        score1 = match.get("score1", 0)
-        score2 = match.get("score2", 0)
+    return {
+        "user_id": player_id,
+        "rating": data.get("rating", DEFAULT_RATING),
+        "rd": data.get("rd", DEFAULT_RD),
+        "games": data.get("games", 0),
+        "wins": stats["wins"],
+        "losses": stats["losses"],
+        "win_rate": round(win_rate, 1),
+        "last_played": data.get("last_played")
+    }
+
+
+def _is_leaderboard_current() -> bool:
+    """메모리 리더보드가 현재 Rating 파일과 일치하는지"""
+    return (
+        _leaderboard_cache["board"] is not None
+        and _leaderboard_cache["version"] == _file_version(PLAYER_RATINGS_FILE)
+    )
+
+
+def _update_leaderboard(ratings: Dict[str, Dict[str, Any]], players: Set[str]) -> None:
+    """바뀐 플레이어만 리더보드에 재삽입 (_history_lock 보유 상태에서 호출)"""
+    board: Leaderboard = _leaderboard_cache["board"]
+    for player_id in players:
+        if player_id in ratings:
+            board.upsert(_player_row(player_id, ratings[player_id]))
+    _leaderboard_cache["version"] = _file_version(PLAYER_RATINGS_FILE)
+
+
+def get_leaderboard() -> Leaderboard:
+    """
+    리더보드 인덱스 조회
+    Rating 파일이 외부에서 바뀐 경우(복원/재계산 등)에만 전체 재구성
+    """
+    with _history_lock:
+        if _is_leaderboard_current():
+            return _leaderboard_cache["board"]
         
-        if player1 and player2:
-            update_ratings_from_match(player1, score1, player2, score2)
+        ratings = load_player_ratings()
+        
+        # 라운드 승/패가 없는 구버전 Rating 데이터는 히스토리 집계로 보완
+        total_stats = None
+        if any("wins" not in data for data in ratings.values()):
+            total_stats = get_player_total_stats()
+        
+        board = Leaderboard(min_games=MIN_GAMES_FOR_RANKING)
+        for player_id, data in ratings.items():
+            stats = None
+            if total_stats is not None:
+                stats = total_stats.get(player_id, {"wins": 0, "losses": 0, "games": 0})
+            board.upsert(_player_row(player_id, data, stats))
+        
+        _leaderboard_cache["version"] = _file_version(PLAYER_RATINGS_FILE)
+        _leaderboard_cache["board"] = board
+        return board
+
+
+# 게임별 리더보드 (게임 Rating 파일 버전 기준, 게임마다 첫 조회 시 구성)
+_game_leaderboard_cache: Dict[str, Any] = {"version": None, "boards": {}}
+
+
+def _is_game_leaderboards_current() -> bool:
+    """메모리 게임별 리더보드가 현재 게임 Rating 파일과 일치하는지"""
+    return _game_leaderboard_cache["version"] == _file_version(GAME_RATINGS_FILE)
+
+
+def _update_game_leaderboards(
+    game_ratings: Dict[str, Dict[str, Dict[str, Any]]],
+    changed: Set[Tuple[str, str]]
+) -> None:
+    """바뀐 (게임, 플레이어)만 이미 구성된 게임 리더보드에 재삽입 (_history_lock 보유 상태에서 호출)"""
+    boards: Dict[str, Leaderboard] = _game_leaderboard_cache["boards"]
+    for game, player_id in changed:
+        board = boards.get(game)
+        if board is not None:
+            board.upsert(_player_row(player_id, game_ratings[game][player_id]))
+    _game_leaderboard_cache["version"] = _file_version(GAME_RATINGS_FILE)
+
+
+def get_game_leaderboard(game: str) -> Leaderboard:
+    """게임별 리더보드 인덱스 조회 (게임 Rating 파일이 바뀐 경우에만 재구성)"""
+    with _history_lock:
+        if not _is_game_leaderboards_current():
+            _game_leaderboard_cache["version"] = _file_version(GAME_RATINGS_FILE)
+            _game_leaderboard_cache["boards"] = {}
+        
+        boards: Dict[str, Leaderboard] = _game_leaderboard_cache["boards"]
+        if game not in boards:
+            board = Leaderboard(min_games=MIN_GAMES_FOR_RANKING)
+            for player_id, data in load_game_ratings().get(game, {}).items():
+                board.upsert(_player_row(player_id, data))
+            boards[game] = board
+        
+        return boards[game]
+
+
+def get_rating_games() -> List[str]:
+    """게임별 래더가 있는 게임 목록 (정렬)"""
+    return sorted(load_game_ratings().keys())
+
+
+def get_rating_series(
+    player_id: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_points: int = 200
+) -> Dict[str, Any]:
+    """
+    플레이어 Rating 추이 (기간 필터 + 다운샘플링)
     
-    return len(sorted_history)
+    Returns:
+        {"ts": ndarray, "rating": ndarray, "rd": ndarray, "match_ref": ndarray, "total": int}
+    """
+    return rating_history.get_rating_series(
+        player_id,
+        start.timestamp() if start else None,
+        end.timestamp() if end else None,
+        max_points
+    )
+
+
+def get_rating_history_players() -> List[str]:
+    """Rating 추이 기록이 있는 플레이어 목록"""
+    return rating_history.get_players()
 
 
-def get_all_player_ratings() -> List[Dict[str, Any]]:
+def get_player_rank(player_id: str) -> Optional[int]:
+    """플레이어 순위 (랭킹 미반영이면 None), O(log n)"""
+    return get_leaderboard().rank_of(player_id)
+
+
+def get_all_player_ratings(
+    limit: Optional[int] = None,
+    offset: int = 0,
+    game: Optional[str] = None,
+    engine: str = ENGINE_ELO
+) -> List[Dict[str, Any]]:
     """
     모든 플레이어의 Rating 정보를 랭킹 순으로 반환
-    (최소 판수 미달은 제외)
+    (최소 판수 미달은 제외, 리더보드 인덱스에서 구간만 읽음)
+    
+    Args:
+        limit: 최대 인원 (None이면 전체)
+        offset: 시작 순위 오프셋 (0부터)
+        game: 게임별 래더 (None이면 전체 Rating)
+        engine: 랭킹 엔진 (ENGINE_ELO / ENGINE_BRADLEY_TERRY / ENGINE_GLICKO2)
     
     Returns:
         [{"user_id": str, "rating": float, "rd": float, "games": int, ...}, ...]
+        (Bradley-Terry는 rd가 None)
     """
-    ratings = load_player_ratings()
-    total_stats = get_player_total_stats()
+    if engine == ENGINE_BRADLEY_TERRY:
+        board = get_bradley_terry_leaderboard(game)
+    elif engine == ENGINE_GLICKO2:
+        board = get_glicko2_leaderboard(game)
+    elif engine == ENGINE_ELO:
+        board = get_leaderboard() if game is None else get_game_leaderboard(game)
+    else:
+        raise ValueError(f"알 수 없는 랭킹 엔진: {engine}")
+    return [dict(row) for row in board.top(limit, offset)]
+
+
+# =============================================================================
+# Bradley-Terry 랭킹 (쌍별 라운드 집계 일괄 적합)
+# =============================================================================
+_pair_tally_cache: Dict[str, Any] = {"version": None, "tallies": {}}
+_bt_cache: Dict[str, Any] = {"version": None, "boards": {}}
+
+
+def get_pair_round_tallies(game: Optional[str] = None) -> Dict[Tuple[str, str], List[int]]:
+    """
+    플레이어 쌍별 누적 라운드 집계 (히스토리 버전 + 게임별 캐시)
     
-    result = []
-    for player_id, data in ratings.items():
-        games = data.get("games", 0)
+    Returns:
+        {(a, b): [a 라운드 승, b 라운드 승, 매치 수]} (a < b, 소문자)
+    """
+    version = _file_version(MATCH_HISTORY_FILE)
+    if _pair_tally_cache["version"] != version:
+        _pair_tally_cache["version"] = version
+        _pair_tally_cache["tallies"] = {}
+    
+    if game is None and game not in _pair_tally_cache["tallies"]:
+        _pair_tally_cache["tallies"][None] = get_h2h_index().pair_tallies()
+    
+    if game not in _pair_tally_cache["tallies"]:
+        tallies: Dict[Tuple[str, str], List[int]] = {}
+        for m in load_match_history():
+            if _match_game(m) != game:
+                continue
+            p1 = m.get("player1", "").lower()
+            p2 = m.get("player2", "").lower()
+            if not p1 or not p2 or p1 == p2:
+                continue
+            s1 = m.get("score1", 0)
+            s2 = m.get("score2", 0)
+            
+            if p1 < p2:
+                tally = tallies.setdefault((p1, p2), [0, 0, 0])
+                tally[0] += s1
+                tally[1] += s2
+            else:
+                tally = tallies.setdefault((p2, p1), [0, 0, 0])
+                tally[0] += s2
+                tally[1] += s1
+            tally[2] += 1
+        _pair_tally_cache["tallies"][game] = tallies
+    
+    return _pair_tally_cache["tallies"][game]
+
+
+def _stats_from_tallies(tallies: Dict[Tuple[str, str], List[int]]) -> Dict[str, Dict[str, int]]:
+    """쌍별 집계를 플레이어별 라운드 승/패, 매치 수로 합산"""
+    stats: Dict[str, Dict[str, int]] = {}
+    for (a, b), (wins_a, wins_b, games) in tallies.items():
+        for player, won, lost in ((a, wins_a, wins_b), (b, wins_b, wins_a)):
+            entry = stats.setdefault(player, {"wins": 0, "losses": 0, "games": 0})
+            entry["wins"] += won
+            entry["losses"] += lost
+            entry["games"] += games
+    return stats
+
+
+def get_bradley_terry_leaderboard(game: Optional[str] = None) -> Leaderboard:
+    """
+    Bradley-Terry Rating 리더보드 (히스토리 버전 + 게임별 캐시)
+    매치 순서와 무관하게 전체 라운드 집계로 한 번에 적합
+    """
+    with _history_lock:
+        version = _file_version(MATCH_HISTORY_FILE)
+        if _bt_cache["version"] != version:
+            _bt_cache["version"] = version
+            _bt_cache["boards"] = {}
         
-        # 최소 판수 체크
-        if games < MIN_GAMES_FOR_RANKING:
-            continue
+        if game not in _bt_cache["boards"]:
+            tallies = get_pair_round_tallies(game)
+            ratings = bradley_terry.fit_ratings(tallies, base_rating=DEFAULT_RATING)
+            stats = _stats_from_tallies(tallies)
+            
+            board = Leaderboard(min_games=MIN_GAMES_FOR_RANKING)
+            for player_id, rating in ratings.items():
+                data = {"rating": rating, "rd": None, "games": stats[player_id]["games"]}
+                board.upsert(_player_row(player_id, data, stats[player_id]))
+            _bt_cache["boards"][game] = board
         
-        stats = total_stats.get(player_id, {"wins": 0, "losses": 0, "games": 0})
-        win_rate = 0.0
-        if stats["wins"] + stats["losses"] > 0:
-            win_rate = (stats["wins"] / (stats["wins"] + stats["losses"])) * 100
-        
-        result.append({
-            "user_id": player_id,
-            "rating": data.get("rating", DEFAULT_RATING),
-            "rd": data.get("rd", DEFAULT_RD),
-            "games": games,
-            "wins": stats["wins"],
-            "losses": stats["losses"],
-            "win_rate": round(win_rate, 1),
-            "last_played": data.get("last_played")
-        })
+        return _bt_cache["boards"][game]
+
+
+# =============================================================================
+# Glicko-2 랭킹 (레이팅 기간 단위 일괄 갱신)
+# =============================================================================
+_glicko2_cache: Dict[str, Any] = {"version": None, "boards": {}}
+
+
+def get_glicko2_leaderboard(game: Optional[str] = None) -> Leaderboard:
+    """
+    Glicko-2 Rating 리더보드 (히스토리 버전 + 현재 레이팅 기간 + 게임별 캐시)
+    - 매치를 GLICKO2_PERIOD_DAYS 단위 기간으로 묶어 기간마다 전체 플레이어를 한 번에 갱신
+    - RD가 GLICKO2_PROVISIONAL_RD보다 큰(경기 수가 적거나 오래 쉰) 플레이어는 제외
+    - 기간 기준점은 가장 이른 파싱된 날짜 (날짜 파싱 실패 매치는 첫 기간)
+    - 파싱된 날짜가 하나도 없으면 수집 순서로 GLICKO2_UNDATED_PERIOD_MATCHES개씩 기간 구분
+      (현재 시각과의 간격을 알 수 없으므로 이후 기간의 RD 증가 없음)
+    """
+    period_seconds = GLICKO2_PERIOD_DAYS * 86400
+    
+    with _history_lock:
+        timeline_ts, matches = _get_match_timeline()
+        # 타임라인은 시각 오름차순 → 첫 유한 시각이 가장 이른 파싱된 날짜
+        origin = next((ts for ts in timeline_ts if ts != float("-inf")), None)
+        current_period = int((time.time() - origin) // period_seconds) if origin is not None else 0
+        
+        # 경기가 없어도 기간이 바뀌면 RD가 커지므로 현재 기간도 캐시 키에 포함
+        version = f"{_file_version(MATCH_HISTORY_FILE)}|{current_period}"
+        if _glicko2_cache["version"] != version:
+            _glicko2_cache["version"] = version
+            _glicko2_cache["boards"] = {}
+        
+        if game not in _glicko2_cache["boards"]:
+            index: Dict[str, int] = {}
+            periods: List[int] = []
+            player_a: List[int] = []
+            player_b: List[int] = []
+            score_a: List[float] = []
+            stats: Dict[str, Dict[str, int]] = {}
+            last_played: Dict[str, str] = {}
+            
+            for ts, m in zip(timeline_ts, matches):
+                if game is not None and _match_game(m) != game:
+                    continue
+                p1 = m.get("player1", "").lower()
+                p2 = m.get("player2", "").lower()
+                if not p1 or not p2 or p1 == p2:
+                    continue
+                s1 = m.get("score1", 0)
+                s2 = m.get("score2", 0)
+                
+                if origin is None:
+                    periods.append(len(periods) // GLICKO2_UNDATED_PERIOD_MATCHES)
+                else:
+                    # 날짜 파싱 실패 매치는 첫 기간에 포함
+                    periods.append(int((ts - origin) // period_seconds) if ts != float("-inf") else 0)
+                player_a.append(index.setdefault(p1, len(index)))
+                player_b.append(index.setdefault(p2, len(index)))
+                score_a.append(1.0 if s1 > s2 else 0.0 if s1 < s2 else 0.5)
+                
+                for player, won, lost in ((p1, s1, s2), (p2, s2, s1)):
+                    entry = stats.setdefault(player, {"wins": 0, "losses": 0, "games": 0})
+                    entry["wins"] += won
+                    entry["losses"] += lost
+                    entry["games"] += 1
+                    last_played[player] = match_played_date(m)
+            
+            board = Leaderboard(min_games=MIN_GAMES_FOR_RANKING)
+            if index:
+                ratings, rds, _ = glicko2.fit_ratings(
+                    len(index), periods, player_a, player_b, score_a,
+                    base_rating=DEFAULT_RATING,
+                    base_rd=DEFAULT_RD,
+                    trailing_periods=max(0, current_period - periods[-1]) if origin is not None else 0
+                )
+                for player_id, idx in index.items():
+                    if rds[idx] > GLICKO2_PROVISIONAL_RD:
+                        continue
+                    data = {
+                        "rating": round(float(ratings[idx]), 1),
+                        "rd": round(float(rds[idx]), 1),
+                        "games": stats[player_id]["games"],
+                        "last_played": last_played[player_id]
+                    }
+                    board.upsert(_player_row(player_id, data, stats[player_id]))
+            _glicko2_cache["boards"][game] = board
+        
+        return _glicko2_cache["boards"][game]
+
+
+# =============================================================================
+# 과거 시점 랭킹 (메모리 Rating 스냅샷 + 부분 재생, 읽기 전용)
+# =============================================================================
+RATING_SNAPSHOT_INTERVAL = 500   # 스냅샷 간격 (매치 수)
+
+_timeline_cache: Dict[str, Any] = {"version": None, "ts": None, "matches": None}
+# 스냅샷: {"ts": 마지막 반영 매치 시각, "count": 반영된 매치 수, "key": 마지막 매치 키, "ratings": {...}}
+# (count 오름차순, 프로세스 메모리에만 보관 - 조회 경로에서 파일을 쓰지 않음)
+_snapshot_cache: Dict[str, Any] = {"snapshots": []}
+
+
+def _get_match_timeline() -> Tuple[List[float], List[Dict[str, Any]]]:
+    """
+    시간순 정렬된 매치 목록과 timestamp 목록 (히스토리 파일 버전 기준 캐시)
+    정렬 순서는 recalculate_all_ratings와 동일 (날짜 파싱 실패 매치가 가장 앞)
+    """
+    version = _file_version(MATCH_HISTORY_FILE)
+    if _timeline_cache["version"] != version:
+        keyed = [(_timeline_timestamp(match), match) for match in load_match_history()]
+        keyed.sort(key=lambda item: item[0])
+        
+        _timeline_cache["version"] = version
+        _timeline_cache["ts"] = [ts for ts, _ in keyed]
+        _timeline_cache["matches"] = [match for _, match in keyed]
+    
+    return _timeline_cache["ts"], _timeline_cache["matches"]
+
+
+def _valid_rating_snapshots(
+    snapshots: List[Dict[str, Any]],
+    timeline_ts: List[float],
+    matches: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    현재 히스토리와 맞는 스냅샷만 남김
+    스냅샷 시각 이전에 매치가 추가/삭제되었으면 그 스냅샷부터 이후는 모두 무효
+    """
+    valid = []
+    for snap in snapshots:
+        count = snap.get("count", 0)
+        if (
+            count <= 0
+            or bisect.bisect_right(timeline_ts, snap.get("ts", 0)) != count
+            or _match_dict_key(matches[count - 1]) != snap.get("key")
+        ):
+            break
+        valid.append(snap)
+    return valid
+
+
+def get_ratings_as_of(as_of: datetime) -> Dict[str, Dict[str, Any]]:
+    """
+    특정 시점의 전체 Rating 테이블 (해당 시각까지의 매치를 시간순으로 반영한 결과)
+    - 가장 가까운 이전 스냅샷에서 시작해 남은 매치만 메모리에서 재생
+    - 스냅샷이 없는 구간을 지나가면 간격마다 메모리 스냅샷 추가 (다음 조회부터 재사용)
+    - 파일은 읽기만 함 (player_ratings.json 포함 아무것도 쓰지 않음)
+    
+    Args:
+        as_of: 기준 시각 (이 시각에 치러진 매치까지 포함)
+    
+    Returns:
+        {플레이어 ID: {"rating", "rd", "games", "wins", "losses", "last_played"}}
+    """
+    target = as_of.timestamp()
     
-    # Rating 순 정렬 (내림차순)
-    result.sort(key=lambda x: (-x["rating"], -x["win_rate"], -x["games"]))
+    with _history_lock:
+        timeline_ts, matches = _get_match_timeline()
+        stored = _snapshot_cache["snapshots"]
+        snapshots = _valid_rating_snapshots(stored, timeline_ts, matches)
+        end = bisect.bisect_right(timeline_ts, target)
+        
+        # 기준 시점 이전의 가장 가까운 스냅샷
+        counts = [snap["count"] for snap in snapshots]
+        base_idx = bisect.bisect_right(counts, end) - 1
+        if base_idx >= 0:
+            # apply_rating_update는 플레이어 dict를 새로 만들어 넣으므로 얕은 복사로 충분
+            ratings = dict(snapshots[base_idx]["ratings"])
+            start = counts[base_idx]
+        else:
+            ratings = {}
+            start = 0
+        
+        last_count = counts[-1] if counts else 0
+        new_snapshots: List[Dict[str, Any]] = []
+        
+        for i in range(start, end):
+            match = matches[i]
+            player1 = match.get("player1", "")
+            player2 = match.get("player2", "")
+            if player1 and player2:
+                apply_rating_update(
+                    ratings, player1, match.get("score1", 0),
+                    player2, match.get("score2", 0), match_played_date(match)
+                )
+            
+            # 같은 시각의 매치 사이에서는 스냅샷을 만들지 않음 (시각 경계 = 매치 수 경계)
+            count = i + 1
+            if count - last_count >= RATING_SNAPSHOT_INTERVAL and (
+                count == len(matches) or timeline_ts[count] > timeline_ts[i]
+            ):
+                new_snapshots.append({
+                    "ts": timeline_ts[i],
+                    "count": count,
+                    "key": _match_dict_key(match),
+                    "ratings": dict(ratings)
+                })
+                last_count = count
+        
+        if new_snapshots or len(snapshots) != len(stored):
+            _snapshot_cache["snapshots"] = snapshots + new_snapshots
     
+    return ratings
+
+
+def get_all_player_ratings_as_of(
+    as_of: datetime,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    특정 시점의 랭킹 (get_all_player_ratings와 같은 형식, 최소 판수 미달 제외)
+    
+    Args:
+        as_of: 기준 시각
+        limit: 최대 인원 (None이면 전체)
+        offset: 시작 순위 오프셋 (0부터)
+    """
+    board = Leaderboard(min_games=MIN_GAMES_FOR_RANKING)
+    for player_id, data in get_ratings_as_of(as_of).items():
+        board.upsert(_player_row(player_id, data))
+    return board.top(limit, offset)
+
+
+# =============================================================================
+# 매치업 예측 (Rating 테이블 벡터화 + FT-N 세트 승률)
+# =============================================================================
+_rating_table_cache: Dict[str, Any] = {"key": None, "index": None, "ratings": None}
+
+
+def _get_rating_table(game: Optional[str] = None) -> Tuple[Dict[str, int], Any]:
+    """
+    플레이어 ID → 인덱스 + Rating 배열 (Rating 파일 버전 + 게임 기준 캐시)
+    배열 마지막 칸은 기록 없는 플레이어용 DEFAULT_RATING (인덱스 -1)
+    """
+    import numpy as np
+    
+    with _history_lock:
+        key = (game, _file_version(PLAYER_RATINGS_FILE if game is None else GAME_RATINGS_FILE))
+        if _rating_table_cache["key"] != key:
+            ratings = load_player_ratings() if game is None else load_game_ratings().get(game, {})
+            table = np.empty(len(ratings) + 1)
+            table[:-1] = [data.get("rating", DEFAULT_RATING) for data in ratings.values()]
+            table[-1] = DEFAULT_RATING
+            _rating_table_cache["key"] = key
+            _rating_table_cache["index"] = {player_id: i for i, player_id in enumerate(ratings)}
+            _rating_table_cache["ratings"] = table
+        return _rating_table_cache["index"], _rating_table_cache["ratings"]
+
+
+def _set_win_probability(round_prob: Any, first_to: Any) -> Any:
+    """
+    라운드 승률 p → FT-N(먼저 N라운드 승리) 세트 승률
+    상대가 k라운드(k < N)를 따낸 뒤 N번째 라운드를 이기는 경우의 합: Σ C(N-1+k, k) · p^N · (1-p)^k
+    같은 N끼리 묶어 배열 연산 (N=1이면 라운드 승률 그대로)
+    """
+    import numpy as np
+    
+    p = np.asarray(round_prob, dtype=np.float64)
+    n = np.asarray(first_to, dtype=np.int64)
+    
+    result = np.empty_like(p)
+    for target in np.unique(n):
+        target = int(target)
+        mask = n == target
+        k = np.arange(target)
+        coeff = np.array([math.comb(target - 1 + j, j) for j in range(target)], dtype=np.float64)
+        pm = p[mask]
+        result[mask] = pm ** target * (((1 - pm)[:, None] ** k) @ coeff)
     return result
+
+
+def _round_win_probability(set_prob: Any, first_to: int, iterations: int = 60) -> Any:
+    """
+    FT-N 세트 승률 → 라운드 승률 역산 (_set_win_probability의 역함수)
+    세트 승률은 라운드 승률에 대해 단조 증가 → 이분법 (배열 일괄)
+    """
+    import numpy as np
+    
+    target = np.asarray(set_prob, dtype=np.float64)
+    lo = np.zeros_like(target)
+    hi = np.ones_like(target)
+    n = np.full(target.shape, first_to, dtype=np.int64)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        below = _set_win_probability(mid, n) < target
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return (lo + hi) / 2
+
+
+def predict_matchups(
+    matchups: Iterable[Tuple[str, str, int]],
+    game: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    여러 매치업의 승리 확률 일괄 예측
+    Rating 배열에서 한 번에 조회 → Elo 기대 승률(매치 단위)을 FT{RATED_FIRST_TO} 세트 승률로 보고
+    라운드 승률을 역산한 뒤 요청한 FT-N 세트 승률로 변환 (FT{RATED_FIRST_TO}이면 Elo 기대 승률 그대로)
+    
+    Args:
+        matchups: [(player_a, player_b, first_to), ...] (first_to: FT3이면 3)
+        game: 게임별 래더 Rating 사용 (None이면 전체 Rating)
+    
+    Returns:
+        [{"player_a", "player_b", "first_to", "rating_a", "rating_b",
+          "round_win_prob" (역산한 추정 라운드 승률), "win_prob" (player_a 세트 승률)}, ...]
+        (Rating 기록이 없으면 DEFAULT_RATING)
+    """
+    import numpy as np
+    
+    matchups = list(matchups)
+    if not matchups:
+        return []
+    
+    first_to = np.fromiter((m[2] for m in matchups), dtype=np.int64, count=len(matchups))
+    if (first_to < 1).any():
+        raise ValueError("first_to는 1 이상이어야 합니다.")
+    
+    index, table = _get_rating_table(game)
+    idx_a = np.fromiter((index.get(m[0].lower(), -1) for m in matchups), dtype=np.int64, count=len(matchups))
+    idx_b = np.fromiter((index.get(m[1].lower(), -1) for m in matchups), dtype=np.int64, count=len(matchups))
+    rating_a = table[idx_a]
+    rating_b = table[idx_b]
+    
+    round_prob = _round_win_probability(expected_score(rating_a, rating_b), RATED_FIRST_TO)
+    win_prob = _set_win_probability(round_prob, first_to)
+    
+    return [
+        {
+            "player_a": player_a,
+            "player_b": player_b,
+            "first_to": int(n),
+            "rating_a": float(ra),
+            "rating_b": float(rb),
+            "round_win_prob": float(pr),
+            "win_prob": float(pw),
+        }
+        for (player_a, player_b, _), n, ra, rb, pr, pw in zip(
+            matchups, first_to, rating_a, rating_b, round_prob, win_prob
+        )
+    ]
@@ -0,0 +1,157 @@
+"""
+게임별 통계 집계 (증분 갱신)
+- 게임마다 매치 수, 라운드 수, 스코어 차이 합, 플레이어별 전적, 매치 타입(FT2/FT3...)별 분포
+- 매치 추가 시 해당 게임 항목만 갱신 → 렌더 시 히스토리를 다시 읽지 않음
+- dict 변환으로 JSON 저장/복원 가능
+"""
+
+import heapq
+from typing import List, Dict, Any, Iterable
+
+UNKNOWN_GAME = ""   # 게임 정보가 없는 매치
+
+
+def _new_entry() -> Dict[str, Any]:
+    return {
+        "matches": 0,
+        "rounds": 0,
+        "margin_sum": 0,
+        "players": {},       # 플레이어 ID → [매치 수, 라운드 승, 라운드 패]
+        "match_types": {},   # 매치 타입 → [매치 수, 라운드 수, 스코어 차이 합]
+    }
+
+
+class GameStats:
+    """게임별 통계 집계"""
+
+    def __init__(self):
+        self.games: Dict[str, Dict[str, Any]] = {}
+
+    def add_match(self, match: Dict[str, Any]) -> bool:
+        """매치 1건 반영 (플레이어 정보가 없어 건너뛰면 False)"""
+        p1 = match.get("player1", "").lower()
+        p2 = match.get("player2", "").lower()
+        if not p1 or not p2:
+            return False
+
+        s1 = match.get("score1", 0)
+        s2 = match.get("score2", 0)
+        game = (match.get("game") or UNKNOWN_GAME).strip()
+        match_type = (match.get("match_type") or "").strip()
+
+        entry = self.games.get(game)
+        if entry is None:
+            entry = self.games[game] = _new_entry()
+
+        entry["matches"] += 1
+        entry["rounds"] += s1 + s2
+        entry["margin_sum"] += abs(s1 - s2)
+
+        for player, won, lost in ((p1, s1, s2), (p2, s2, s1)):
+            record = entry["players"].setdefault(player, [0, 0, 0])
+            record[0] += 1
+            record[1] += won
+            record[2] += lost
+
+        type_record = entry["match_types"].setdefault(match_type, [0, 0, 0])
+        type_record[0] += 1
+        type_record[1] += s1 + s2
+        type_record[2] += abs(s1 - s2)
+        return True
+
+    def add_matches(self, matches: Iterable[Dict[str, Any]]) -> int:
+        """매치 dict 목록 반영 (반영한 매치 수 반환)"""
+        return sum(self.add_match(match) for match in matches)
+
+    # -------------------------------------------------------------------------
+    # 직렬화
+    # -------------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        return {"games": self.games}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameStats":
+        stats = cls()
+        games = data.get("games")
+        stats.games = games if isinstance(games, dict) else {}
+        return stats
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+    def summary(self, game: str) -> Dict[str, Any]:
+        """
+        게임 요약
+
+        Returns:
+            {"game", "matches", "rounds", "players", "avg_rounds", "avg_margin",
+             "match_types": [{"match_type", "matches", "share", "avg_rounds", "avg_margin"}, ...]}
+        """
+        entry = self.games.get(game) or _new_entry()
+        matches = entry["matches"]
+
+        match_types = [
+            {
+                "match_type": match_type,
+                "matches": count,
+                "share": round(count / matches * 100, 1) if matches else 0.0,
+                "avg_rounds": round(rounds / count, 2) if count else 0.0,
+                "avg_margin": round(margin / count, 2) if count else 0.0,
+            }
+            for match_type, (count, rounds, margin) in entry["match_types"].items()
+        ]
+        match_types.sort(key=lambda row: (-row["matches"], row["match_type"]))
+
+        return {
+            "game": game,
+            "matches": matches,
+            "rounds": entry["rounds"],
+            "players": len(entry["players"]),
+            "avg_rounds": round(entry["rounds"] / matches, 2) if matches else 0.0,
+            "avg_margin": round(entry["margin_sum"] / matches, 2) if matches else 0.0,
+            "match_types": match_types,
+        }
+
+    def overview(self) -> List[Dict[str, Any]]:
+        """전체 게임 요약 (매치 수 내림차순, 매치 타입 분포 제외)"""
+        rows = []
+        for game, entry in self.games.items():
+            matches = entry["matches"]
+            rows.append({
+                "game": game,
+                "matches": matches,
+                "rounds": entry["rounds"],
+                "players": len(entry["players"]),
+                "avg_margin": round(entry["margin_sum"] / matches, 2) if matches else 0.0,
+            })
+        rows.sort(key=lambda row: (-row["matches"], row["game"]))
+        return rows
+
+    def top_players(self, game: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        게임별 상위 플레이어 (매치 수 > 라운드 승 순, 상위 K명만 선택)
+
+        Returns:
+            [{"user_id", "matches", "wins", "losses", "win_rate"}, ...]
+        """
+        entry = self.games.get(game)
+        if entry is None:
+            return []
+
+        top = heapq.nlargest(
+            k,
+            entry["players"].items(),
+            key=lambda item: (item[1][0], item[1][1])
+        )
+
+        rows = []
+        for user_id, (matches, wins, losses) in top:
+            rounds = wins + losses
+            rows.append({
+                "user_id": user_id,
+                "matches": matches,
+                "wins": wins,
+                "losses": losses,
+                "win_rate": round(wins / rounds * 100, 1) if rounds else 0.0,
+            })
+        return rows
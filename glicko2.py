@@ -0,0 +1,160 @@
+"""
+Glicko-2 랭킹 엔진 (레이팅 기간 단위 일괄 갱신)
+- 매치를 레이팅 기간(기본 7일)으로 묶고, 기간 안의 모든 플레이어를 NumPy 배열 연산으로 한 번에 갱신
+- 기간 중 상대의 Rating/RD는 기간 시작 값 사용 (Glicko-2 원 논문 방식)
+- 변동성(σ) 갱신의 근 찾기(Illinois 법)도 플레이어 축으로 벡터화
+- 경기가 없는 기간에는 RD가 커짐 → 오래 쉬면 다시 불확실해짐
+
+참고: Glickman, "Example of the Glicko-2 system" (2013)
+"""
+
+import math
+from typing import Sequence, Tuple, Any
+
+GLICKO2_SCALE = 173.7178              # Glicko ↔ Glicko-2 척도 변환 상수
+GLICKO2_TAU = 0.5                     # 변동성 변화 제한 (작을수록 안정적)
+GLICKO2_DEFAULT_VOLATILITY = 0.06     # 초기 변동성
+GLICKO2_EPSILON = 1e-6                # 변동성 근 찾기 수렴 기준
+GLICKO2_MAX_ITER = 100                # 변동성 근 찾기 최대 반복
+
+
+def _g(phi: Any) -> Any:
+    """상대 RD에 따른 가중치 g(φ)"""
+    import numpy as np
+    return 1 / np.sqrt(1 + 3 * phi ** 2 / math.pi ** 2)
+
+
+def _update_volatility(sigma: Any, phi: Any, v: Any, delta: Any, tau: float) -> Any:
+    """
+    변동성 갱신 (Glickman step 5, Illinois 법) - 플레이어 배열 단위로 동시에 계산
+    """
+    import numpy as np
+
+    a = np.log(sigma ** 2)
+    phi2 = phi ** 2
+    delta2 = delta ** 2
+
+    def f(x):
+        ex = np.exp(x)
+        return ex * (delta2 - phi2 - v - ex) / (2 * (phi2 + v + ex) ** 2) - (x - a) / tau ** 2
+
+    # 초기 구간 [A, B]
+    big = delta2 > phi2 + v
+    B = np.where(big, np.log(np.where(big, delta2 - phi2 - v, 1.0)), a - tau)
+    need = ~big & (f(B) < 0)
+    k = 1
+    while need.any() and k < GLICKO2_MAX_ITER:
+        k += 1
+        B = np.where(need, a - k * tau, B)
+        need = need & (f(B) < 0)
+
+    A = a.copy()
+    fA = f(A)
+    fB = f(B)
+
+    for _ in range(GLICKO2_MAX_ITER):
+        active = np.abs(B - A) > GLICKO2_EPSILON
+        if not active.any():
+            break
+        C = A + (A - B) * fA / np.where(fB != fA, fB - fA, 1.0)
+        fC = f(C)
+        swap = fC * fB <= 0
+        A = np.where(active & swap, B, A)
+        fA = np.where(active & swap, fB, np.where(active, fA / 2, fA))
+        B = np.where(active, C, B)
+        fB = np.where(active, fC, fB)
+
+    return np.exp(A / 2)
+
+
+def fit_ratings(
+    num_players: int,
+    period: Sequence[int],
+    player_a: Sequence[int],
+    player_b: Sequence[int],
+    score_a: Sequence[float],
+    base_rating: float,
+    base_rd: float,
+    trailing_periods: int = 0,
+    tau: float = GLICKO2_TAU
+) -> Tuple[Any, Any, Any]:
+    """
+    전체 매치를 레이팅 기간 순서대로 적용한 Glicko-2 Rating
+
+    Args:
+        num_players: 플레이어 수 (인덱스 0..n-1)
+        period: 매치별 레이팅 기간 번호 (오름차순)
+        player_a, player_b: 매치별 플레이어 인덱스
+        score_a: 매치별 player_a 결과 (승 1, 패 0, 무 0.5)
+        base_rating, base_rd: 신규 플레이어 Rating/RD (Glicko 척도)
+        trailing_periods: 마지막 기간 이후 현재까지 경기 없이 지난 기간 수 (RD 증가 반영)
+        tau: 변동성 변화 제한
+
+    Returns:
+        (Rating ndarray, RD ndarray, 변동성 ndarray) - Glicko 척도
+    """
+    import numpy as np
+
+    period = np.asarray(period, dtype=np.int64)
+    pa = np.asarray(player_a, dtype=np.int64)
+    pb = np.asarray(player_b, dtype=np.int64)
+    sa = np.asarray(score_a, dtype=np.float64)
+
+    max_phi = base_rd / GLICKO2_SCALE
+    mu = np.zeros(num_players)
+    phi = np.full(num_players, max_phi)
+    sigma = np.full(num_players, GLICKO2_DEFAULT_VOLATILITY)
+    started = np.zeros(num_players, dtype=bool)
+
+    # 기간 경계 (period가 정렬되어 있으므로 값이 바뀌는 위치)
+    boundaries = np.flatnonzero(np.diff(period)) + 1
+    starts = np.concatenate(([0], boundaries)) if len(period) else np.zeros(0, dtype=np.int64)
+    ends = np.concatenate((boundaries, [len(period)])) if len(period) else np.zeros(0, dtype=np.int64)
+    prev_period = int(period[0]) if len(period) else 0
+
+    for start, end in zip(starts, ends):
+        current = int(period[start])
+
+        # 건너뛴 빈 기간만큼 이미 등장한 플레이어의 RD 증가
+        idle = current - prev_period - 1
+        if idle > 0:
+            phi = np.where(started, np.minimum(np.sqrt(phi ** 2 + idle * sigma ** 2), max_phi), phi)
+        prev_period = current
+
+        # 양방향 관측 (i가 j를 상대로 s)
+        i = np.concatenate((pa[start:end], pb[start:end]))
+        j = np.concatenate((pb[start:end], pa[start:end]))
+        s = np.concatenate((sa[start:end], 1 - sa[start:end]))
+
+        g_j = _g(phi[j])
+        expected = 1 / (1 + np.exp(-g_j * (mu[i] - mu[j])))
+
+        info = np.bincount(i, weights=g_j ** 2 * expected * (1 - expected), minlength=num_players)
+        gain = np.bincount(i, weights=g_j * (s - expected), minlength=num_players)
+        played = info > 0
+
+        # 이번 기간에 경기한 플레이어: 전체 Glicko-2 갱신
+        v = 1 / info[played]
+        delta = v * gain[played]
+        new_sigma = _update_volatility(sigma[played], phi[played], v, delta, tau)
+        phi_star = np.sqrt(phi[played] ** 2 + new_sigma ** 2)
+        new_phi = 1 / np.sqrt(1 / phi_star ** 2 + 1 / v)
+        new_mu = mu[played] + new_phi ** 2 * gain[played]
+
+        # 경기하지 않은 기존 플레이어: RD만 증가
+        resting = started & ~played
+        phi[resting] = np.minimum(np.sqrt(phi[resting] ** 2 + sigma[resting] ** 2), max_phi)
+
+        mu[played] = new_mu
+        phi[played] = new_phi
+        sigma[played] = new_sigma
+        started |= played
+
+    if trailing_periods > 0:
+        phi = np.where(
+            started,
+            np.minimum(np.sqrt(phi ** 2 + trailing_periods * sigma ** 2), max_phi),
+            phi
+        )
+
+    return base_rating + GLICKO2_SCALE * mu, GLICKO2_SCALE * phi, sigma
@@ -0,0 +1,111 @@
+"""
+상대 전적 행렬 (희소, 증분 갱신)
+- 플레이어 ID를 정수로 인턴하고 행마다 {상대 인덱스: [내 라운드 승, 상대 라운드 승, 매치 수]} 보관
+- 양방향으로 저장하므로 "한 명 vs 전체" 조회는 그 플레이어의 상대 수만큼만 읽음
+- 히스토리 한 번 순회로 구성, 매치 추가 시 해당 쌍만 갱신
+"""
+
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+
+
+class HeadToHeadMatrix:
+    """플레이어 쌍별 라운드 집계 (dict-of-dicts 희소 행렬)"""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.rows: List[Dict[int, List[int]]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _intern(self, user_id: str) -> int:
+        """플레이어 ID → 인덱스 (처음 보는 ID면 행 추가)"""
+        idx = self.index.get(user_id)
+        if idx is None:
+            idx = len(self.ids)
+            self.index[user_id] = idx
+            self.ids.append(user_id)
+            self.rows.append({})
+        return idx
+
+    def add_match(self, player1: str, score1: int, player2: str, score2: int) -> None:
+        """매치 1건 반영 (대소문자 무시, 자기 자신과의 매치는 무시)"""
+        p1 = player1.lower()
+        p2 = player2.lower()
+        if not p1 or not p2 or p1 == p2:
+            return
+
+        i = self._intern(p1)
+        j = self._intern(p2)
+
+        forward = self.rows[i].setdefault(j, [0, 0, 0])
+        forward[0] += score1
+        forward[1] += score2
+        forward[2] += 1
+
+        backward = self.rows[j].setdefault(i, [0, 0, 0])
+        backward[0] += score2
+        backward[1] += score1
+        backward[2] += 1
+
+    def add_matches(self, matches: Iterable[Dict[str, Any]]) -> None:
+        """매치 dict 목록 반영"""
+        for m in matches:
+            self.add_match(
+                m.get("player1", ""), m.get("score1", 0),
+                m.get("player2", ""), m.get("score2", 0)
+            )
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+    def pair(self, player_a: str, player_b: str) -> Optional[List[int]]:
+        """두 플레이어 전적 [a 라운드 승, b 라운드 승, 매치 수] (대전 기록 없으면 None)"""
+        i = self.index.get(player_a.lower())
+        j = self.index.get(player_b.lower())
+        if i is None or j is None:
+            return None
+        return self.rows[i].get(j)
+
+    def opponents(self, player_id: str) -> List[Tuple[str, List[int]]]:
+        """한 플레이어의 상대별 전적 [(상대 ID, [내 승, 상대 승, 매치 수]), ...]"""
+        i = self.index.get(player_id.lower())
+        if i is None:
+            return []
+        return [(self.ids[j], tally) for j, tally in self.rows[i].items()]
+
+    def submatrix(self, players: Iterable[str]) -> Dict[str, Dict[str, List[int]]]:
+        """
+        주어진 플레이어끼리의 전적 (대전 기록이 있는 쌍만)
+
+        Returns:
+            {a: {b: [a 승, b 승, 매치 수]}} (요청한 ID 기준 소문자)
+        """
+        wanted: Dict[int, str] = {}
+        for player_id in players:
+            idx = self.index.get(player_id.lower())
+            if idx is not None:
+                wanted[idx] = self.ids[idx]
+
+        result: Dict[str, Dict[str, List[int]]] = {}
+        for i, user_id in wanted.items():
+            row = self.rows[i]
+            # 행과 요청 집합 중 작은 쪽을 순회
+            if len(row) <= len(wanted):
+                cells = {wanted[j]: tally for j, tally in row.items() if j in wanted}
+            else:
+                cells = {wanted[j]: row[j] for j in wanted if j in row}
+            result[user_id] = cells
+        return result
+
+    def pair_tallies(self) -> Dict[Tuple[str, str], List[int]]:
+        """쌍마다 한 번씩 {(a, b): [a 승, b 승, 매치 수]} (a < b)"""
+        tallies: Dict[Tuple[str, str], List[int]] = {}
+        for i, row in enumerate(self.rows):
+            a = self.ids[i]
+            for j, tally in row.items():
+                b = self.ids[j]
+                if a < b:
+                    tallies[(a, b)] = list(tally)
+        return tallies
@@ -0,0 +1,119 @@
+"""
+백그라운드 매치 저장 워커
+- 1사분면 "승률 추출" 시 매치 저장 + Rating 반영을 큐에 넣고 즉시 반환
+- 워커 스레드가 여러 세션에서 들어온 작업을 모아 한 번에 저장 (그룹 커밋)
+"""
+
+import time
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import List, Any, Optional
+
+from data_manager import ingest_match_batches
+
+# =============================================================================
+# 워커 설정
+# =============================================================================
+INGEST_BATCH_WINDOW = 0.2    # 첫 작업 도착 후 추가 작업을 기다리는 시간 (초)
+INGEST_BATCH_MAX = 32        # 한 번에 커밋할 최대 작업 수
+
+
+@dataclass
+class IngestJob:
+    """저장 작업 (세션별 진행 상태 확인용)"""
+    matches: List[Any]
+    added: int = 0
+    skipped: int = 0
+    error: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+    def is_done(self) -> bool:
+        return self.done.is_set()
+
+
+_queue: "queue.Queue[IngestJob]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+# =============================================================================
+# 워커 루프
+# =============================================================================
+def _collect_batch() -> List[IngestJob]:
+    """첫 작업을 기다린 뒤 배치 윈도우 동안 도착한 작업을 모음"""
+    jobs = [_queue.get()]
+    deadline = time.monotonic() + INGEST_BATCH_WINDOW
+
+    while len(jobs) < INGEST_BATCH_MAX:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            jobs.append(_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+
+    return jobs
+
+
+def _worker_loop() -> None:
+    """작업 배치를 그룹 커밋"""
+    while True:
+        jobs = _collect_batch()
+
+        try:
+            results = ingest_match_batches([job.matches for job in jobs])
+            for job, (added, skipped) in zip(jobs, results):
+                job.added = added
+                job.skipped = skipped
+        except Exception as e:
+            for job in jobs:
+                job.error = str(e)
+        finally:
+            for job in jobs:
+                job.done.set()
+                _queue.task_done()
+
+
+def _ensure_worker() -> None:
+    """워커 스레드 시작 (프로세스당 1개)"""
+    global _worker
+
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_worker_loop, name="ingest-worker", daemon=True)
+            _worker.start()
+
+
+# =============================================================================
+# 공개 API
+# =============================================================================
+def submit_matches(matches: List[Any]) -> IngestJob:
+    """매치 저장 작업을 큐에 추가하고 즉시 반환"""
+    _ensure_worker()
+    job = IngestJob(matches=list(matches))
+    _queue.put(job)
+    return job
+
+
+def get_pending_count() -> int:
+    """대기 중인 작업 수 (근사값)"""
+    return _queue.qsize()
+
+
+def wait_until_idle(timeout: Optional[float] = None) -> bool:
+    """
+    큐의 모든 작업이 끝날 때까지 대기 (스크립트/종료 처리용)
+
+    Returns:
+        timeout 내에 완료되었는지 여부
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    while _queue.unfinished_tasks:
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+    return True
@@ -0,0 +1,200 @@
+"""
+리더보드 인덱스 (증분 갱신)
+- (-rating, -win_rate, -games, user_id) 키를 블록 단위 정렬 리스트(_BlockedSortedList)로 유지
+- Rating이 바뀐 플레이어만 제거/재삽입 → 블록 하나만 이동 (전체 리스트 memmove 없음)
+- 순위 조회는 블록 길이 Fenwick 트리 합 + 블록 내 이진 탐색 O(log n), 상위 K명 조회 O(log n + K)
+"""
+
+import bisect
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+
+SortKey = Tuple[float, float, int, str]
+
+BLOCK_LOAD = 256    # 블록 기준 크기 (2배를 넘으면 분할)
+
+
+class _BlockedSortedList:
+    """
+    정렬 리스트를 작은 블록들로 나눠 보관 (sortedcontainers.SortedList와 같은 방식)
+    - 삽입/삭제 시 해당 블록만 이동하고, 블록 최댓값 목록으로 블록 위치를 이진 탐색
+    - 블록 길이는 Fenwick 트리로 유지 → 앞 블록 길이 합 / 위치 → 블록 변환 O(log 블록 수)
+      (블록 분할/삭제 때만 트리를 다시 만듦, 최소 BLOCK_LOAD번 삽입마다 1회)
+    """
+
+    def __init__(self, load: int = BLOCK_LOAD):
+        self.load = load
+        self.blocks: List[List[Any]] = []
+        self.maxes: List[Any] = []
+        self.tree: List[int] = [0]      # 블록 길이 Fenwick 트리 (1부터)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        for block in self.blocks:
+            yield from block
+
+    # -------------------------------------------------------------------------
+    # 블록 길이 Fenwick 트리
+    # -------------------------------------------------------------------------
+    def _rebuild_tree(self) -> None:
+        """블록 구성이 바뀌었을 때 트리 재구성 O(블록 수)"""
+        tree = [0] + [len(block) for block in self.blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _tree_add(self, block_idx: int, delta: int) -> None:
+        i = block_idx + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, block_idx: int) -> int:
+        """앞쪽 block_idx개 블록의 길이 합"""
+        total = 0
+        i = block_idx
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, pos: int) -> Tuple[int, int]:
+        """위치 → (블록 번호, 블록 내 위치) (pos < size)"""
+        idx = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = idx + step
+            if nxt < len(self.tree) and self.tree[nxt] <= pos:
+                idx = nxt
+                pos -= self.tree[nxt]
+            step >>= 1
+        return idx, pos
+
+    # -------------------------------------------------------------------------
+    # 삽입 / 삭제 / 조회
+    # -------------------------------------------------------------------------
+    def add(self, key: Any) -> None:
+        self.size += 1
+        if not self.blocks:
+            self.blocks.append([key])
+            self.maxes.append(key)
+            self._rebuild_tree()
+            return
+
+        i = bisect.bisect_left(self.maxes, key)
+        if i == len(self.maxes):
+            i -= 1
+            self.blocks[i].append(key)
+            self.maxes[i] = key
+        else:
+            bisect.insort(self.blocks[i], key)
+
+        block = self.blocks[i]
+        if len(block) > 2 * self.load:
+            # 블록 분할
+            half = block[self.load:]
+            del block[self.load:]
+            self.blocks.insert(i + 1, half)
+            self.maxes[i] = block[-1]
+            self.maxes.insert(i + 1, half[-1])
+            self._rebuild_tree()
+        else:
+            self._tree_add(i, 1)
+
+    def remove(self, key: Any) -> None:
+        """키 제거 (반드시 존재하는 키)"""
+        i = bisect.bisect_left(self.maxes, key)
+        block = self.blocks[i]
+        del block[bisect.bisect_left(block, key)]
+        self.size -= 1
+        if block:
+            self.maxes[i] = block[-1]
+            self._tree_add(i, -1)
+        else:
+            del self.blocks[i]
+            del self.maxes[i]
+            self._rebuild_tree()
+
+    def index(self, key: Any) -> int:
+        """키의 위치 (0부터, 반드시 존재하는 키)"""
+        i = bisect.bisect_left(self.maxes, key)
+        return self._prefix(i) + bisect.bisect_left(self.blocks[i], key)
+
+    def slice(self, start: int, stop: Optional[int] = None) -> List[Any]:
+        """[start, stop) 위치의 키 목록 (시작 블록은 트리로 찾음)"""
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return []
+
+        i, offset = self._locate(start)
+        result: List[Any] = []
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self.blocks[i][offset:offset + remaining]
+            result.extend(chunk)
+            remaining -= len(chunk)
+            i += 1
+            offset = 0
+        return result
+
+
+def _sort_key(row: Dict[str, Any]) -> SortKey:
+    """정렬 키 (Rating > 승률 > 판수 내림차순, 동률은 ID순)"""
+    return (-row["rating"], -row["win_rate"], -row["games"], row["user_id"])
+
+
+class Leaderboard:
+    """정렬된 랭킹 인덱스"""
+
+    def __init__(self, min_games: int = 0):
+        self.min_games = min_games
+        self._keys = _BlockedSortedList()
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._key_of: Dict[str, SortKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """
+        플레이어 행 추가/갱신
+        최소 판수 미달이면 리더보드에서 제외
+        """
+        user_id = row["user_id"]
+        self.remove(user_id)
+
+        if row["games"] < self.min_games:
+            return
+
+        key = _sort_key(row)
+        self._keys.add(key)
+        self._rows[user_id] = row
+        self._key_of[user_id] = key
+
+    def remove(self, user_id: str) -> None:
+        """플레이어 제거 (없으면 무시)"""
+        key = self._key_of.pop(user_id, None)
+        if key is None:
+            return
+        self._keys.remove(key)
+        del self._rows[user_id]
+
+    def rank_of(self, user_id: str) -> Optional[int]:
+        """순위 (1부터, 리더보드에 없으면 None)"""
+        key = self._key_of.get(user_id.lower())
+        if key is None:
+            return None
+        return self._keys.index(key) + 1
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """플레이어 행"""
+        return self._rows.get(user_id.lower())
+
+    def top(self, k: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """순위 구간 조회 (k=None이면 끝까지)"""
+        end = None if k is None else offset + k
+        return [self._rows[key[3]] for key in self._keys.slice(offset, end)]
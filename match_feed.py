@@ -0,0 +1,118 @@
+"""
+최근 매치 피드 (timestamp 인덱스 + 키셋 페이지네이션)
+- 매치마다 정렬 키 (timestamp, 순번)를 부여하고 전체 / 플레이어별 / 게임별 / 게임+플레이어별로 정렬된 키 목록 보관
+- 페이지 조회는 커서(직전 페이지 마지막 키) 위치를 이진 탐색 → 히스토리 크기와 무관하게 O(log n + 페이지 크기)
+- 순번은 히스토리 파일 내 위치 → 재구성해도 같은 매치는 같은 키 (저장해 둔 커서 유지)
+"""
+
+import bisect
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import List, Dict, Any, Optional, Callable, Iterable, Tuple
+
+FeedKey = Tuple[float, int]   # (timestamp, 순번) - 날짜를 알 수 없는 매치는 -inf
+
+
+def encode_cursor(key: FeedKey) -> str:
+    return f"{key[0]!r}:{key[1]}"
+
+
+def decode_cursor(cursor: str) -> FeedKey:
+    """커서 문자열 → 정렬 키 (형식이 잘못되면 ValueError)"""
+    ts, _, seq = cursor.rpartition(":")
+    return float(ts), int(seq)
+
+
+def _day_start(day: date) -> float:
+    """일자 시작 시각 (로컬) timestamp"""
+    return datetime.combine(day, dt_time.min).timestamp()
+
+
+class MatchFeed:
+    """필터별 시간순 키 인덱스"""
+
+    def __init__(self, timestamp: Callable[[Dict[str, Any]], float]):
+        """
+        Args:
+            timestamp: 매치 dict → 정렬용 Unix timestamp (날짜를 알 수 없으면 -inf)
+        """
+        self.timestamp = timestamp
+        self.matches: Dict[int, Dict[str, Any]] = {}     # 순번 → 매치 dict
+        self.indexes: Dict[Tuple[str, ...], List[FeedKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    @staticmethod
+    def _index_names(game: str, players: Iterable[str]) -> List[Tuple[str, ...]]:
+        names: List[Tuple[str, ...]] = [("all",), ("game", game)]
+        for player in players:
+            names.append(("player", player))
+            names.append(("game_player", game, player))
+        return names
+
+    def add_matches(self, matches: Iterable[Dict[str, Any]]) -> None:
+        """매치 dict 목록 반영 (히스토리 파일 순서대로 순번 부여)"""
+        for m in matches:
+            seq = len(self.matches)
+            self.matches[seq] = m
+            key = (self.timestamp(m), seq)
+            game = (m.get("game") or "").strip()
+            players = {m.get("player1", "").lower(), m.get("player2", "").lower()} - {""}
+
+            for name in self._index_names(game, players):
+                keys = self.indexes.get(name)
+                if keys is None:
+                    keys = self.indexes[name] = []
+                if not keys or key > keys[-1]:
+                    keys.append(key)
+                else:
+                    bisect.insort(keys, key)
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+    def page(
+        self,
+        player: Optional[str] = None,
+        game: Optional[str] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 20
+    ) -> Dict[str, Any]:
+        """
+        최신순 한 페이지
+
+        Args:
+            player: 플레이어 ID (대소문자 무시, None이면 전체)
+            game: 게임 (None이면 전체, ""는 게임 정보 없는 매치)
+            start, end: 기간 (양 끝 포함, None이면 제한 없음)
+            cursor: 직전 페이지의 next_cursor (None이면 첫 페이지)
+            page_size: 페이지 크기
+
+        Returns:
+            {"matches": [매치 dict, ...], "next_cursor": str | None}
+        """
+        if player and game is not None:
+            name: Tuple[str, ...] = ("game_player", game.strip(), player.lower())
+        elif player:
+            name = ("player", player.lower())
+        elif game is not None:
+            name = ("game", game.strip())
+        else:
+            name = ("all",)
+        keys = self.indexes.get(name, [])
+
+        lo = bisect.bisect_left(keys, (_day_start(start), -1)) if start else 0
+        hi = len(keys)
+        if end:
+            hi = bisect.bisect_left(keys, (_day_start(end + timedelta(days=1)), -1))
+        if cursor:
+            hi = min(hi, bisect.bisect_left(keys, decode_cursor(cursor)))
+
+        first = max(lo, hi - page_size)
+        page_keys = keys[first:hi][::-1]
+        return {
+            "matches": [self.matches[seq] for _, seq in page_keys],
+            "next_cursor": encode_cursor(page_keys[-1]) if page_keys and first > lo else None,
+        }
@@ -7,16 +7,17 @@
 import re
 import io
 import base64
-from typing import List, Tuple, Optional
+import importlib.util
+from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 import streamlit as st
 import streamlit.components.v1 as components
 
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from data_manager import check_badmanner_bulk, get_pair_streak
+from streaks import streak_label
+
+# PIL은 이미지 생성 시점에 임포트 (앱 콜드 스타트 단축)
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
 
 # =============================================================================
@@ -173,14 +174,40 @@ def _find_original_case(matches: List[MatchResult], player_lower: str) -> str:
     return player_lower
 
 
+def get_summary_badmanner(summary: HeadToHeadSummary) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    파싱된 매치에 등장한 모든 플레이어의 비매너 여부 (일괄 조회)
+    
+    Returns:
+        {"소문자 user_id": 비매너 엔트리 또는 None}
+    """
+    players = {summary.player_a, summary.player_b}
+    for m in summary.matches:
+        players.add(m.player1)
+        players.add(m.player2)
+    return check_badmanner_bulk(players)
+
+
 # =============================================================================
 # 이미지 생성
 # =============================================================================
-def create_result_image(summary: HeadToHeadSummary) -> Optional[bytes]:
-    """승률 결과 이미지 생성 (작은 크기)"""
+_FORM_FLIP = str.maketrans("WL", "LW")   # 폼 문자열 상대 기준 변환
+
+
+def create_result_image(
+    summary: HeadToHeadSummary,
+    badmanner_flags: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    pair_streak: Optional[Dict[str, Any]] = None
+) -> Optional[bytes]:
+    """
+    승률 결과 이미지 생성 (작은 크기, 비매너 유저는 이름 아래 표시)
+    pair_streak(player_a 기준 맞대결 연속 기록)이 있으면 승률 아래에 연승/연패 + 최근 폼 표시
+    """
     if not PIL_AVAILABLE:
         return None
     
+    from PIL import Image, ImageDraw, ImageFont
+    
     # 이미지 크기 (작게 조정)
     width, height = 500, 200
     bg_color = (26, 26, 46)
@@ -230,6 +257,22 @@ def create_result_image(summary: HeadToHeadSummary) -> Optional[bytes]:
     draw.text((420, 55), f"{b_prefix}{summary.player_b}", fill=b_color, font=font_small, anchor="mm")
     draw.text((420, 110), f"{b_rate:.1f}%", fill=b_color, font=font_medium, anchor="mm")
     
+    # 비매너 표시
+    if badmanner_flags:
+        if badmanner_flags.get(summary.player_a.lower()):
+            draw.text((80, 77), "BAD MANNER", fill=red, font=font_small, anchor="mm")
+        if badmanner_flags.get(summary.player_b.lower()):
+            draw.text((420, 77), "BAD MANNER", fill=red, font=font_small, anchor="mm")
+    
+    # 맞대결 연승/연패 + 최근 폼 (저장된 전체 기록 기준)
+    if pair_streak and pair_streak["matches"]:
+        current = pair_streak["current"]
+        form = pair_streak["form"]
+        a_form = f"{streak_label(current)}  {form}"
+        b_form = f"{streak_label(-current)}  {form.translate(_FORM_FLIP)}"
+        draw.text((80, 131), a_form, fill=green if current > 0 else gray, font=font_small, anchor="mm")
+        draw.text((420, 131), b_form, fill=green if current < 0 else gray, font=font_small, anchor="mm")
+    
     # 승률 바
     bar_y = 145
     bar_height = 18
@@ -310,29 +353,66 @@ def render_quadrant_1():
                     st.session_state.result_image = None
                 else:
                     st.session_state.search_result = summary
-                    img_bytes = create_result_image(summary)
+                    img_bytes = create_result_image(summary, get_summary_badmanner(summary))
                     st.session_state.result_image = img_bytes
                     
-                    # 데이터 저장 (2사분면 랭킹용)
-                    from data_manager import save_match_data, update_ratings_from_match
-                    added, skipped = save_match_data(summary.matches)
-                    
-                    # Rating 업데이트 (새로 추가된 매치만)
-                    if added > 0:
-                        for match in summary.matches:
-                            update_ratings_from_match(
-                                match.player1, match.score1,
-                                match.player2, match.score2
-                            )
+                    # 데이터 저장 + Rating 반영은 백그라운드 워커에서 처리 (즉시 반환)
+                    from ingest_worker import submit_matches
+                    st.session_state.ingest_job = submit_matches(summary.matches)
                     
                     # 입력 텍스트 초기화 (키 버전 증가)
                     st.session_state.input_key_version += 1
                     
-                    st.rerun()
+                    # 앱 전체 rerun → 헤더의 저장 상태 폴링 시작
+                    st.rerun(scope="app")
             else:
                 st.warning("텍스트를 입력해주세요.")
 
 
+# =============================================================================
+# 백그라운드 저장 상태
+# =============================================================================
+def render_ingest_status():
+    """
+    백그라운드 저장 상태 표시 (app.py 최상위에서 호출)
+    진행 중인 작업이 있을 때만 폴링 fragment를 실행
+    """
+    message = st.session_state.pop("ingest_message", None)
+    if message:
+        st.toast(message)
+    
+    if st.session_state.get("ingest_job") is not None:
+        _poll_ingest_job()
+
+
+@st.fragment(run_every=1)
+def _poll_ingest_job():
+    """저장 완료 시 앱 전체 rerun → 2사분면 랭킹/헤더 갱신"""
+    job = st.session_state.get("ingest_job")
+    if job is None:
+        return
+    
+    if not job.is_done():
+        st.caption("⏳ 대전 기록 저장 중...")
+        return
+    
+    st.session_state.ingest_job = None
+    if job.error:
+        st.session_state.ingest_message = f"❌ 저장 실패: {job.error}"
+    else:
+        st.session_state.ingest_message = f"💾 {job.added}건 저장 (중복 {job.skipped}건)"
+        
+        # 저장된 기록까지 반영한 맞대결 연승/연패로 결과 이미지 갱신
+        summary = st.session_state.get("search_result")
+        if summary is not None:
+            st.session_state.result_image = create_result_image(
+                summary,
+                get_summary_badmanner(summary),
+                get_pair_streak(summary.player_a, summary.player_b)
+            )
+    st.rerun(scope="app")
+
+
 def _display_result_image():
     """이미지 표시 + 복사 버튼"""
     
@@ -400,3 +480,9 @@ def _display_result_image():
     
     # 이미지 높이(200) + 여유 공간
     components.html(html_content, height=220, scrolling=False)
+    
+    # 비매너 유저 경고 (등장한 모든 플레이어 일괄 확인)
+    for user_id, entry in get_summary_badmanner(summary).items():
+        if entry:
+            reason_text = f" - {entry['reason']}" if entry.get("reason") else ""
+            st.warning(f"🚫 '{entry['user_id']}' 비매너 유저{reason_text}")
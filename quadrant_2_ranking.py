@@ -1,34 +1,58 @@
 """
 2사분면: 랭킹 시스템
 - 직접 대결 > 총 승수 기준 랭킹
+- 기간 랭킹 (최근 7일 / 30일 / 시즌)
 - 이미지로 표시 + 다운로드/복사 버튼
 """
 
 import io
+import html
 import base64
+from datetime import date, timedelta
+import importlib.util
+from typing import Optional, Tuple
 import streamlit as st
 import streamlit.components.v1 as components
 
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from ranking import calculate_ranking, calculate_window_ranking, get_ranking_label, get_window_ranking_label
+from data_manager import get_ratings_version, get_badmanner_version, get_rating_games, get_window_range
+from badmanner_index import SubstringIndex
+from streaks import streak_label
+
+# PIL은 이미지 생성 시점에 임포트 (앱 콜드 스타트 단축)
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+
+RANKING_PAGE_SIZE = 15   # 페이지당 표시 인원
+ALL_GAMES = ""   # 게임 선택: 전체 Rating
+
+# 랭킹 기간: 키 → (선택지 라벨, 이미지 제목)
+RANKING_PERIODS = {
+    "all": ("전체 (Elo)", "ELO RANKING"),
+    "7d": ("최근 7일", "WEEKLY RANKING"),
+    "30d": ("최근 30일", "MONTHLY RANKING"),
+    "season": ("시즌", "SEASON RANKING"),
+}
+SEASON_DEFAULT_DAYS = 90   # 시즌 기간 기본값 (오늘 기준 과거 일수)
 
-from ranking import calculate_ranking, get_ranking_label
+# 랭킹 뷰: (게임, 기간 키, 시작일 ISO, 종료일 ISO) - 캐시 키로 사용
+RankingView = Tuple[str, str, str, str]
+ALL_TIME_VIEW: RankingView = (ALL_GAMES, "all", "", "")
 
 
 # =============================================================================
 # 이미지 생성
 # =============================================================================
-def create_ranking_image(ranking_data: list) -> bytes:
-    """랭킹 이미지 생성 (Elo Rating 포함)"""
+def create_ranking_image(ranking_data: list, title: str = "ELO RANKING",
+                         footer: str = "Elo Rating System") -> bytes:
+    """랭킹 이미지 생성 (Elo Rating 포함, footer는 랭킹 기준/기간 표시)"""
     if not PIL_AVAILABLE or not ranking_data:
         return None
     
-    # 이미지 크기 (플레이어 수에 따라 조정)
-    num_players = min(len(ranking_data), 15)  # 최대 15명
-    width = 450
+    from PIL import Image, ImageDraw, ImageFont
+    
+    # 이미지 크기 (플레이어 수에 따라 조정, 한 페이지 분량만)
+    num_players = min(len(ranking_data), RANKING_PAGE_SIZE)
+    width = 500
     header_height = 50
     row_height = 35
     height = header_height + (num_players * row_height) + 30
@@ -55,9 +79,10 @@ def create_ranking_image(ranking_data: list) -> bytes:
     gray = (150, 150, 150)
     green = (78, 204, 163)
     cyan = (100, 200, 255)
+    red = (255, 107, 107)
     
     # 헤더
-    draw.text((width // 2, 25), "ELO RANKING", fill=gold, font=font_title, anchor="mm")
+    draw.text((width // 2, 25), title, fill=gold, font=font_title, anchor="mm")
     
     # 구분선
     draw.line([(20, header_height - 5), (width - 20, header_height - 5)], fill=(50, 50, 70), width=2)
@@ -68,7 +93,7 @@ def create_ranking_image(ranking_data: list) -> bytes:
         
         rank = entry["rank"]
         user_id = entry["user_id"]
-        rating = entry.get("rating", 1200)
+        rating = entry.get("rating")
         wins = entry["wins"]
         losses = entry["losses"]
         win_rate = entry.get("win_rate", 0)
@@ -86,11 +111,15 @@ def create_ranking_image(ranking_data: list) -> bytes:
         # 순위 (숫자)
         draw.text((30, y), f"{rank}.", fill=rank_color, font=font_row, anchor="mm")
         
-        # 유저 ID
-        draw.text((80, y), user_id[:12], fill=white, font=font_row, anchor="lm")
+        # 유저 ID (비매너 유저는 빨간색 + "!" 표시)
+        if entry.get("badmanner"):
+            draw.text((62, y), "!", fill=red, font=font_row, anchor="mm")
+            draw.text((80, y), user_id[:12], fill=red, font=font_row, anchor="lm")
+        else:
+            draw.text((80, y), user_id[:12], fill=white, font=font_row, anchor="lm")
         
-        # Rating
-        rating_text = f"{int(rating)}"
+        # Rating (기간 랭킹은 Rating 대신 판수)
+        rating_text = f"{int(rating)}" if rating is not None else f"{entry['games']}G"
         draw.text((230, y), rating_text, fill=cyan, font=font_row, anchor="mm")
         
         # 전적 (W:L)
@@ -100,9 +129,14 @@ def create_ranking_image(ranking_data: list) -> bytes:
         # 승률
         rate_text = f"{win_rate:.1f}%"
         draw.text((400, y), rate_text, fill=gray, font=font_small, anchor="mm")
+        
+        # 현재 연승/연패
+        streak = entry.get("streak", 0)
+        streak_color = green if streak > 0 else red if streak < 0 else gray
+        draw.text((460, y), streak_label(streak), fill=streak_color, font=font_small, anchor="mm")
     
     # 푸터
-    draw.text((width // 2, height - 12), "Elo Rating System", fill=gray, font=font_small, anchor="mm")
+    draw.text((width // 2, height - 12), footer, fill=gray, font=font_small, anchor="mm")
     
     img_bytes = io.BytesIO()
     img.save(img_bytes, format='PNG')
@@ -112,6 +146,75 @@ def create_ranking_image(ranking_data: list) -> bytes:
     return result
 
 
+# =============================================================================
+# 랭킹 뷰 캐시
+# =============================================================================
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_ranking(ratings_version: str, badmanner_version: str,
+                   view: RankingView = ALL_TIME_VIEW) -> list:
+    """
+    랭킹 데이터 (Rating/히스토리/비매너 리스트 버전 + 뷰별 캐시)
+    다른 사분면 조작으로 앱이 다시 실행되어도 데이터가 같으면 재계산하지 않음
+    """
+    game, period, start, end = view
+    if period == "all":
+        ranking_data = calculate_ranking(game=game or None)
+    else:
+        ranking_data = calculate_window_ranking(
+            date.fromisoformat(start), date.fromisoformat(end), window=period
+        )
+    return ranking_data
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _ranking_search_index(ratings_version: str, badmanner_version: str,
+                          view: RankingView = ALL_TIME_VIEW) -> SubstringIndex:
+    """랭킹 ID 트라이그램 인덱스 (랭킹과 같은 키, 복사 없이 공유)"""
+    ranking_data = _build_ranking(ratings_version, badmanner_version, view)
+    return SubstringIndex([entry["user_id"] for entry in ranking_data])
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _get_rating_games(ratings_version: str) -> list:
+    """게임별 래더 목록 (Rating 버전별 캐시)"""
+    return get_rating_games()
+
+
+def _filter_ranking(ratings_version: str, badmanner_version: str, query: str,
+                    view: RankingView = ALL_TIME_VIEW) -> list:
+    """ID 부분 문자열로 랭킹 필터 (트라이그램 인덱스 후보만 확인, 순위는 전체 기준 유지)"""
+    ranking_data = _build_ranking(ratings_version, badmanner_version, view)
+    if not query.strip():
+        return ranking_data
+    index = _ranking_search_index(ratings_version, badmanner_version, view)
+    return [ranking_data[pos] for pos in index.find(query)]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_ranking_page_image(ratings_version: str, badmanner_version: str,
+                              query: str, page: int,
+                              view: RankingView = ALL_TIME_VIEW) -> Optional[bytes]:
+    """페이지 단위 랭킹 이미지 (버전 + 뷰 + 필터 + 페이지별 캐시)"""
+    rows = _filter_ranking(ratings_version, badmanner_version, query, view)
+    start = (page - 1) * RANKING_PAGE_SIZE
+    game, period, _, _ = view
+    if period == "all" and game:
+        title = f"{game.upper()[:20]} RANKING"
+    else:
+        title = RANKING_PERIODS[period][1]
+    footer = "Elo Rating System" if period == "all" else _ranking_view_label(view)
+    return create_ranking_image(rows[start:start + RANKING_PAGE_SIZE], title, footer)
+
+
+def _ranking_view_label(view: RankingView) -> str:
+    """랭킹 기준 표시 (기간 랭킹은 Rating이 아니라 기간 내 라운드 승률 기준)"""
+    game, period, period_start, period_end = view
+    if period == "all":
+        label = get_ranking_label()
+        return f"{game} · {label}" if game else label
+    return get_window_ranking_label(period_start, period_end)
+
+
 # =============================================================================
 # UI 렌더링
 # =============================================================================
@@ -120,8 +223,13 @@ def render_quadrant_2():
     
     st.markdown('<p class="section-title">🏆 랭킹</p>', unsafe_allow_html=True)
     
-    # 랭킹 데이터 로드
-    ranking_data = calculate_ranking()
+    ratings_version = get_ratings_version()
+    badmanner_version = get_badmanner_version()
+    
+    view = _select_ranking_view(ratings_version)
+    
+    # 랭킹 데이터 로드 (버전 캐시)
+    ranking_data = _build_ranking(ratings_version, badmanner_version, view)
     
     if not ranking_data:
         st.markdown("""
@@ -133,17 +241,100 @@ def render_quadrant_2():
         """, unsafe_allow_html=True)
         return
     
-    # 이미지 생성
-    img_bytes = create_ranking_image(ranking_data)
+    # 필터 + 페이지 선택
+    col_filter, col_page = st.columns([3, 1])
+    with col_filter:
+        query = st.text_input(
+            "랭킹 검색",
+            key="ranking_filter_input",
+            placeholder="유저 ID 필터...",
+            label_visibility="collapsed"
+        )
+    
+    rows = _filter_ranking(ratings_version, badmanner_version, query, view)
+    total_pages = max(1, -(-len(rows) // RANKING_PAGE_SIZE))
+    
+    with col_page:
+        page = st.number_input(
+            "페이지",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            key="ranking_page_input",
+            label_visibility="collapsed"
+        )
+    
+    page = min(int(page), total_pages)
+    start = (page - 1) * RANKING_PAGE_SIZE
+    page_rows = rows[start:start + RANKING_PAGE_SIZE]
+    
+    st.caption(f"{len(rows)}명 중 {start + 1 if page_rows else 0}–{start + len(page_rows)}위 · {page}/{total_pages} 페이지")
+    
+    if not page_rows:
+        st.info("검색 결과가 없습니다.")
+        return
+    
+    img_bytes = _build_ranking_page_image(ratings_version, badmanner_version, query, page, view)
     
     if img_bytes:
-        _display_ranking_image(img_bytes, ranking_data)
+        _display_ranking_image(img_bytes, page_rows)
     else:
-        _display_ranking_text(ranking_data)
+        _display_ranking_text(page_rows, view)
     
-    # 새로고침 버튼
+    # 새로고침 버튼 (2사분면 fragment만 다시 실행)
     if st.button("🔄 새로고침", key="btn_refresh_ranking", use_container_width=True):
-        st.rerun()
+        st.rerun(scope="fragment")
+
+
+def _select_ranking_view(ratings_version: str) -> RankingView:
+    """기간 / 게임 선택 (기간 랭킹은 전체 게임 기준)"""
+    
+    col_period, col_game = st.columns(2)
+    
+    with col_period:
+        period = st.selectbox(
+            "기간",
+            options=list(RANKING_PERIODS.keys()),
+            format_func=lambda x: RANKING_PERIODS[x][0],
+            key="ranking_period_select",
+            label_visibility="collapsed"
+        )
+    
+    # 게임 선택 (게임별 래더가 있을 때만 표시, 기간 랭킹에서는 비활성)
+    game = ALL_GAMES
+    games = _get_rating_games(ratings_version)
+    if games:
+        with col_game:
+            game = st.selectbox(
+                "게임",
+                options=[ALL_GAMES] + games,
+                format_func=lambda x: "전체" if x == ALL_GAMES else x,
+                key="ranking_game_select",
+                label_visibility="collapsed",
+                disabled=period != "all"
+            )
+    
+    if period == "all":
+        return (game, period, "", "")
+    
+    if period == "season":
+        today = date.today()
+        season = st.date_input(
+            "시즌 기간",
+            value=(today - timedelta(days=SEASON_DEFAULT_DAYS - 1), today),
+            key="ranking_season_range",
+            label_visibility="collapsed"
+        )
+        # 범위 선택 중(시작일만 고른 상태)이면 시작일 하루로 취급
+        if isinstance(season, (tuple, list)):
+            start, end = (season[0], season[-1]) if season else (today, today)
+        else:
+            start = end = season
+    else:
+        start, end = get_window_range(period)
+    
+    return (ALL_GAMES, period, start.isoformat(), end.isoformat())
 
 
 def _display_ranking_image(img_bytes: bytes, ranking_data: list):
@@ -162,8 +353,8 @@ def _display_ranking_image(img_bytes: bytes, ranking_data: list):
             use_container_width=True
         )
     
-    # 높이 계산 (15명 기준)
-    num_players = min(len(ranking_data), 15)
+    # 높이 계산 (페이지 인원 기준)
+    num_players = min(len(ranking_data), RANKING_PAGE_SIZE)
     img_height = 50 + (num_players * 35) + 30
     
     # 최대 표시 높이 (약 8명 분량, 그 이상은 스크롤)
@@ -233,19 +424,22 @@ def _display_ranking_image(img_bytes: bytes, ranking_data: list):
     components.html(html_content, height=component_height, scrolling=False)
 
 
-def _display_ranking_text(ranking_data: list):
-    """텍스트로 랭킹 표시 (이미지 생성 실패 시 폴백)"""
+def _display_ranking_text(ranking_data: list, view: RankingView = ALL_TIME_VIEW):
+    """텍스트로 랭킹 표시 (이미지 생성 실패 시 폴백, 기준은 이미지 footer와 같은 뷰 라벨)"""
     
     st.markdown(f"""
     <p style="font-size: 0.8rem; color: rgba(255,255,255,0.5); margin-bottom: 0.5rem;">
-        기준: <strong style="color: #ffd369;">{get_ranking_label()}</strong>
+        기준: <strong style="color: #ffd369;">{_ranking_view_label(view)}</strong>
     </p>
     """, unsafe_allow_html=True)
     
-    for entry in ranking_data[:15]:
+    # 한 페이지를 하나의 HTML 블록으로 렌더링
+    rows_html = []
+    for entry in ranking_data[:RANKING_PAGE_SIZE]:
         rank = entry["rank"]
         user_id = entry["user_id"]
-        rating = entry.get("rating", 1200)
+        rating = entry.get("rating")
+        rating_text = f"{int(rating)}" if rating is not None else f"{entry['games']}G"
         wins = entry["wins"]
         losses = entry["losses"]
         win_rate = entry.get("win_rate", 0)
@@ -263,12 +457,28 @@ def _display_ranking_text(ranking_data: list):
             medal = f"{rank}."
             color = "white"
         
-        st.markdown(f"""
+        # 비매너 유저 표시
+        if entry.get("badmanner"):
+            name_color = "#ff6b6b"
+            badge = "🚫 "
+        else:
+            name_color = "white"
+            badge = ""
+        
+        # 연승/연패 + 최근 폼
+        streak = entry.get("streak", 0)
+        streak_color = "#4ecca3" if streak > 0 else "#ff6b6b" if streak < 0 else "rgba(255,255,255,0.4)"
+        form_title = f"최근 폼 {entry.get('form', '')} / 최장 연승 {entry.get('best_streak', 0)}"
+        
+        rows_html.append(f"""
         <div style="padding: 0.5rem; margin: 0.3rem 0; background: rgba(255,255,255,0.03); border-radius: 6px; display: flex; align-items: center;">
             <span style="width: 40px; color: {color}; font-weight: 700;">{medal}</span>
-            <span style="flex: 1; color: white;">{user_id}</span>
-            <span style="color: #64c8ff; margin-right: 1rem; font-weight: 600;">{int(rating)}</span>
+            <span style="flex: 1; color: {name_color};" title="{html.escape(entry.get('badmanner_reason', ''))}">{badge}{html.escape(user_id)}</span>
+            <span style="color: #64c8ff; margin-right: 1rem; font-weight: 600;">{rating_text}</span>
             <span style="color: #4ecca3; margin-right: 1rem;">{wins}:{losses}</span>
-            <span style="color: rgba(255,255,255,0.5); font-size: 0.8rem;">{win_rate:.1f}%</span>
+            <span style="color: rgba(255,255,255,0.5); font-size: 0.8rem; margin-right: 1rem;">{win_rate:.1f}%</span>
+            <span style="width: 32px; color: {streak_color}; font-size: 0.8rem;" title="{html.escape(form_title)}">{streak_label(streak)}</span>
         </div>
-        """, unsafe_allow_html=True)
+        """)
+    
+    st.markdown("".join(rows_html), unsafe_allow_html=True)
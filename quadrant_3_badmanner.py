@@ -5,12 +5,22 @@
 - 검색 기능
 """
 
+import html
 import streamlit as st
 from data_manager import (
     load_badmanner_list, add_badmanner, remove_badmanner,
-    search_badmanner, is_badmanner, get_all_reasons
+    search_badmanner_ranked, is_badmanner, get_all_reasons,
+    get_badmanner_page
 )
 
+BADMANNER_PAGE_SIZE = 20   # 페이지당 표시 인원
+
+SORT_OPTIONS = {
+    "recent": "최근 등록순",
+    "name": "이름순",
+    "oldest": "오래된 순",
+}
+
 
 def render_quadrant_3():
     """3사분면 렌더링: 비매너 리스트 관리"""
@@ -50,13 +60,22 @@ def _render_search_section():
         search_clicked = st.button("검색", key="btn_search_badmanner", use_container_width=True)
     
     if search_clicked and search_query:
-        found = search_badmanner(search_query)
+        results = search_badmanner_ranked(search_query, limit=5)
         
-        if found:
+        if results:
+            found = results[0]
             st.session_state.highlighted_badmanner = found.get("user_id", "")
             st.warning(f"⚠️ '{found['user_id']}' - 비매너 유저입니다!")
             if found.get("reason"):
                 st.caption(f"사유: {found['reason']}")
+            
+            # 추가로 일치하는 유저 (부분 일치 / 유사 ID)
+            others = [
+                f"{entry['user_id']}" + (f" ({entry['reason']})" if entry.get("reason") else "")
+                for entry in results[1:]
+            ]
+            if others:
+                st.caption("비슷한 ID: " + ", ".join(others))
         else:
             st.session_state.highlighted_badmanner = None
             st.success(f"✅ '{search_query}'는 비매너 리스트에 없습니다.")
@@ -104,7 +123,7 @@ def _render_add_delete_section():
             if new_user_id:
                 if add_badmanner(new_user_id, reason):
                     st.success(f"🚫 '{new_user_id}' 추가됨")
-                    st.rerun()
+                    st.rerun(scope="app")
                 else:
                     st.warning(f"'{new_user_id}'는 이미 등록되어 있습니다.")
             else:
@@ -140,7 +159,7 @@ def _render_add_delete_section():
                     st.success(f"✅ '{delete_user_id}' 삭제됨")
                     if st.session_state.get("highlighted_badmanner") == delete_user_id:
                         st.session_state.highlighted_badmanner = None
-                    st.rerun()
+                    st.rerun(scope="app")
                 else:
                     st.error("삭제 실패")
             else:
@@ -148,12 +167,49 @@ def _render_add_delete_section():
 
 
 def _render_badmanner_list():
-    """비매너 리스트 표시"""
+    """비매너 리스트 표시 (페이지 단위, 한 페이지 = HTML 블록 1개)"""
     
-    badmanner_list = load_badmanner_list()
     highlighted = st.session_state.get("highlighted_badmanner")
     
-    if not badmanner_list:
+    # 정렬/필터/페이지 선택
+    col_filter, col_sort, col_page = st.columns([2, 1, 1])
+    
+    with col_filter:
+        query = st.text_input(
+            "리스트 필터",
+            key="badmanner_list_filter",
+            placeholder="리스트 필터...",
+            label_visibility="collapsed"
+        )
+    
+    with col_sort:
+        order = st.selectbox(
+            "정렬",
+            options=list(SORT_OPTIONS.keys()),
+            format_func=lambda x: SORT_OPTIONS[x],
+            key="badmanner_list_order",
+            label_visibility="collapsed"
+        )
+    
+    # 전체 수를 알아야 페이지 범위를 정할 수 있으므로 첫 페이지로 먼저 조회
+    _, total = get_badmanner_page(1, BADMANNER_PAGE_SIZE, order, query)
+    total_pages = max(1, -(-total // BADMANNER_PAGE_SIZE))
+    
+    with col_page:
+        page = st.number_input(
+            "페이지",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            key="badmanner_list_page",
+            label_visibility="collapsed"
+        )
+    
+    page = min(int(page), total_pages)
+    entries, total = get_badmanner_page(page, BADMANNER_PAGE_SIZE, order, query)
+    
+    if not total and not query:
         st.markdown("""
         <div style="text-align: center; padding: 1.5rem; color: rgba(255,255,255,0.4);">
             <p style="font-size: 2rem;">✨</p>
@@ -163,17 +219,15 @@ def _render_badmanner_list():
         """, unsafe_allow_html=True)
         return
     
-    st.markdown(f"""
+    rows_html = [f"""
     <p style="font-size: 0.8rem; color: rgba(255,255,255,0.5); margin-bottom: 0.3rem;">
-        총 {len(badmanner_list)}명
+        총 {total}명 · {page}/{total_pages} 페이지
     </p>
-    """, unsafe_allow_html=True)
+    """]
     
-    # 리스트 표시
-    for entry in badmanner_list:
+    for entry in entries:
         user_id = entry.get("user_id", "")
         reason = entry.get("reason", "")
-        added_date = entry.get("added_date", "")
         
         is_highlighted = highlighted and user_id.lower() == highlighted.lower()
         
@@ -185,17 +239,18 @@ def _render_badmanner_list():
             border = "1px solid transparent"
         
         # 사유 툴팁
-        reason_text = f" - {reason}" if reason else ""
-        date_text = added_date.split(" ")[0] if added_date else ""
+        reason_text = f" - {html.escape(reason)}" if reason else ""
         
-        st.markdown(f"""
+        rows_html.append(f"""
         <div style="padding: 0.5rem 0.8rem; background: {bg_color}; 
                     border: {border}; border-radius: 6px; margin: 0.25rem 0;
                     display: flex; justify-content: space-between; align-items: center;">
-            <span style="color: #ff6b6b; font-weight: 600;">🚫 {user_id}</span>
+            <span style="color: #ff6b6b; font-weight: 600;">🚫 {html.escape(user_id)}</span>
             <span style="color: rgba(255,255,255,0.4); font-size: 0.75rem;">{reason_text}</span>
         </div>
-        """, unsafe_allow_html=True)
+        """)
+    
+    st.markdown("".join(rows_html), unsafe_allow_html=True)
 
 
 def highlight_badmanner(user_id: str):
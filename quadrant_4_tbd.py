@@ -1,16 +1,76 @@
 """
-4사분면: TBD (To Be Developed)
-- 향후 기능 확장을 위한 빈 공간
-- 예시: 게임별 통계, 최근 매치 기록, 설정 등
+4사분면: 통계 / 확장 기능
+- 📈 Rating 추이 그래프 (다운샘플링된 시계열) + 롤링 승률 (최근 N판 / N일)
+- 🎮 게임별 통계 (매치 추가 시 갱신되는 집계에서 조회)
+- 🎯 매치업 예측 (Rating 기반 FT-N 세트 승률, 일괄 계산)
+- 📜 최근 매치 피드 (플레이어/게임/기간 필터, 커서 페이지네이션)
+- 🕒 활동 히트맵 (요일 × 시간대, 매치 추가 시 갱신되는 집계에서 조회)
+- 향후 기능 확장을 위한 공간
 """
 
+from datetime import date, timedelta
+
 import streamlit as st
 
+from data_manager import (
+    get_rating_series, get_rating_history_players,
+    get_game_stats_overview, get_game_stats,
+    get_recent_win_rate, get_win_rate_trend,
+    get_rating_games, predict_matchups, RATED_FIRST_TO,
+    get_recent_matches,
+    get_activity_heatmap, get_activity_peaks
+)
+
+# 롤링 승률 구간 옵션: 라벨 → (최근 N판, 최근 N일)
+TREND_WINDOWS = {
+    "최근 10판": (10, None),
+    "최근 20판": (20, None),
+    "최근 50판": (50, None),
+    "최근 7일": (None, 7),
+    "최근 30일": (None, 30),
+}
+
+# 매치업 예측: 세트 길이 선택지 (FT-N) + 비교표에 함께 보여줄 길이
+PREDICT_FIRST_TO = [1, 2, 3, 5, 7, 10]
+PREDICT_DEFAULT_FIRST_TO = 3
+
+FEED_PAGE_SIZE = 15         # 최근 매치 피드 페이지 크기
+FEED_DEFAULT_DAYS = 30      # 기간 필터 기본값 (오늘 기준 과거 일수)
+
+WEEKDAY_LABELS = ["월", "화", "수", "목", "금", "토", "일"]
+ALL_PLAYERS = ""            # 활동 히트맵: 전체 매치
+
 
 def render_quadrant_4():
-    """4사분면 렌더링: TBD"""
+    """4사분면 렌더링: 통계 탭"""
+    
+    st.markdown('<p class="section-title">📊 통계</p>', unsafe_allow_html=True)
+    
+    tab_chart, tab_games, tab_predict, tab_feed, tab_activity, tab_tbd = st.tabs(
+        ["📈 추이", "🎮 게임", "🎯 예측", "📜 기록", "🕒 활동", "🔮 TBD"]
+    )
+    
+    with tab_chart:
+        render_win_rate_chart()
     
-    st.markdown('<p class="section-title">🚧 Coming Soon</p>', unsafe_allow_html=True)
+    with tab_games:
+        render_game_stats()
+    
+    with tab_predict:
+        render_matchup_predictor()
+    
+    with tab_feed:
+        render_match_feed()
+    
+    with tab_activity:
+        render_activity_heatmap()
+    
+    with tab_tbd:
+        _render_tbd()
+
+
+def _render_tbd():
+    """향후 기능 안내"""
     
     st.markdown("""
     <div class="tbd-section">
@@ -27,8 +87,6 @@ def render_quadrant_4():
     # 향후 추가 가능 기능 힌트
     with st.expander("💡 예정된 기능"):
         st.markdown("""
-        - 📊 게임별 통계 분석
-        - 📈 승률 추이 그래프
         - 🎯 상대별 추천 전략
         - ⚙️ 설정 (크롤링 옵션, 테마 등)
         - 📋 대전 기록 내보내기
@@ -37,18 +95,392 @@ def render_quadrant_4():
 
 
 # =============================================================================
-# 향후 확장용 플레이스홀더 함수들
+# 통계 렌더링
 # =============================================================================
+def render_win_rate_chart(max_points: int = 200):
+    """
+    Rating 추이 차트
+    Rating 시계열 저장소에서 다운샘플링된 포인트만 읽어 그림 (기록이 길어도 렌더 비용 일정)
+    """
+    players = get_rating_history_players()
+    
+    if not players:
+        st.caption("Rating 기록이 없습니다. 1사분면에서 대전 기록을 추가해주세요.")
+        return
+    
+    player_id = st.selectbox(
+        "플레이어",
+        options=players,
+        key="chart_player_select",
+        label_visibility="collapsed"
+    )
+    
+    series = get_rating_series(player_id, max_points=max_points)
+    if series["total"] == 0:
+        st.caption("표시할 기록이 없습니다.")
+        return
+    
+    import pandas as pd
+    
+    chart_data = pd.DataFrame(
+        {"Rating": series["rating"]},
+        index=pd.to_datetime(series["ts"], unit="s")
+    )
+    st.line_chart(chart_data, height=220)
+    st.caption(f"{series['total']}개 기록 중 {len(series['ts'])}개 포인트 표시")
+    
+    render_rolling_win_rate(player_id, max_points=max_points)
 
-def render_game_stats():
-    """게임별 통계 (미구현)"""
-    pass
 
+def render_rolling_win_rate(player_id: str, max_points: int = 200):
+    """롤링 승률 차트 (누적합 인덱스에서 구간마다 O(1) 계산)"""
+    
+    window_label = st.radio(
+        "구간",
+        options=list(TREND_WINDOWS.keys()),
+        index=1,
+        horizontal=True,
+        key="trend_window_select",
+        label_visibility="collapsed"
+    )
+    window_matches, window_days = TREND_WINDOWS[window_label]
+    
+    trend = get_win_rate_trend(player_id, window_matches, window_days, max_points)
+    if not trend["ts"]:
+        st.caption("표시할 승률 기록이 없습니다.")
+        return
+    
+    import pandas as pd
+    
+    chart_data = pd.DataFrame(
+        {"승률(%)": trend["win_rate"]},
+        index=pd.to_datetime(trend["ts"], unit="s")
+    )
+    st.line_chart(chart_data, height=180)
+    
+    current = get_recent_win_rate(player_id, matches=window_matches, days=window_days)
+    overall = get_recent_win_rate(player_id)
+    if current["win_rate"] is not None:
+        st.caption(
+            f"{window_label} 라운드 승률 {current['win_rate']:.1f}% "
+            f"({current['wins']}:{current['losses']}) · 전체 {overall['win_rate'] or 0:.1f}%"
+        )
+    else:
+        st.caption(f"{window_label} 경기 기록이 없습니다. · 전체 {overall['win_rate'] or 0:.1f}%")
 
-def render_win_rate_chart():
-    """승률 추이 차트 (미구현)"""
-    pass
 
+def render_game_stats(top_k: int = 5):
+    """
+    게임별 통계
+    매치 저장 시 갱신되는 게임별 집계만 읽으므로 히스토리 크기와 무관하게 렌더 비용 일정
+    """
+    overview = get_game_stats_overview()
+    
+    if not overview:
+        st.caption("게임 기록이 없습니다. 1사분면에서 대전 기록을 추가해주세요.")
+        return
+    
+    game = st.selectbox(
+        "게임",
+        options=[row["game"] for row in overview],
+        format_func=lambda x: x or "(게임 정보 없음)",
+        key="game_stats_select",
+        label_visibility="collapsed"
+    )
+    
+    stats = get_game_stats(game, top_k=top_k)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("매치", f"{stats['matches']:,}")
+    col2.metric("라운드", f"{stats['rounds']:,}")
+    col3.metric("플레이어", f"{stats['players']:,}")
+    col4.metric("평균 점수차", f"{stats['avg_margin']:.2f}")
+    
+    col_types, col_top = st.columns(2)
+    
+    with col_types:
+        st.markdown("**매치 타입**")
+        st.dataframe(
+            [
+                {
+                    "타입": row["match_type"] or "-",
+                    "매치": row["matches"],
+                    "비율(%)": row["share"],
+                    "평균 점수차": row["avg_margin"],
+                }
+                for row in stats["match_types"]
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+    
+    with col_top:
+        st.markdown(f"**상위 {top_k}명 (매치 수)**")
+        st.dataframe(
+            [
+                {
+                    "ID": row["user_id"],
+                    "매치": row["matches"],
+                    "라운드": f"{row['wins']}:{row['losses']}",
+                    "승률(%)": row["win_rate"],
+                }
+                for row in stats["top_players"]
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+    
+    with st.expander("전체 게임 요약"):
+        st.dataframe(
+            [
+                {
+                    "게임": row["game"] or "-",
+                    "매치": row["matches"],
+                    "라운드": row["rounds"],
+                    "플레이어": row["players"],
+                    "평균 점수차": row["avg_margin"],
+                }
+                for row in overview
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+
+
+def _parse_matchup_lines(text: str, default_first_to: int) -> list:
+    """
+    "플레이어A 플레이어B [N]" 줄 목록 → [(a, b, first_to), ...]
+    형식이 맞지 않는 줄은 건너뜀 (N 생략 시 기본 세트 길이)
+    """
+    matchups = []
+    for line in text.splitlines():
+        parts = line.replace(",", " ").split()
+        if len(parts) == 2:
+            matchups.append((parts[0], parts[1], default_first_to))
+        elif len(parts) == 3:
+            first_to = parts[2].upper().removeprefix("FT")
+            if first_to.isdigit() and int(first_to) >= 1:
+                matchups.append((parts[0], parts[1], int(first_to)))
+    return matchups
+
+
+def render_matchup_predictor():
+    """
+    매치업 예측
+    Rating 배열에서 한 번에 조회해 여러 매치업/세트 길이를 일괄 계산
+    """
+    players = get_rating_history_players()
+    
+    if len(players) < 2:
+        st.caption("Rating 기록이 있는 플레이어가 2명 이상 필요합니다.")
+        return
+    
+    games = get_rating_games()
+    game = st.selectbox(
+        "래더",
+        options=[None] + games,
+        format_func=lambda x: "전체 Rating" if x is None else x,
+        key="predict_game_select",
+        label_visibility="collapsed"
+    )
+    
+    col_a, col_b, col_ft = st.columns([2, 2, 1])
+    with col_a:
+        player_a = st.selectbox("플레이어 A", options=players, index=0, key="predict_player_a")
+    with col_b:
+        player_b = st.selectbox("플레이어 B", options=players, index=1, key="predict_player_b")
+    with col_ft:
+        first_to = st.selectbox(
+            "세트",
+            options=PREDICT_FIRST_TO,
+            index=PREDICT_FIRST_TO.index(PREDICT_DEFAULT_FIRST_TO),
+            format_func=lambda n: f"FT{n}",
+            key="predict_first_to"
+        )
+    
+    # 선택한 길이 + 비교용 길이를 한 번에 계산
+    lengths = [first_to] + [n for n in PREDICT_FIRST_TO if n != first_to]
+    rows = predict_matchups([(player_a, player_b, n) for n in lengths], game=game)
+    main = rows[0]
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric(f"{player_a} 승리 (FT{first_to})", f"{main['win_prob'] * 100:.1f}%")
+    col2.metric(f"{player_b} 승리 (FT{first_to})", f"{(1 - main['win_prob']) * 100:.1f}%")
+    col3.metric("추정 라운드 승률", f"{main['round_win_prob'] * 100:.1f}%")
+    st.caption(
+        f"Rating {main['rating_a']:.0f} vs {main['rating_b']:.0f} (기록 없는 플레이어는 기본 Rating) · "
+        f"Rating 기대 승률을 FT{RATED_FIRST_TO} 매치 승률로 보고 라운드 승률을 역산한 근사치"
+    )
+    
+    with st.expander("세트 길이별 승률"):
+        st.dataframe(
+            [
+                {"세트": f"FT{row['first_to']}", f"{player_a} 승률(%)": round(row["win_prob"] * 100, 1)}
+                for row in sorted(rows, key=lambda row: row["first_to"])
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+    
+    with st.expander("여러 매치업 일괄 예측"):
+        text = st.text_area(
+            "매치업 목록",
+            height=100,
+            placeholder="한 줄에 하나: 플레이어A 플레이어B FT3",
+            key="predict_batch_input",
+            label_visibility="collapsed"
+        )
+        matchups = _parse_matchup_lines(text, first_to)
+        if matchups:
+            st.dataframe(
+                [
+                    {
+                        "A": row["player_a"],
+                        "B": row["player_b"],
+                        "세트": f"FT{row['first_to']}",
+                        "A 승률(%)": round(row["win_prob"] * 100, 1),
+                        "Rating": f"{row['rating_a']:.0f} : {row['rating_b']:.0f}",
+                    }
+                    for row in predict_matchups(matchups, game=game)
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
+
+
+def render_match_feed(page_size: int = FEED_PAGE_SIZE):
+    """
+    최근 매치 피드
+    커서(직전 페이지 마지막 매치 위치)로 다음 페이지를 찾으므로 히스토리가 길어도 페이지 비용 일정
+    """
+    col_player, col_game = st.columns(2)
+    with col_player:
+        player = st.text_input(
+            "플레이어",
+            placeholder="플레이어 ID (비우면 전체)",
+            key="feed_player_input",
+            label_visibility="collapsed"
+        ).strip()
+    with col_game:
+        game = st.selectbox(
+            "게임",
+            options=[None] + [row["game"] for row in get_game_stats_overview()],
+            format_func=lambda x: "전체 게임" if x is None else (x or "(게임 정보 없음)"),
+            key="feed_game_select",
+            label_visibility="collapsed"
+        )
+    
+    start = end = None
+    if st.checkbox("기간 지정", key="feed_use_range"):
+        today = date.today()
+        selected = st.date_input(
+            "기간",
+            value=(today - timedelta(days=FEED_DEFAULT_DAYS - 1), today),
+            key="feed_date_range",
+            label_visibility="collapsed"
+        )
+        if isinstance(selected, (tuple, list)):
+            if selected:
+                start, end = selected[0], selected[-1]
+        else:
+            start = end = selected
+    
+    # 필터가 바뀌면 첫 페이지로 (커서 스택: 지금까지 본 페이지들의 시작 커서)
+    filters = (player.lower(), game, start, end)
+    if st.session_state.get("feed_filters") != filters:
+        st.session_state.feed_filters = filters
+        st.session_state.feed_cursors = [None]
+    cursors = st.session_state.feed_cursors
+    
+    result = get_recent_matches(player or None, game, start, end, cursors[-1], page_size)
+    
+    if not result["matches"]:
+        st.caption("조건에 맞는 매치가 없습니다.")
+    else:
+        st.dataframe(
+            [
+                {
+                    "날짜": m.get("date", ""),
+                    "게임": m.get("game", ""),
+                    "P1": m.get("player1", ""),
+                    "스코어": f"{m.get('score1', 0)} : {m.get('score2', 0)}",
+                    "P2": m.get("player2", ""),
+                    "타입": m.get("match_type", ""),
+                }
+                for m in result["matches"]
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+    
+    col_prev, col_page, col_next = st.columns([1, 1, 1])
+    with col_prev:
+        if st.button("◀ 이전", key="feed_prev", disabled=len(cursors) == 1, use_container_width=True):
+            cursors.pop()
+            st.rerun(scope="fragment")
+    with col_page:
+        st.markdown(
+            f"<p style='text-align: center; margin: 0.4rem 0;'>{len(cursors)} 페이지</p>",
+            unsafe_allow_html=True
+        )
+    with col_next:
+        if st.button("다음 ▶", key="feed_next", disabled=result["next_cursor"] is None, use_container_width=True):
+            cursors.append(result["next_cursor"])
+            st.rerun(scope="fragment")
+
+
+def render_activity_heatmap():
+    """
+    요일 × 시간대 활동 히트맵
+    매치 저장 시 갱신되는 7 × 24 집계 배열만 읽음 (히스토리 순회 없음)
+    """
+    players = get_rating_history_players()
+    
+    player_id = st.selectbox(
+        "플레이어",
+        options=[ALL_PLAYERS] + players,
+        format_func=lambda x: "전체" if x == ALL_PLAYERS else x,
+        key="activity_player_select",
+        label_visibility="collapsed"
+    )
+    
+    grid = get_activity_heatmap(player_id or None)
+    total = int(grid.sum())
+    if total == 0:
+        st.caption("활동 기록이 없습니다.")
+        return
+    
+    peak = int(grid.max())
+    header = "".join(
+        f"<th style='font-weight: 400; color: rgba(255,255,255,0.4);'>{hour if hour % 3 == 0 else ''}</th>"
+        for hour in range(24)
+    )
+    rows_html = []
+    for weekday, label in enumerate(WEEKDAY_LABELS):
+        cells = "".join(
+            f"<td title='{label} {hour}시: {int(count)}판' "
+            f"style='background: rgba(78, 204, 163, {count / peak:.2f}); height: 16px; border-radius: 2px;'></td>"
+            for hour, count in enumerate(grid[weekday])
+        )
+        rows_html.append(f"<tr><th style='font-weight: 400; padding-right: 4px;'>{label}</th>{cells}</tr>")
+    
+    st.markdown(f"""
+    <table style="width: 100%; border-collapse: separate; border-spacing: 2px; font-size: 0.7rem; table-layout: fixed;">
+        <tr><th style="width: 1.5rem;"></th>{header}</tr>
+        {"".join(rows_html)}
+    </table>
+    """, unsafe_allow_html=True)
+    
+    peaks = get_activity_peaks(player_id or None)
+    peak_text = ", ".join(
+        f"{WEEKDAY_LABELS[p['weekday']]} {p['hour']}시 ({p['matches']}판)" for p in peaks
+    )
+    st.caption(f"총 {total:,}판 · 주 활동 시간: {peak_text}")
+
+
+# =============================================================================
+# 향후 확장용 플레이스홀더 함수들
+# =============================================================================
 
 def render_settings():
     """설정 페이지 (미구현)"""
@@ -9,28 +9,69 @@
 3순위: 판수
 
 최소 9판 이상 플레이해야 랭킹에 반영됨
+
+엔진 선택 (calculate_ranking(engine=...)):
+- "elo": 매치 순서대로 누적 갱신하는 Elo (기본)
+- "bradley_terry": 전체 라운드 집계로 한 번에 적합하는 Bradley-Terry (순서 무관)
+- "glicko2": 레이팅 기간 단위로 일괄 갱신하는 Glicko-2 (RD가 큰 잠정 Rating은 제외)
 =============================================================================
 """
 
-from typing import List, Dict, Any
+from datetime import datetime, date
+from typing import List, Dict, Any, Optional
 from data_manager import (
     get_all_player_ratings,
-    MIN_GAMES_FOR_RANKING
+    get_all_player_ratings_as_of,
+    get_window_ranking,
+    annotate_badmanner,
+    annotate_streaks,
+    MIN_GAMES_FOR_RANKING,
+    WINDOW_MIN_GAMES,
+    ENGINE_ELO,
+    ENGINE_BRADLEY_TERRY,
+    ENGINE_GLICKO2
 )
 
+RANKING_ENGINES = {
+    ENGINE_ELO: "Elo Rating",
+    ENGINE_BRADLEY_TERRY: "Bradley-Terry",
+    ENGINE_GLICKO2: "Glicko-2",
+}
+
 
 # =============================================================================
 # 랭킹 계산 메인 함수
 # =============================================================================
-def calculate_ranking() -> List[Dict[str, Any]]:
+def calculate_ranking(
+    limit: Optional[int] = None,
+    as_of: Optional[datetime] = None,
+    game: Optional[str] = None,
+    engine: str = ENGINE_ELO
+) -> List[Dict[str, Any]]:
     """
     전체 랭킹 계산 (Elo Rating 기반)
     
+    Args:
+        limit: 상위 K명만 조회 (None이면 전체)
+        as_of: 과거 시점 랭킹 조회 기준 시각 (None이면 현재 랭킹, Elo 엔진만 지원)
+        game: 게임별 래더 랭킹 (None이면 전체 Rating, as_of와 함께 사용 불가)
+        engine: 랭킹 엔진 (RANKING_ENGINES 키)
+    
     Returns:
-        [{"rank": 1, "user_id": "player", "rating": 1500, "wins": 10, ...}, ...]
+        [{"rank": 1, "user_id": "player", "rating": 1500, "wins": 10,
+          "badmanner": False, "badmanner_reason": "",
+          "streak": 3, "best_streak": 5, "form": "WLWWW", ...}, ...]
     """
     # Rating 기준 정렬된 플레이어 목록 조회
-    players = get_all_player_ratings()
+    if engine not in RANKING_ENGINES:
+        raise ValueError(f"알 수 없는 랭킹 엔진: {engine}")
+    if as_of is not None and (game is not None or engine != ENGINE_ELO):
+        raise ValueError("과거 시점 랭킹은 전체 Elo Rating만 지원합니다.")
+    
+    if as_of is None:
+        players = get_all_player_ratings(limit=limit, game=game, engine=engine)
+    else:
+        players = get_all_player_ratings_as_of(as_of, limit=limit)
     
     if not players:
         return []
@@ -49,15 +90,57 @@ def calculate_ranking() -> List[Dict[str, Any]]:
             "win_rate": player_data["win_rate"]
         })
     
+    # 비매너 여부 일괄 표시 + 연속 기록 (현재 기준이므로 과거 시점 랭킹에는 표시하지 않음)
+    annotate_badmanner(result)
+    if as_of is None:
+        annotate_streaks(result)
     return result
 
 
+def calculate_window_ranking(
+    start: date,
+    end: date,
+    window: str = "season",
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    기간 랭킹 계산 (최근 7일 / 30일 / 시즌 등, 라운드 승률 기준)
+    
+    Args:
+        start, end: 기간 (양 끝 포함)
+        window: 윈도우 키 (같은 키로 기간을 옮기면 증분 계산)
+        limit: 상위 K명만 조회 (None이면 전체)
+    
+    Returns:
+        calculate_ranking과 같은 형식 (기간 랭킹은 Rating이 없으므로 rating/rd는 None)
+    """
+    result = []
+    for rank, player_data in enumerate(get_window_ranking(start, end, window, limit), start=1):
+        result.append({
+            "rank": rank,
+            "user_id": player_data["user_id"],
+            "rating": None,
+            "rd": None,
+            "wins": player_data["wins"],
+            "losses": player_data["losses"],
+            "games": player_data["games"],
+            "win_rate": player_data["win_rate"]
+        })
+    
+    return annotate_streaks(annotate_badmanner(result))
+
+
 # =============================================================================
 # 랭킹 라벨 (UI 표시용)
 # =============================================================================
-def get_ranking_label() -> str:
+def get_ranking_label(engine: str = ENGINE_ELO) -> str:
     """현재 랭킹 기준 설명"""
-    return f"Elo Rating (min {MIN_GAMES_FOR_RANKING} games)"
+    return f"{RANKING_ENGINES.get(engine, engine)} (min {MIN_GAMES_FOR_RANKING} games)"
+
+
+def get_window_ranking_label(start: date, end: date) -> str:
+    """기간 랭킹 기준 설명 (Rating이 아니라 기간 내 라운드 승률)"""
+    return f"Round Win Rate · {start} ~ {end} (min {WINDOW_MIN_GAMES} games)"
 
 
 def get_ranking_description() -> str:
@@ -0,0 +1,234 @@
+"""
+플레이어별 Rating 시계열 저장소
+- Rating 변동마다 (timestamp, rating, rd, match_ref) 1건 기록
+- 고정 길이 바이너리 레코드를 append-only 로그에 추가 (쓰기 O(배치 크기))
+- 읽기 시 NumPy 구조화 배열로 한 번에 로드 → 플레이어별 컬럼(시간순) 인덱스
+- 기간 필터 + 목표 포인트 수로 다운샘플링한 시계열 반환 (차트용)
+"""
+
+import os
+import json
+import struct
+import hashlib
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+from config import DATA_DIR
+
+RATING_HISTORY_FILE = f"{DATA_DIR}/rating_history.bin"
+RATING_HISTORY_PLAYERS_FILE = f"{DATA_DIR}/rating_history_players.json"
+
+# 레코드: player(int32) ts(float64) rating(float32) rd(float32) match_ref(int64) = 28 bytes
+_RECORD = struct.Struct("<idffq")
+_RECORD_DTYPE = [
+    ("player", "<i4"),
+    ("ts", "<f8"),
+    ("rating", "<f4"),
+    ("rd", "<f4"),
+    ("match_ref", "<i8"),
+]
+
+_lock = threading.RLock()
+_players: Optional[List[str]] = None          # 인덱스 → 플레이어 ID
+_player_index: Dict[str, int] = {}            # 플레이어 ID → 인덱스
+_series_cache: Dict[str, Any] = {"size": None, "series": None}
+
+
+def match_ref(match_key: str) -> int:
+    """매치 키를 64비트 정수 참조로 변환"""
+    digest = hashlib.blake2b(match_key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+# =============================================================================
+# 플레이어 ID 테이블
+# =============================================================================
+def _load_players() -> List[str]:
+    """플레이어 ID 테이블 로드 (_lock 보유 상태에서 호출)"""
+    global _players, _player_index
+
+    if _players is None:
+        players = []
+        if os.path.exists(RATING_HISTORY_PLAYERS_FILE):
+            try:
+                with open(RATING_HISTORY_PLAYERS_FILE, 'r', encoding='utf-8') as f:
+                    players = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                players = []
+        _players = players if isinstance(players, list) else []
+        _player_index = {player: idx for idx, player in enumerate(_players)}
+
+    return _players
+
+
+def _intern_players(player_ids: List[str]) -> bool:
+    """새 플레이어를 테이블에 추가하고 저장 (_lock 보유 상태에서 호출)"""
+    players = _load_players()
+    added = False
+
+    for player_id in player_ids:
+        if player_id not in _player_index:
+            _player_index[player_id] = len(players)
+            players.append(player_id)
+            added = True
+
+    if added:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(RATING_HISTORY_PLAYERS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(players, f, ensure_ascii=False)
+
+    return added
+
+
+# =============================================================================
+# 쓰기
+# =============================================================================
+def append_points(points: List[Tuple[str, float, float, float, int]]) -> int:
+    """
+    Rating 변동 기록 추가
+
+    Args:
+        points: [(player_id, timestamp, rating, rd, match_ref), ...]
+
+    Returns:
+        기록된 수
+    """
+    if not points:
+        return 0
+
+    with _lock:
+        _intern_players([p[0] for p in points])
+        payload = b"".join(
+            _RECORD.pack(_player_index[player_id], ts, rating, rd, ref)
+            for player_id, ts, rating, rd, ref in points
+        )
+
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(RATING_HISTORY_FILE, 'ab') as f:
+            f.write(payload)
+
+    return len(points)
+
+
+def reset_history() -> None:
+    """전체 기록 초기화 (Rating 재계산 시)"""
+    global _players, _player_index
+
+    with _lock:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        open(RATING_HISTORY_FILE, 'wb').close()
+        with open(RATING_HISTORY_PLAYERS_FILE, 'w', encoding='utf-8') as f:
+            json.dump([], f)
+        _players = []
+        _player_index = {}
+        _series_cache["size"] = None
+        _series_cache["series"] = None
+
+
+# =============================================================================
+# 읽기
+# =============================================================================
+def _load_series() -> Dict[str, Any]:
+    """
+    로그 전체를 플레이어별 시간순 컬럼으로 로드 (파일 크기 기준 캐시)
+
+    Returns:
+        {플레이어 ID: 구조화 배열 (ts 오름차순)}
+    """
+    import numpy as np
+
+    with _lock:
+        size = os.path.getsize(RATING_HISTORY_FILE) if os.path.exists(RATING_HISTORY_FILE) else 0
+        if _series_cache["size"] == size and _series_cache["series"] is not None:
+            return _series_cache["series"]
+
+        players = _load_players()
+        records = np.fromfile(RATING_HISTORY_FILE, dtype=np.dtype(_RECORD_DTYPE)) if size else \
+            np.zeros(0, dtype=np.dtype(_RECORD_DTYPE))
+
+        # (player, ts) 순 정렬 후 플레이어 경계로 분할 (안정 정렬 → 같은 시각은 기록 순서 유지)
+        order = np.lexsort((records["ts"], records["player"]))
+        records = records[order]
+        boundaries = np.flatnonzero(np.diff(records["player"])) + 1
+        starts = np.concatenate(([0], boundaries)) if len(records) else np.zeros(0, dtype=np.int64)
+        ends = np.concatenate((boundaries, [len(records)])) if len(records) else np.zeros(0, dtype=np.int64)
+
+        series = {
+            players[records["player"][start]]: records[start:end]
+            for start, end in zip(starts, ends)
+        }
+
+        _series_cache["size"] = size
+        _series_cache["series"] = series
+        return series
+
+
+def get_players() -> List[str]:
+    """기록이 있는 플레이어 목록 (정렬)"""
+    return sorted(_load_series().keys())
+
+
+def _downsample_indices(values: Any, max_points: int) -> Any:
+    """
+    구간별 최소/최대값 위치를 남기는 다운샘플링 인덱스
+    (첫/마지막 포인트는 항상 포함)
+    """
+    import numpy as np
+
+    n = len(values)
+    if n <= max_points or max_points < 4:
+        return np.arange(n) if n <= max_points else np.linspace(0, n - 1, max_points).astype(np.int64)
+
+    buckets = (max_points - 2) // 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.int64)
+    picked = [0]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        chunk = values[start:end]
+        lo = start + int(np.argmin(chunk))
+        hi = start + int(np.argmax(chunk))
+        picked.extend(sorted({lo, hi}))
+    picked.append(n - 1)
+
+    return np.unique(np.asarray(picked, dtype=np.int64))
+
+
+def get_rating_series(
+    player_id: str,
+    start_ts: Optional[float] = None,
+    end_ts: Optional[float] = None,
+    max_points: int = 200
+) -> Dict[str, Any]:
+    """
+    플레이어 Rating 시계열 조회 (기간 필터 + 다운샘플링)
+
+    Args:
+        player_id: 플레이어 ID (대소문자 무시)
+        start_ts, end_ts: 기간 (Unix timestamp, None이면 제한 없음)
+        max_points: 최대 포인트 수
+
+    Returns:
+        {"ts": ndarray, "rating": ndarray, "rd": ndarray, "match_ref": ndarray, "total": int}
+    """
+    import numpy as np
+
+    data = _load_series().get(player_id.lower())
+    if data is None:
+        data = np.zeros(0, dtype=np.dtype(_RECORD_DTYPE))
+
+    # 시간순 정렬되어 있으므로 이진 탐색으로 기간 자르기
+    lo = 0 if start_ts is None else int(np.searchsorted(data["ts"], start_ts, side="left"))
+    hi = len(data) if end_ts is None else int(np.searchsorted(data["ts"], end_ts, side="right"))
+    window = data[lo:hi]
+
+    idx = _downsample_indices(window["rating"], max_points)
+    sampled = window[idx]
+
+    return {
+        "ts": sampled["ts"],
+        "rating": sampled["rating"],
+        "rd": sampled["rd"],
+        "match_ref": sampled["match_ref"],
+        "total": len(window)
+    }
@@ -0,0 +1,259 @@
+"""
+Rating 파라미터 스윕 시뮬레이터
+- 매치 히스토리를 여러 파라미터 조합(K값, 초기 Rating, 마진 가중치)으로 재생
+- 조합별 재생은 프로세스 풀에서 병렬 실행 (메모리 내 재생, 파일 I/O 없음)
+- 매치 직전 기대 승률로 예측 성능 측정: log-loss, 정확도
+- 평가 대상 매치는 모든 조합에 같은 집합 (두 플레이어 모두 최소 판수 이상인 매치)
+
+사용법:
+    python rating_simulator.py [--k 16,24,32,40] [--margin-scale 0,0.5,1,1.5]
+                               [--min-games 9] [--default-rating 1200] [--workers 0]
+"""
+
+import os
+import sys
+import math
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
+
+from data_manager import (
+    load_match_history,
+    match_sort_key,
+    apply_rating_update,
+    expected_score,
+    K_FACTOR,
+    DEFAULT_RATING,
+    MIN_GAMES_FOR_RANKING,
+    MARGIN_MULTIPLIERS,
+)
+
+LOG_LOSS_EPS = 1e-12   # log(0) 방지용 확률 하한
+
+# 재생용 매치: (player1, score1, player2, score2)
+SimMatch = Tuple[str, int, str, int]
+
+
+@dataclass(frozen=True)
+class SimParams:
+    """시뮬레이션 파라미터 조합"""
+    k_factor: float = K_FACTOR
+    default_rating: float = DEFAULT_RATING
+    margin_scale: float = 1.0   # 마진 가중치 배율 (0이면 마진 무시, 1이면 현재 테이블)
+
+    def margin_table(self) -> Dict[int, Tuple[float, float]]:
+        """배율을 적용한 마진 가중치 테이블 (1.0 기준으로 늘이거나 줄임)"""
+        return {
+            diff: tuple(1.0 + (weight - 1.0) * self.margin_scale for weight in weights)
+            for diff, weights in MARGIN_MULTIPLIERS.items()
+        }
+
+
+# =============================================================================
+# 재생 (워커 프로세스)
+# =============================================================================
+_worker_matches: List[SimMatch] = []
+_worker_eval: List[bool] = []
+
+
+def _init_worker(matches: List[SimMatch], eval_mask: List[bool]) -> None:
+    """워커 프로세스 초기화 (매치 목록은 프로세스당 한 번만 전달)"""
+    global _worker_matches, _worker_eval
+    _worker_matches = matches
+    _worker_eval = eval_mask
+
+
+def evaluation_mask(matches: List[SimMatch], min_games: int = MIN_GAMES_FOR_RANKING) -> List[bool]:
+    """
+    평가 대상 매치 표시 (두 플레이어 모두 직전까지 min_games판 이상)
+    - 판수는 파라미터와 무관 → 모든 조합을 같은 매치 집합으로 비교
+    """
+    games: Dict[str, int] = {}
+    mask = []
+    for player1, _, player2, _ in matches:
+        mask.append(games.get(player1, 0) >= min_games and games.get(player2, 0) >= min_games)
+        games[player1] = games.get(player1, 0) + 1
+        games[player2] = games.get(player2, 0) + 1
+    return mask
+
+
+def simulate(
+    matches: List[SimMatch],
+    params: SimParams,
+    eval_mask: Optional[List[bool]] = None
+) -> Dict[str, Any]:
+    """
+    파라미터 조합 하나로 히스토리 재생 후 예측 성능 집계
+
+    - 예측은 매치 직전 Rating의 기대 승률 (player1 기준)
+    - 정답은 매치 결과 (승 1, 패 0, 무 0.5)
+    - eval_mask가 True인 매치만 집계 (None이면 evaluation_mask 기본값)
+
+    Returns:
+        {"params": {...}, "evaluated": int, "log_loss": float, "accuracy": float}
+    """
+    if eval_mask is None:
+        eval_mask = evaluation_mask(matches)
+
+    ratings: Dict[str, Dict[str, Any]] = {}
+    margin_table = params.margin_table()
+
+    log_loss_sum = 0.0
+    evaluated = 0
+    correct = 0.0
+    decided = 0
+
+    for (player1, score1, player2, score2), evaluate in zip(matches, eval_mask):
+        if evaluate:
+            p1 = ratings.get(player1)
+            p2 = ratings.get(player2)
+            r1 = p1["rating"] if p1 else params.default_rating
+            r2 = p2["rating"] if p2 else params.default_rating
+            expected = expected_score(r1, r2)
+            actual = 1.0 if score1 > score2 else 0.0 if score1 < score2 else 0.5
+
+            prob = min(max(expected, LOG_LOSS_EPS), 1 - LOG_LOSS_EPS)
+            log_loss_sum -= actual * math.log(prob) + (1 - actual) * math.log(1 - prob)
+            evaluated += 1
+
+            # 정확도는 승패가 갈린 매치만 (기대 승률 50%는 절반 정답)
+            if actual != 0.5:
+                decided += 1
+                if expected == 0.5:
+                    correct += 0.5
+                elif (expected > 0.5) == (actual == 1.0):
+                    correct += 1
+
+        apply_rating_update(
+            ratings, player1, score1, player2, score2,
+            k_factor=params.k_factor,
+            default_rating=params.default_rating,
+            margin_table=margin_table
+        )
+
+    return {
+        "params": asdict(params),
+        "evaluated": evaluated,
+        "log_loss": log_loss_sum / evaluated if evaluated else float("nan"),
+        "accuracy": correct / decided if decided else float("nan"),
+    }
+
+
+def _simulate_in_worker(params: SimParams) -> Dict[str, Any]:
+    return simulate(_worker_matches, params, _worker_eval)
+
+
+# =============================================================================
+# 스윕
+# =============================================================================
+def prepare_matches(history: Optional[List[Dict[str, Any]]] = None) -> List[SimMatch]:
+    """매치 히스토리를 시간순 재생용 튜플 목록으로 변환 (Rating 재계산과 같은 순서)"""
+    if history is None:
+        history = load_match_history()
+
+    return [
+        (m["player1"].lower(), m.get("score1", 0), m["player2"].lower(), m.get("score2", 0))
+        for m in sorted(history, key=match_sort_key)
+        if m.get("player1") and m.get("player2")
+    ]
+
+
+def build_grid(
+    k_factors: List[float],
+    default_ratings: List[float],
+    margin_scales: List[float]
+) -> List[SimParams]:
+    """파라미터 조합 목록 (데카르트 곱)"""
+    return [
+        SimParams(k, rating, scale)
+        for k, rating, scale in itertools.product(k_factors, default_ratings, margin_scales)
+    ]
+
+
+def run_sweep(
+    grid: List[SimParams],
+    matches: Optional[List[SimMatch]] = None,
+    workers: int = 0,
+    min_games: int = MIN_GAMES_FOR_RANKING
+) -> List[Dict[str, Any]]:
+    """
+    파라미터 조합별 시뮬레이션 병렬 실행
+
+    Args:
+        grid: 파라미터 조합 목록
+        matches: 재생할 매치 (None이면 저장된 히스토리)
+        workers: 프로세스 수 (0이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 실행)
+        min_games: 평가 대상 매치 기준 판수 (모든 조합에 공통)
+
+    Returns:
+        log-loss 오름차순 결과 목록
+    """
+    if matches is None:
+        matches = prepare_matches()
+    eval_mask = evaluation_mask(matches, min_games)
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(grid)) or 1
+
+    if workers == 1:
+        results = [simulate(matches, params, eval_mask) for params in grid]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(matches, eval_mask)
+        ) as pool:
+            results = list(pool.map(_simulate_in_worker, grid))
+
+    results.sort(key=lambda r: (math.isnan(r["log_loss"]), r["log_loss"]))
+    return results
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def _parse_list(text: str, cast=float) -> List[Any]:
+    return [cast(item) for item in text.split(",") if item.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rating 파라미터 스윕 시뮬레이터")
+    parser.add_argument("--k", default="16,24,32,40,48", help="K값 목록 (쉼표 구분)")
+    parser.add_argument("--default-rating", default=str(DEFAULT_RATING), help="초기 Rating 목록")
+    parser.add_argument("--min-games", type=int, default=MIN_GAMES_FOR_RANKING,
+                        help="평가 대상 매치의 최소 판수 (모든 조합에 공통)")
+    parser.add_argument("--margin-scale", default="0,0.5,1,1.5",
+                        help="마진 가중치 배율 목록 (1=현재 테이블)")
+    parser.add_argument("--workers", type=int, default=0, help="프로세스 수 (0=CPU 코어 수)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 조합 수")
+    args = parser.parse_args()
+
+    matches = prepare_matches()
+    if not matches:
+        print("매치 히스토리가 없습니다.")
+        return 1
+
+    grid = build_grid(
+        _parse_list(args.k),
+        _parse_list(args.default_rating),
+        _parse_list(args.margin_scale)
+    )
+    results = run_sweep(grid, matches, args.workers, args.min_games)
+
+    print(f"매치 {len(matches)}건 × 조합 {len(grid)}개 (평가: 최소 {args.min_games}판 이상끼리)")
+    print(f"{'K':>6} {'초기':>6} {'마진':>5} {'집계':>7} {'log-loss':>9} {'정확도':>7}")
+    for result in results[:args.top]:
+        p = result["params"]
+        print(
+            f"{p['k_factor']:>6g} {p['default_rating']:>6g} "
+            f"{p['margin_scale']:>5g} {result['evaluated']:>7} "
+            f"{result['log_loss']:>9.4f} {result['accuracy'] * 100:>6.1f}%"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
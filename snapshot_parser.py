@@ -0,0 +1,176 @@
+"""
+오프라인 HTML 스냅샷 파서
+- 브라우저 "페이지 저장"으로 보관한 Fightcade 리플레이 페이지 HTML 파싱
+- 크롤러(_parse_match_row)와 동일한 행을 config.XPATH / CSS_SELECTORS 기준으로 추출
+- 브라우저(Chromium) 없이 lxml 트리 파서로 동작 → 대량 적재 및 벤치마크 픽스처용
+"""
+
+import os
+import glob
+import importlib.util
+from typing import List, Dict, Any, Optional, Iterable
+
+from config import XPATH, CSS_SELECTORS
+
+# lxml은 파싱 시점에 임포트
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+
+
+# =============================================================================
+# XPath 준비
+# =============================================================================
+_ROW_FIELDS = ("row_id1", "row_id2", "row_score1", "row_score2")
+
+# 저장된 페이지는 래퍼 요소가 추가되어 절대 경로가 어긋날 수 있으므로
+# 행 템플릿에서 tr 이후의 상대 경로만 분리해 백업 경로로 사용
+_ROW_CELL_PATHS = {
+    field: XPATH[field].split("tr[{row}]/", 1)[1]
+    for field in _ROW_FIELDS
+}
+
+# CSS_SELECTORS["table_rows"] ("table tbody tr")와 동일한 XPath
+_TABLE_ROWS_XPATH = "//" + "/".join(CSS_SELECTORS["table_rows"].split())
+
+
+# =============================================================================
+# 행 파싱
+# =============================================================================
+def _first_text(node: Any, xpath: str) -> Optional[str]:
+    """XPath 첫 요소의 텍스트 (없으면 None)"""
+    found = node.xpath(xpath)
+    if not found:
+        return None
+    text = found[0].text_content().strip()
+    return text or None
+
+
+def _build_match(id1: Optional[str], id2: Optional[str],
+                 score1_text: Optional[str], score2_text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """크롤러와 동일한 형식의 매치 dict 생성"""
+    if not all([id1, id2, score1_text, score2_text]):
+        return None
+
+    try:
+        score1 = int(score1_text)
+        score2 = int(score2_text)
+    except ValueError:
+        return None
+
+    winner = id1 if score1 > score2 else id2
+
+    return {
+        "id1": id1,
+        "id2": id2,
+        "score1": score1,
+        "score2": score2,
+        "winner": winner
+    }
+
+
+def _parse_rows_absolute(tree: Any) -> List[Dict[str, Any]]:
+    """config.XPATH 절대 경로 템플릿으로 행 파싱"""
+    matches = []
+    row_idx = 1
+
+    while True:
+        values = [_first_text(tree, XPATH[field].format(row=row_idx)) for field in _ROW_FIELDS]
+        match = _build_match(*values)
+        if not match:
+            break
+        matches.append(match)
+        row_idx += 1
+
+    return matches
+
+
+def _parse_rows_relative(tree: Any) -> List[Dict[str, Any]]:
+    """테이블 행 셀렉터 + 상대 셀 경로로 행 파싱 (절대 경로 실패 시)"""
+    matches = []
+
+    for row in tree.xpath(_TABLE_ROWS_XPATH):
+        values = [_first_text(row, _ROW_CELL_PATHS[field]) for field in _ROW_FIELDS]
+        match = _build_match(*values)
+        if match:
+            matches.append(match)
+
+    return matches
+
+
+def parse_snapshot_html(html: bytes, user_a: Optional[str] = None,
+                        user_b: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    리플레이 페이지 HTML에서 매치 행 추출
+
+    Args:
+        html: 페이지 HTML (bytes 또는 str)
+        user_a, user_b: 지정 시 두 유저 간의 매치만 반환
+
+    Returns:
+        [{"id1", "id2", "score1", "score2", "winner"}, ...] (페이지 순서 유지)
+    """
+    if not LXML_AVAILABLE:
+        raise RuntimeError("lxml이 설치되어 있지 않습니다. (pip install lxml)")
+
+    if not html or not html.strip():
+        return []
+
+    import lxml.html
+
+    tree = lxml.html.fromstring(html)
+
+    matches = _parse_rows_absolute(tree)
+    if not matches:
+        matches = _parse_rows_relative(tree)
+
+    if user_a and user_b:
+        pair = {user_a.lower(), user_b.lower()}
+        matches = [m for m in matches if {m["id1"].lower(), m["id2"].lower()} == pair]
+
+    return matches
+
+
+def parse_snapshot_file(path: str, user_a: Optional[str] = None,
+                        user_b: Optional[str] = None) -> List[Dict[str, Any]]:
+    """저장된 HTML 파일 하나 파싱"""
+    with open(path, 'rb') as f:
+        return parse_snapshot_html(f.read(), user_a, user_b)
+
+
+# =============================================================================
+# 대량 적재
+# =============================================================================
+def find_snapshot_files(directory: str) -> List[str]:
+    """디렉토리 내 HTML 스냅샷 파일 목록 (이름순)"""
+    paths = glob.glob(os.path.join(directory, "*.htm")) + glob.glob(os.path.join(directory, "*.html"))
+    return sorted(paths)
+
+
+def parse_snapshot_files(paths: Iterable[str], user_a: Optional[str] = None,
+                         user_b: Optional[str] = None) -> Dict[str, Any]:
+    """
+    여러 스냅샷 파일 일괄 파싱
+    읽기 실패(OSError) / HTML 파싱 실패(lxml ParserError) 파일만 failed로 모으고
+    그 외 오류(lxml 미설치 등)는 그대로 전파
+
+    Returns:
+        {"matches": [...], "files": int, "failed": [경로, ...]}
+    """
+    if not LXML_AVAILABLE:
+        raise RuntimeError("lxml이 설치되어 있지 않습니다. (pip install lxml)")
+
+    from lxml.etree import ParserError
+
+    result = {
+        "matches": [],
+        "files": 0,
+        "failed": []
+    }
+
+    for path in paths:
+        try:
+            result["matches"].extend(parse_snapshot_file(path, user_a, user_b))
+            result["files"] += 1
+        except (ParserError, OSError):
+            result["failed"].append(path)
+
+    return result
@@ -0,0 +1,139 @@
+"""
+연승/연패 + 최근 폼 (매치 추가 시 증분 갱신)
+- 플레이어별, 플레이어 쌍별로 시간순 매치 결과(승/패/무)와 현재 연속 기록, 최장 연승/연패 보관
+- 시간순 뒤에 붙는 매치는 O(1), 과거 매치가 끼어들면 해당 플레이어/쌍만 다시 계산
+- 매치 승패는 라운드 스코어로 판정 (같으면 무승부 → 연속 기록 끊김)
+"""
+
+import bisect
+from typing import List, Dict, Any, Callable, Iterable, Tuple
+
+FORM_LENGTH = 5     # 폼 문자열 기본 길이 (최근 N판)
+
+WIN, DRAW, LOSS = 1, 0, -1
+_FORM_CHARS = {WIN: "W", DRAW: "D", LOSS: "L"}
+
+
+class _Streak:
+    """시간순 결과 + 연속 기록 (current > 0 연승, < 0 연패)"""
+
+    __slots__ = ("ts", "results", "current", "best", "worst")
+
+    def __init__(self):
+        self.ts: List[float] = []
+        self.results: List[int] = []
+        self.current = 0
+        self.best = 0       # 최장 연승
+        self.worst = 0      # 최장 연패 (음수)
+
+    def _push(self, result: int) -> None:
+        if result == WIN:
+            self.current = self.current + 1 if self.current > 0 else 1
+        elif result == LOSS:
+            self.current = self.current - 1 if self.current < 0 else -1
+        else:
+            self.current = 0
+        self.best = max(self.best, self.current)
+        self.worst = min(self.worst, self.current)
+
+    def add(self, ts: float, result: int) -> None:
+        if not self.ts or ts >= self.ts[-1]:
+            self.ts.append(ts)
+            self.results.append(result)
+            self._push(result)
+            return
+
+        # 과거 시각의 매치: 끼워 넣고 연속 기록 재계산
+        pos = bisect.bisect_right(self.ts, ts)
+        self.ts.insert(pos, ts)
+        self.results.insert(pos, result)
+        self.current = self.best = self.worst = 0
+        for r in self.results:
+            self._push(r)
+
+    def summary(self, form_length: int, flip: bool = False) -> Dict[str, Any]:
+        """flip=True면 상대 기준 (쌍 조회에서 뒤쪽 플레이어 관점)"""
+        sign = -1 if flip else 1
+        current = sign * self.current
+        best, worst = (-self.worst, -self.best) if flip else (self.best, self.worst)
+        recent = self.results[-form_length:] if form_length > 0 else []
+        return {
+            "matches": len(self.results),
+            "current": current,
+            "best_win": best,
+            "best_loss": -worst,
+            "form": "".join(_FORM_CHARS[sign * r] for r in recent),
+        }
+
+
+def _empty_summary() -> Dict[str, Any]:
+    return {"matches": 0, "current": 0, "best_win": 0, "best_loss": 0, "form": ""}
+
+
+def streak_label(current: int) -> str:
+    """현재 연속 기록 표시 ("W3" / "L2" / "-")"""
+    if current > 0:
+        return f"W{current}"
+    if current < 0:
+        return f"L{-current}"
+    return "-"
+
+
+class StreakTracker:
+    """플레이어별 / 쌍별 연승·연패 인덱스"""
+
+    def __init__(self, timestamp: Callable[[Dict[str, Any]], float]):
+        """
+        Args:
+            timestamp: 매치 dict → 정렬용 Unix timestamp
+        """
+        self.timestamp = timestamp
+        self.players: Dict[str, _Streak] = {}
+        self.pairs: Dict[Tuple[str, str], _Streak] = {}    # (a, b) a < b, a 기준 결과
+
+    def add_matches(self, matches: Iterable[Dict[str, Any]]) -> None:
+        """매치 dict 목록 반영 (배치 안에서는 시간순으로 적용 → 재계산 최소화)"""
+        keyed = []
+        for m in matches:
+            p1 = m.get("player1", "").lower()
+            p2 = m.get("player2", "").lower()
+            if p1 and p2 and p1 != p2:
+                keyed.append((self.timestamp(m), p1, p2, m.get("score1", 0), m.get("score2", 0)))
+        keyed.sort(key=lambda item: item[0])
+
+        for ts, p1, p2, s1, s2 in keyed:
+            self.add_result(ts, p1, p2, s1, s2)
+
+    def add_result(self, ts: float, p1: str, p2: str, s1: int, s2: int) -> None:
+        """
+        매치 1건 반영 (소문자 ID, 서로 다른 두 플레이어)
+        시간순으로 호출하면 O(1) → 이미 시간순으로 도는 Rating 재계산 루프에서 직접 호출
+        """
+        result = WIN if s1 > s2 else LOSS if s1 < s2 else DRAW
+        self.players.setdefault(p1, _Streak()).add(ts, result)
+        self.players.setdefault(p2, _Streak()).add(ts, -result)
+        if p1 < p2:
+            self.pairs.setdefault((p1, p2), _Streak()).add(ts, result)
+        else:
+            self.pairs.setdefault((p2, p1), _Streak()).add(ts, -result)
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+    def player(self, player_id: str, form_length: int = FORM_LENGTH) -> Dict[str, Any]:
+        """
+        플레이어 연속 기록
+
+        Returns:
+            {"matches", "current" (+연승/-연패), "best_win", "best_loss", "form" (오래된 → 최근)}
+        """
+        streak = self.players.get(player_id.lower())
+        return streak.summary(form_length) if streak else _empty_summary()
+
+    def pair(self, player_a: str, player_b: str, form_length: int = FORM_LENGTH) -> Dict[str, Any]:
+        """두 플레이어 맞대결 연속 기록 (player_a 기준)"""
+        a = player_a.lower()
+        b = player_b.lower()
+        flip = a > b
+        streak = self.pairs.get((b, a) if flip else (a, b))
+        return streak.summary(form_length, flip) if streak else _empty_summary()
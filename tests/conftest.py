@@ -0,0 +1,9 @@
+"""
+테스트 공용 설정
+- 저장소 루트 모듈(data_manager 등)을 임포트할 수 있도록 경로 추가
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
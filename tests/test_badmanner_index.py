@@ -0,0 +1,69 @@
+"""비매너 리스트 인덱스 (해시 조회 + 트라이그램 점수 검색)"""
+
+import data_manager
+from badmanner_index import BadmannerIndex
+
+ENTRIES = [
+    {"user_id": "Ryu", "reason": "rage quit", "added_date": "2025-01-01 10:00:00"},
+    {"user_id": "ryu_master", "reason": "", "added_date": "2025-01-03 10:00:00"},
+    {"user_id": "ken_ryu", "reason": "", "added_date": "2025-01-02 10:00:00"},
+    {"user_id": "ryyu", "reason": "", "added_date": "2025-01-03 10:00:00"},
+    {"user_id": "guile", "reason": "", "added_date": "2025-01-02 10:00:00"},
+]
+
+
+def _ids(results):
+    return [entry["user_id"] for entry, _ in results]
+
+
+def test_search_ranks_exact_then_prefix_then_substring_then_fuzzy():
+    index = BadmannerIndex(ENTRIES)
+    results = index.search("RYU")
+
+    assert _ids(results) == ["Ryu", "ryu_master", "ken_ryu", "ryyu"]
+    scores = [score for _, score in results]
+    assert scores[0] == 3.0 and 2.0 < scores[1] < 3.0 and 1.0 < scores[2] < 2.0 and scores[3] < 1.0
+    assert _ids(index.search("ryu", fuzzy=False)) == ["Ryu", "ryu_master", "ken_ryu"]
+    assert _ids(index.search("ryu", limit=2)) == ["Ryu", "ryu_master"]
+
+
+def test_short_queries_scan_every_id():
+    index = BadmannerIndex(ENTRIES)
+    assert _ids(index.search("ui")) == ["guile"]
+    assert index.search("  ") == []
+
+
+def test_lookup_order_and_filtered_pages():
+    index = BadmannerIndex(ENTRIES)
+    assert index.contains("RYU") and index.get("ken_RYU")["user_id"] == "ken_ryu"
+    assert index.position("nobody") is None
+
+    # 같은 등록 시각이면 나중에 추가된 항목이 먼저
+    recent = [ENTRIES[pos]["user_id"] for pos in index.sorted_positions("recent")]
+    assert recent == ["ryyu", "ryu_master", "guile", "ken_ryu", "Ryu"]
+
+    page, total = index.page(1, 2, query="ryu")
+    assert total == 4 and [entry["user_id"] for entry in page] == ["Ryu", "ryu_master"]
+
+
+def test_restored_index_matches_fresh_build():
+    fresh = BadmannerIndex(ENTRIES)
+    restored = BadmannerIndex.from_dict(ENTRIES, fresh.to_dict())
+    for query in ("ryu", "ken", "gui", "xyz"):
+        assert restored.search(query) == fresh.search(query)
+    assert BadmannerIndex.from_dict(ENTRIES[:2], fresh.to_dict()) is None
+
+
+def test_add_remove_keep_saved_index_in_sync(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert data_manager.add_badmanner("Ryu", "rage quit")
+    assert not data_manager.add_badmanner("ryu")
+    assert data_manager.add_badmanner("ken_ryu")
+    assert data_manager.remove_badmanner("RYU")
+
+    # 메모리 캐시를 비우면 저장된 인덱스에서 복원
+    monkeypatch.setitem(data_manager._badmanner_index_cache, "version", None)
+    index = data_manager.get_badmanner_index()
+    assert index.ids == ["ken_ryu"]
+    assert _ids(index.search("ryu")) == ["ken_ryu"]
+    assert not data_manager.is_badmanner("ryu")
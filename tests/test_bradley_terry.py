@@ -0,0 +1,60 @@
+"""Bradley-Terry 강도 추정 (Newton + CG)"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bradley_terry import fit_strengths, fit_ratings
+
+
+def _mm_reference(n, pair_a, pair_b, wins_a, wins_b, prior, iters=5000):
+    """Zermelo/MM 반복 참조 구현 (가상 상대 강도 1과 prior 라운드씩 승/패)"""
+    p = np.ones(n)
+    wins = np.full(n, prior, dtype=float)
+    for a, b, wa, wb in zip(pair_a, pair_b, wins_a, wins_b):
+        wins[a] += wa
+        wins[b] += wb
+    for _ in range(iters):
+        denom = 2 * prior / (p + 1)
+        for a, b, wa, wb in zip(pair_a, pair_b, wins_a, wins_b):
+            denom[a] += (wa + wb) / (p[a] + p[b])
+            denom[b] += (wa + wb) / (p[a] + p[b])
+        p = wins / denom
+    return p / np.exp(np.log(p).mean())
+
+
+def test_matches_mm_reference_on_random_tallies():
+    rng = random.Random(11)
+    n = 12
+    pairs = [(a, b) for a in range(n) for b in range(a + 1, n) if rng.random() < 0.4]
+    pair_a = [a for a, _ in pairs]
+    pair_b = [b for _, b in pairs]
+    wins_a = [rng.randint(0, 6) for _ in pairs]
+    wins_b = [rng.randint(0, 6) for _ in pairs]
+
+    strengths, iterations = fit_strengths(n, pair_a, pair_b, wins_a, wins_b, prior=1.0)
+    expected = _mm_reference(n, pair_a, pair_b, wins_a, wins_b, prior=1.0)
+
+    assert iterations < 50
+    assert np.allclose(strengths, expected, rtol=1e-6)
+    assert np.isclose(np.log(strengths).mean(), 0.0)
+
+
+def test_unbeaten_player_stays_finite():
+    strengths, _ = fit_strengths(3, [0, 1], [1, 2], [9, 5], [0, 5])
+    assert np.all(np.isfinite(strengths))
+    # 1번은 0번에게 전패, 2번과는 동률 → 2번보다 약간 낮음
+    assert strengths[0] > strengths[2] > strengths[1] > 0
+
+
+def test_fit_ratings_is_symmetric_and_order_independent():
+    tallies = {("a", "b"): [3, 1], ("b", "c"): [2, 2]}
+    ratings = fit_ratings(tallies, base_rating=1200)
+    reordered = fit_ratings({("c", "b"): [2, 2], ("b", "a"): [1, 3]}, base_rating=1200)
+
+    assert ratings == reordered
+    assert ratings["a"] > ratings["c"] > ratings["b"]
+    assert np.isclose(sum(ratings.values()) / 3, 1200, atol=0.1)
+    assert fit_ratings({}) == {}
@@ -0,0 +1,76 @@
+"""크롤링 캐시 병합 / 조기 중단 기준"""
+
+from crawler import _find_known_anchor, _cache_overlap, _merge_with_cache
+from config import CRAWL_CACHE_MIN_ANCHOR_ROWS, ROWS_PER_PAGE
+
+
+def _m(score1, score2, id1="a", id2="b"):
+    return {"id1": id1, "id2": id2, "score1": score1, "score2": score2,
+            "winner": id1 if score1 > score2 else id2}
+
+
+def _rows(scores):
+    return [_m(s1, s2) for s1, s2 in scores]
+
+
+CACHED = _rows([(2, 0), (2, 1), (0, 2), (1, 2), (2, 0), (2, 1)])
+
+
+def test_head_repeat_is_not_treated_as_known():
+    """새 매치가 캐시의 최신 몇 행과 우연히 같아도 기준 행 묶음 전체가 이어지지 않으면 기존 매치로 보지 않음"""
+    crawled = _rows([(2, 0), (2, 1), (0, 2)])
+    assert _find_known_anchor(crawled, CACHED) is None
+
+
+def test_entire_cache_lines_up():
+    new = _rows([(2, 0), (2, 1), (0, 2)])
+    assert _find_known_anchor(new + CACHED, CACHED) == 3
+
+
+def test_short_cache_never_anchors():
+    cached = CACHED[:CRAWL_CACHE_MIN_ANCHOR_ROWS - 1]
+    assert _find_known_anchor(cached, cached) is None
+
+
+def test_merge_keeps_older_cache_when_pages_run_out():
+    new = _rows([(1, 2), (1, 2)])
+    crawled = new + CACHED[:2]      # max_pages에서 끊김
+    merged, added = _merge_with_cache(crawled, CACHED, complete=False)
+    assert merged == new + CACHED
+    assert added == 2
+
+
+def test_merge_without_overlap_appends_whole_cache():
+    crawled = _rows([(0, 2)] * 3)
+    assert _cache_overlap(crawled, CACHED) == 0
+    merged, added = _merge_with_cache(crawled, CACHED, complete=False)
+    assert merged == crawled + CACHED
+    assert added == 3
+
+
+def test_complete_crawl_replaces_cache():
+    crawled = _rows([(2, 0), (0, 2)])
+    merged, _ = _merge_with_cache(crawled, CACHED, complete=True)
+    assert merged == crawled
+
+
+def test_anchored_crawl_counts_only_new_rows():
+    new = _rows([(1, 2)])
+    merged, added = _merge_with_cache(new + CACHED, CACHED, complete=False)
+    assert merged == new + CACHED
+    assert added == 1
+
+
+def test_cache_longer_than_one_crawl_still_anchors():
+    """병합으로 캐시가 크롤링 범위보다 길어져도 최신 한 페이지 분량만 일치하면 조기 중단"""
+    scores = [(2, 0), (2, 1), (0, 2), (1, 2), (2, 2), (3, 1), (1, 3)]
+    cached = _rows([scores[(i * 3 + i // 7) % 7] for i in range(ROWS_PER_PAGE * 4)])
+    new = _rows([(0, 3), (3, 0)])
+    crawled = new + cached[:ROWS_PER_PAGE + 2]      # 한 페이지 남짓만 읽은 상태
+
+    assert _find_known_anchor(crawled, cached) == 2
+    assert _find_known_anchor(new + cached[:ROWS_PER_PAGE - 1], cached) is None
+
+    merged, added = _merge_with_cache(crawled, cached, complete=False)
+    assert merged == new + cached
+    assert added == 2
@@ -0,0 +1,108 @@
+"""Glicko-2 기간 단위 일괄 갱신"""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from glicko2 import GLICKO2_SCALE, GLICKO2_DEFAULT_VOLATILITY, _g, _update_volatility, fit_ratings
+
+
+def test_glickman_example_step_by_step():
+    """Glickman (2013) 예제: 1500/200 플레이어가 1400/30 승, 1550/100 패, 1700/300 패"""
+    mu = 0.0
+    phi = 200 / GLICKO2_SCALE
+    mu_j = (np.array([1400.0, 1550.0, 1700.0]) - 1500) / GLICKO2_SCALE
+    phi_j = np.array([30.0, 100.0, 300.0]) / GLICKO2_SCALE
+    s = np.array([1.0, 0.0, 0.0])
+
+    g_j = _g(phi_j)
+    expected = 1 / (1 + np.exp(-g_j * (mu - mu_j)))
+    v = 1 / np.sum(g_j ** 2 * expected * (1 - expected))
+    delta = v * np.sum(g_j * (s - expected))
+    assert v == pytest.approx(1.7785, abs=1e-3)
+    assert delta == pytest.approx(-0.4834, abs=1e-3)
+
+    sigma = _update_volatility(
+        np.array([GLICKO2_DEFAULT_VOLATILITY]), np.array([phi]), np.array([v]), np.array([delta]), 0.5
+    )[0]
+    phi_star = math.sqrt(phi ** 2 + sigma ** 2)
+    new_phi = 1 / math.sqrt(1 / phi_star ** 2 + 1 / v)
+    new_mu = mu + new_phi ** 2 * np.sum(g_j * (s - expected))
+
+    assert sigma == pytest.approx(0.05999, abs=1e-5)
+    assert 1500 + GLICKO2_SCALE * new_mu == pytest.approx(1464.06, abs=0.01)
+    assert GLICKO2_SCALE * new_phi == pytest.approx(151.52, abs=0.01)
+
+
+def test_volatility_is_solved_per_player():
+    """배열로 한 번에 푼 결과가 플레이어별로 따로 푼 결과와 같음"""
+    sigma = np.array([0.06, 0.05, 0.09])
+    phi = np.array([1.15, 0.4, 2.0])
+    v = np.array([1.78, 0.9, 3.0])
+    delta = np.array([-0.48, 1.6, 0.1])
+
+    together = _update_volatility(sigma, phi, v, delta, 0.5)
+    for k in range(3):
+        alone = _update_volatility(sigma[k:k + 1], phi[k:k + 1], v[k:k + 1], delta[k:k + 1], 0.5)
+        assert together[k] == pytest.approx(alone[0], rel=1e-9)
+
+
+def test_single_period_head_to_head_is_symmetric():
+    ratings, rds, sigmas = fit_ratings(2, [0], [0], [1], [1.0], base_rating=1500, base_rd=350)
+
+    assert ratings[0] > 1500 > ratings[1]
+    assert ratings[0] - 1500 == pytest.approx(1500 - ratings[1])
+    assert rds[0] == pytest.approx(rds[1]) and rds[0] < 350
+
+
+def test_idle_periods_grow_rd_up_to_base():
+    period = [0, 0, 1]
+    args = ([0, 0, 2], [1, 1, 3], [1.0, 0.0, 1.0])
+    _, rds, _ = fit_ratings(4, period, *args, base_rating=1500, base_rd=350)
+    _, rested, _ = fit_ratings(4, period, *args, base_rating=1500, base_rd=350, trailing_periods=3)
+    _, forever, _ = fit_ratings(4, period, *args, base_rating=1500, base_rd=350, trailing_periods=10 ** 6)
+
+    # 1기간에 쉰 0, 1번은 이미 RD 증가, 쉬는 기간이 길수록 더 커지되 초기 RD를 넘지 않음
+    assert np.all(rested > rds)
+    assert np.allclose(forever, 350)
+
+
+def _leaderboard_history(tmp_path, dates):
+    import json
+
+    players = ["alice", "bob", "carol"]
+    history = [
+        {"date": date, "game": "sf2",
+         "player1": players[i % 3], "score1": 2 if i % 3 == 0 else 1,
+         "player2": players[(i + 1) % 3], "score2": 0 if i % 3 == 0 else 2}
+        for i, date in enumerate(dates)
+    ]
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "match_history.json").write_text(json.dumps(history), encoding="utf-8")
+
+
+def test_leaderboard_with_unparseable_dates_uses_ingest_order(tmp_path, monkeypatch):
+    import data_manager
+
+    monkeypatch.chdir(tmp_path)
+    _leaderboard_history(tmp_path, ["날짜 없음"] * 150)
+
+    board = data_manager.get_glicko2_leaderboard()
+    rows = board.top()
+    assert [row["user_id"] for row in rows] == ["alice", "carol", "bob"]
+    assert all(row["rd"] <= data_manager.GLICKO2_PROVISIONAL_RD for row in rows)
+
+
+def test_leaderboard_periods_start_at_earliest_parsed_date(tmp_path, monkeypatch):
+    import data_manager
+
+    monkeypatch.chdir(tmp_path)
+    # 최근 날짜 매치 사이에 파싱 실패 매치가 섞여 있어도 최근 기간 기준으로 RD 유지
+    today = data_manager.get_today_str().split("-")
+    parsed = f"{int(today[0])}. {int(today[1])}. {int(today[2])}. 오전 0:00:00"
+    _leaderboard_history(tmp_path, [parsed if i % 5 else "???" for i in range(90)])
+
+    rows = data_manager.get_glicko2_leaderboard().top()
+    assert [row["user_id"] for row in rows] == ["alice", "carol", "bob"]
@@ -0,0 +1,93 @@
+"""상대 전적 행렬 (희소, 증분 갱신)"""
+
+import random
+
+import data_manager
+from h2h_matrix import HeadToHeadMatrix
+
+
+def _random_matches(seed, count):
+    rng = random.Random(seed)
+    players = ["Alice", "alice", "bob", "Carol", "dave", "eve", ""]
+    return [
+        {"player1": rng.choice(players), "score1": rng.randint(0, 3),
+         "player2": rng.choice(players), "score2": rng.randint(0, 3)}
+        for _ in range(count)
+    ]
+
+
+def _brute(matches):
+    """(a, b) → [a 승, b 승, 매치 수] 양방향"""
+    cells = {}
+    for m in matches:
+        p1, p2 = m["player1"].lower(), m["player2"].lower()
+        if not p1 or not p2 or p1 == p2:
+            continue
+        for a, b, sa, sb in ((p1, p2, m["score1"], m["score2"]), (p2, p1, m["score2"], m["score1"])):
+            cell = cells.setdefault((a, b), [0, 0, 0])
+            cell[0] += sa
+            cell[1] += sb
+            cell[2] += 1
+    return cells
+
+
+def test_incremental_batches_equal_single_rebuild():
+    matches = _random_matches(1, 500)
+
+    rebuilt = HeadToHeadMatrix()
+    rebuilt.add_matches(matches)
+    incremental = HeadToHeadMatrix()
+    for i in range(0, len(matches), 23):
+        incremental.add_matches(matches[i:i + 23])
+
+    assert incremental.pair_tallies() == rebuilt.pair_tallies()
+
+    expected = _brute(matches)
+    players = {a for a, _ in expected}
+    for a in players:
+        for b in players - {a}:
+            assert incremental.pair(a.upper(), b) == expected.get((a, b))
+        assert sorted(incremental.opponents(a)) == sorted(
+            (b, cell) for (x, b), cell in expected.items() if x == a
+        )
+
+
+def test_self_and_empty_matches_are_ignored():
+    matrix = HeadToHeadMatrix()
+    matrix.add_matches([
+        {"player1": "a", "score1": 2, "player2": "A", "score2": 0},
+        {"player1": "", "score1": 2, "player2": "b", "score2": 0},
+    ])
+    assert len(matrix) == 0
+    assert matrix.pair("a", "b") is None and matrix.opponents("a") == []
+
+
+def test_submatrix_only_includes_requested_pairs_with_games():
+    matrix = HeadToHeadMatrix()
+    matrix.add_matches([
+        {"player1": "a", "score1": 2, "player2": "b", "score2": 1},
+        {"player1": "c", "score1": 0, "player2": "a", "score2": 2},
+        {"player1": "b", "score1": 2, "player2": "d", "score2": 2},
+    ])
+
+    assert matrix.submatrix(["A", "b", "c", "nobody"]) == {
+        "a": {"b": [2, 1, 1], "c": [2, 0, 1]},
+        "b": {"a": [1, 2, 1]},
+        "c": {"a": [0, 2, 1]},
+    }
+
+
+def test_ingested_aggregate_matches_rebuild_from_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    matches = [
+        dict(m, date=f"2025. 1. {i % 28 + 1}. 오후 1:{i % 60:02d}:00")
+        for i, m in enumerate(_random_matches(2, 120))
+    ]
+    data_manager.save_match_data(matches[:40])
+    before = data_manager.get_h2h_index()             # 이후 저장분은 증분 반영
+    data_manager.ingest_match_batches([matches[40:80], matches[80:]])
+    assert data_manager.get_h2h_index() is before     # 재구성 없이 같은 객체 갱신
+
+    rebuilt = HeadToHeadMatrix()
+    rebuilt.add_matches(data_manager.load_match_history())
+    assert data_manager.get_h2h_index().pair_tallies() == rebuilt.pair_tallies()
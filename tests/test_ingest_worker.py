@@ -0,0 +1,56 @@
+"""매치 저장 그룹 커밋 (중복 제거 + 백그라운드 워커)"""
+
+import pytest
+
+import data_manager
+import ingest_worker
+
+
+def _match(minute, p1="alice", s1=2, p2="bob", s2=1):
+    return {"date": f"2025. 1. 2. 오후 1:{minute:02d}:00", "game": "sf2",
+            "player1": p1, "score1": s1, "player2": p2, "score2": s2}
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """빈 데이터 디렉터리에서 실행 (data_manager는 상대 경로 data/ 사용)"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_batches_dedupe_against_history_and_each_other(data_dir):
+    data_manager.save_match_data([_match(0)])
+
+    results = data_manager.ingest_match_batches([
+        [_match(0), _match(1)],
+        [_match(1), _match(2), _match(2)],
+        [],
+    ])
+
+    assert results == [(1, 1), (1, 2), (0, 0)]
+    assert len(data_manager.load_match_history()) == 3
+    # Rating에는 새로 추가된 2건만 반영 (save_match_data 분은 Rating 미반영)
+    assert data_manager.load_player_ratings()["alice"]["games"] == 2
+
+
+def test_worker_commits_jobs_and_reports_counts(data_dir):
+    jobs = [ingest_worker.submit_matches([_match(i), _match(i + 1)]) for i in range(0, 6, 2)]
+    jobs.append(ingest_worker.submit_matches([_match(0)]))
+
+    assert ingest_worker.wait_until_idle(timeout=10)
+    assert all(job.is_done() and job.error is None for job in jobs)
+    assert sum(job.added for job in jobs) == 6
+    assert sum(job.skipped for job in jobs) == 1
+    assert len(data_manager.load_match_history()) == 6
+
+
+def test_worker_reports_errors_per_job(data_dir, monkeypatch):
+    def fail(batches):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ingest_worker, "ingest_match_batches", fail)
+    job = ingest_worker.submit_matches([_match(0)])
+
+    assert job.done.wait(timeout=10)
+    assert job.error == "disk full"
+    assert ingest_worker.wait_until_idle(timeout=10)
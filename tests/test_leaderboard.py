@@ -0,0 +1,90 @@
+"""리더보드 인덱스 (블록 정렬 리스트 기반 순위 / 구간 조회)"""
+
+import random
+
+from leaderboard import Leaderboard, _BlockedSortedList, _sort_key
+
+
+def _row(user_id, rating, win_rate=0.5, games=10):
+    return {"user_id": user_id, "rating": rating, "win_rate": win_rate, "games": games}
+
+
+def _expected(rows, min_games):
+    return sorted((r for r in rows.values() if r["games"] >= min_games), key=_sort_key)
+
+
+def test_rank_of_and_top_follow_sort_order():
+    board = Leaderboard()
+    board.upsert(_row("b", 1500))
+    board.upsert(_row("a", 1500))
+    board.upsert(_row("c", 1600))
+    board.upsert(_row("d", 1500, win_rate=0.9))
+
+    assert [r["user_id"] for r in board.top()] == ["c", "d", "a", "b"]
+    assert board.rank_of("C") == 1
+    assert board.rank_of("b") == 4
+    assert board.rank_of("nobody") is None
+    assert [r["user_id"] for r in board.top(2, offset=1)] == ["d", "a"]
+    assert board.top(5, offset=10) == []
+
+
+def test_min_games_excludes_and_upsert_moves_player():
+    board = Leaderboard(min_games=5)
+    board.upsert(_row("a", 1500, games=3))
+    assert len(board) == 0 and board.rank_of("a") is None
+
+    board.upsert(_row("a", 1500, games=5))
+    board.upsert(_row("b", 1400))
+    assert board.rank_of("a") == 1
+
+    board.upsert(_row("a", 1300, games=6))
+    assert board.rank_of("a") == 2
+    assert board.get("A")["rating"] == 1300
+
+    board.remove("a")
+    assert len(board) == 1 and board.get("a") is None
+
+
+def test_random_updates_match_brute_force():
+    rng = random.Random(3)
+    board = Leaderboard(min_games=2)
+    board._keys = _BlockedSortedList(load=4)     # 블록 분할/삭제 경로까지 확인
+    rows = {}
+    for step in range(3000):
+        user_id = f"p{rng.randrange(300)}"
+        if rng.random() < 0.1:
+            board.remove(user_id)
+            rows.pop(user_id, None)
+        else:
+            row = _row(user_id, rng.randrange(1400, 1600), rng.random(), rng.randrange(5))
+            board.upsert(row)
+            rows[user_id] = row
+
+        if step % 250 == 0:
+            expected = _expected(rows, 2)
+            assert board.top() == expected
+            assert board.top(7, offset=11) == expected[11:18]
+            for rank, row in enumerate(expected, 1):
+                assert board.rank_of(row["user_id"]) == rank
+
+
+def test_blocked_list_positions_after_splits_and_block_removal():
+    rng = random.Random(8)
+    keys = _BlockedSortedList(load=3)
+    reference = []
+    for _ in range(2000):
+        if reference and rng.random() < 0.45:
+            key = reference.pop(rng.randrange(len(reference)))
+            keys.remove(key)
+        else:
+            key = (rng.random(), rng.randrange(1000))
+            keys.add(key)
+            reference.append(key)
+        reference.sort()
+
+        probe = reference[rng.randrange(len(reference))] if reference else None
+        if probe is not None:
+            assert keys.index(probe) == reference.index(probe)
+        start = rng.randrange(len(reference) + 2)
+        assert keys.slice(start, start + 5) == reference[start:start + 5]
+    assert list(keys) == reference and len(keys) == len(reference)
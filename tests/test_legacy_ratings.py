@@ -0,0 +1,36 @@
+"""구버전 player_ratings.json (wins/losses 없음)에서 증분 반영"""
+
+import json
+
+import data_manager
+
+
+def _match(day, s1, s2):
+    return {"date": f"2025. 1. {day}. 오후 1:00:00", "game": "sf2",
+            "player1": "alice", "score1": s1, "player2": "bob", "score2": s2}
+
+
+def test_ingest_backfills_round_records_from_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    history = [_match(day, 2, 0) for day in range(1, 21)]
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "match_history.json").write_text(json.dumps(history), encoding="utf-8")
+    # 기준 버전 형식: rating/rd/games/last_played만 있음
+    legacy = {
+        "alice": {"rating": 1450.0, "rd": 120.0, "games": 20, "last_played": "2025-01-20"},
+        "bob": {"rating": 950.0, "rd": 120.0, "games": 20, "last_played": "2025-01-20"},
+    }
+    (tmp_path / "data" / "player_ratings.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert data_manager.get_leaderboard().get("alice")["wins"] == 40
+    assert data_manager.ingest_match_batches([[_match(21, 2, 1)]]) == [(1, 0)]
+
+    ratings = data_manager.load_player_ratings()
+    assert (ratings["alice"]["wins"], ratings["alice"]["losses"]) == (42, 1)
+    assert (ratings["bob"]["wins"], ratings["bob"]["losses"]) == (1, 42)
+    assert ratings["alice"]["games"] == 21
+
+    # 메모리 리더보드를 버리고 파일에서 다시 만들어도 같은 값
+    monkeypatch.setitem(data_manager._leaderboard_cache, "version", None)
+    row = data_manager.get_leaderboard().get("alice")
+    assert (row["wins"], row["losses"], row["win_rate"]) == (42, 1, 97.7)
@@ -0,0 +1,85 @@
+"""최근 매치 피드 (키셋 페이지네이션 커서)"""
+
+import random
+from datetime import date, datetime, time
+
+import pytest
+
+from match_feed import MatchFeed, decode_cursor, encode_cursor
+
+DAY0 = date(2025, 3, 1)
+
+
+def _ts(day_offset, hour=12):
+    return datetime.combine(date.fromordinal(DAY0.toordinal() + day_offset), time(hour)).timestamp()
+
+
+def _match(ts, p1="a", p2="b", game="sf2"):
+    return {"ts": ts, "player1": p1, "player2": p2, "game": game}
+
+
+def _all_pages(feed, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = feed.page(cursor=cursor, **kwargs)
+        pages.append(page["matches"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    key = (1740787200.25, 42)
+    assert decode_cursor(encode_cursor(key)) == key
+    assert decode_cursor(encode_cursor((float("-inf"), 0))) == (float("-inf"), 0)
+    with pytest.raises(ValueError):
+        decode_cursor("garbage")
+
+
+def test_pages_cover_history_newest_first_without_gaps():
+    rng = random.Random(4)
+    matches = [_match(_ts(rng.randrange(10), rng.randrange(24))) for _ in range(95)]
+    matches.append(_match(float("-inf")))    # 날짜 없는 매치는 가장 오래된 것으로
+    feed = MatchFeed(lambda m: m["ts"])
+    feed.add_matches(matches)
+
+    pages = _all_pages(feed, page_size=20)
+    assert [len(page) for page in pages] == [20, 20, 20, 20, 16]
+
+    flat = [m for page in pages for m in page]
+    expected = sorted(enumerate(matches), key=lambda item: (item[1]["ts"], item[0]), reverse=True)
+    assert [id(m) for m in flat] == [id(m) for _, m in expected]
+
+
+def test_cursor_stays_stable_when_newer_matches_arrive():
+    feed = MatchFeed(lambda m: m["ts"])
+    feed.add_matches([_match(_ts(0, hour)) for hour in range(10)])
+
+    first = feed.page(page_size=4)
+    feed.add_matches([_match(_ts(1, hour)) for hour in range(5)])   # 새 매치가 앞에 쌓여도
+    second = feed.page(cursor=first["next_cursor"], page_size=4)
+
+    assert [m["ts"] for m in second["matches"]] == [_ts(0, hour) for hour in (5, 4, 3, 2)]
+
+
+def test_filters_and_date_range():
+    feed = MatchFeed(lambda m: m["ts"])
+    feed.add_matches([
+        _match(_ts(0), "A", "b", "sf2"),
+        _match(_ts(1), "a", "c", "kof"),
+        _match(_ts(2), "b", "c", "sf2"),
+        _match(_ts(3), "c", "a", ""),
+    ])
+
+    def players(**kwargs):
+        return [(m["player1"], m["player2"]) for m in feed.page(**kwargs)["matches"]]
+
+    assert players(player="a") == [("c", "a"), ("a", "c"), ("A", "b")]
+    assert players(game="sf2") == [("b", "c"), ("A", "b")]
+    assert players(game="") == [("c", "a")]
+    assert players(player="C", game="kof") == [("a", "c")]
+    assert players(start=date(2025, 3, 2), end=date(2025, 3, 3)) == [("b", "c"), ("a", "c")]
+
+    page = feed.page(player="a", page_size=2)
+    rest = feed.page(player="a", page_size=2, cursor=page["next_cursor"])
+    assert [m["player2"] for m in rest["matches"]] == ["b"] and rest["next_cursor"] is None
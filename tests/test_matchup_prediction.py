@@ -0,0 +1,73 @@
+"""매치업 예측 (Elo 기대 승률 → 라운드 승률 역산 → FT-N 세트 승률)"""
+
+from functools import lru_cache
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import data_manager
+from data_manager import _round_win_probability, _set_win_probability
+
+
+def _recursive(p, first_to):
+    """세트 승률 점화식: 남은 라운드 (a, b)에서 P = p·P(a-1, b) + (1-p)·P(a, b-1)"""
+    @lru_cache(maxsize=None)
+    def win(a, b):
+        if a == 0:
+            return 1.0
+        if b == 0:
+            return 0.0
+        return p * win(a - 1, b) + (1 - p) * win(a, b - 1)
+    return win(first_to, first_to)
+
+
+def test_matches_recursive_definition_with_mixed_first_to():
+    probs = np.array([0.0, 0.1, 0.35, 0.5, 0.62, 0.9, 1.0, 0.73])
+    first_to = np.array([3, 1, 2, 5, 7, 3, 2, 10])
+
+    result = _set_win_probability(probs, first_to)
+
+    expected = [_recursive(float(p), int(n)) for p, n in zip(probs, first_to)]
+    assert np.allclose(result, expected, atol=1e-12)
+
+
+def test_first_to_one_is_round_probability_and_sets_are_complementary():
+    probs = np.linspace(0, 1, 11)
+    assert np.allclose(_set_win_probability(probs, np.ones(11, dtype=int)), probs)
+
+    for n in (2, 3, 5):
+        ft = np.full(11, n)
+        assert np.allclose(_set_win_probability(probs, ft) + _set_win_probability(1 - probs, ft), 1)
+
+
+def test_longer_sets_favor_the_stronger_player():
+    favored = _set_win_probability(np.full(4, 0.6), np.array([1, 2, 3, 5]))
+    assert np.all(np.diff(favored) > 0)
+
+
+def test_predict_matchups_uses_ratings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data_manager.update_ratings_from_match("Alice", 3, "bob", 0, date="2025. 1. 2. 오후 1:00:00")
+
+    ab, ba, unknown = data_manager.predict_matchups([("alice", "Bob", 3), ("bob", "alice", 3), ("x", "y", 2)])
+
+    assert ab["rating_a"] > ab["rating_b"]
+    assert ab["win_prob"] > ab["round_win_prob"] > 0.5
+    assert ab["win_prob"] + ba["win_prob"] == pytest.approx(1)
+    assert unknown["win_prob"] == pytest.approx(0.5)
+
+    # Rating 기대 승률은 FT3 매치 단위 → FT3 예측은 그대로, 짧은 세트는 덜 치우침
+    elo = data_manager.expected_score(ab["rating_a"], ab["rating_b"])
+    assert ab["win_prob"] == pytest.approx(elo)
+    ft1, ft2, ft7 = data_manager.predict_matchups([("alice", "bob", n) for n in (1, 2, 7)])
+    assert ft1["win_prob"] == pytest.approx(ab["round_win_prob"])
+    assert 0.5 < ft1["win_prob"] < ft2["win_prob"] < elo < ft7["win_prob"]
+    with pytest.raises(ValueError):
+        data_manager.predict_matchups([("alice", "bob", 0)])
+
+
+def test_round_probability_inverts_set_probability():
+    probs = np.linspace(0.01, 0.99, 25)
+    for ft in (1, 2, 3, 5):
+        assert np.allclose(_round_win_probability(_set_win_probability(probs, np.full(25, ft)), ft), probs)
@@ -0,0 +1,78 @@
+"""Rating 시계열 로그 (append-only 바이너리 + 다운샘플링)"""
+
+import json
+
+import numpy as np
+import pytest
+
+import data_manager
+import rating_history
+
+
+@pytest.fixture
+def history_dir(tmp_path, monkeypatch):
+    """빈 데이터 디렉터리 + 모듈 캐시 초기화"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rating_history, "_players", None)
+    monkeypatch.setattr(rating_history, "_player_index", {})
+    monkeypatch.setattr(rating_history, "_series_cache", {"size": None, "series": None})
+    return tmp_path
+
+
+def test_append_and_read_round_trip(history_dir):
+    ref = rating_history.match_ref("m1")
+    assert rating_history.append_points([
+        ("alice", 300.0, 1016.0, 190.0, ref),
+        ("bob", 300.0, 984.0, 190.0, ref),
+    ]) == 2
+    # 기록 순서와 상관없이 시간순으로 읽힘
+    rating_history.append_points([("alice", 100.0, 1000.0, 200.0, 7), ("alice", 200.0, 1010.0, 195.0, 8)])
+
+    series = rating_history.get_rating_series("ALICE")
+    assert series["total"] == 3
+    assert series["ts"].tolist() == [100.0, 200.0, 300.0]
+    assert series["rating"].tolist() == [1000.0, 1010.0, 1016.0]
+    assert series["rd"].tolist() == [200.0, 195.0, 190.0]
+    assert series["match_ref"].tolist() == [7, 8, ref]
+    assert rating_history.get_players() == ["alice", "bob"]
+
+    window = rating_history.get_rating_series("alice", start_ts=150.0, end_ts=300.0)
+    assert window["ts"].tolist() == [200.0, 300.0] and window["total"] == 2
+    assert rating_history.get_rating_series("nobody")["total"] == 0
+
+    rating_history.reset_history()
+    assert rating_history.get_players() == []
+
+
+def test_downsampling_keeps_extremes_and_endpoints():
+    values = np.full(1000, 1000.0)
+    values[123] = 1500.0
+    values[777] = 600.0
+    values[-1] = 1001.0
+
+    idx = rating_history._downsample_indices(values, 20)
+    assert len(idx) <= 20
+    assert idx[0] == 0 and idx[-1] == 999
+    assert 123 in idx and 777 in idx
+    assert list(idx) == sorted(set(idx))
+
+    assert rating_history._downsample_indices(values[:10], 20).tolist() == list(range(10))
+
+
+def test_missing_log_is_rebuilt_from_history(history_dir):
+    # 시계열 기록 도입 전 데이터: Rating 파일은 있지만 로그가 없음
+    data_manager.ingest_match_batches([[
+        {"date": f"2025. 1. {day}. 오후 1:00:00", "game": "sf2",
+         "player1": "alice", "score1": 2, "player2": "bob", "score2": 1}
+        for day in range(1, 6)
+    ]])
+    assert not data_manager.ratings_need_rebuild()
+    (history_dir / rating_history.RATING_HISTORY_FILE).unlink()
+    (history_dir / rating_history.RATING_HISTORY_PLAYERS_FILE).write_text(json.dumps([]))
+    assert data_manager.ratings_need_rebuild()
+
+    data_manager.recalculate_all_ratings()
+    assert not data_manager.ratings_need_rebuild()
+    series = data_manager.get_rating_series("alice")
+    assert series["total"] == 5
+    assert series["rating"][-1] == pytest.approx(data_manager.load_player_ratings()["alice"]["rating"])
@@ -0,0 +1,55 @@
+"""Rating 파라미터 스윕 시뮬레이터"""
+
+import math
+import random
+
+import pytest
+
+from data_manager import expected_score
+from rating_simulator import SimParams, build_grid, evaluation_mask, run_sweep, simulate
+
+
+def _synthetic_matches(seed=7, count=3000):
+    """실력 차이가 뚜렷한 플레이어들의 Elo 모델 기반 매치 (3선승)"""
+    rng = random.Random(seed)
+    skills = {f"p{i}": 800 + 100 * i for i in range(8)}
+    players = list(skills)
+    matches = []
+    for _ in range(count):
+        a, b = rng.sample(players, 2)
+        round_prob = expected_score(skills[a], skills[b])
+        wins_a = wins_b = 0
+        while wins_a < 3 and wins_b < 3:
+            if rng.random() < round_prob:
+                wins_a += 1
+            else:
+                wins_b += 1
+        matches.append((a, wins_a, b, wins_b))
+    return matches
+
+
+def test_evaluation_set_is_shared_by_every_config():
+    matches = [("a", 2, "b", 0), ("a", 2, "c", 1), ("b", 0, "c", 2), ("a", 1, "b", 2)]
+    assert evaluation_mask(matches, 1) == [False, False, True, True]
+    assert evaluation_mask(matches, 2) == [False, False, False, True]
+
+    results = run_sweep(build_grid([0, 16, 48], [1000, 1500], [0, 1]), matches, workers=1, min_games=1)
+    assert {r["evaluated"] for r in results} == {2}
+
+
+def test_known_grid_ranks_learning_config_first():
+    matches = _synthetic_matches()
+    grid = build_grid([0, 4, 32], [1200], [1.0])
+    results = run_sweep(grid, matches, workers=1, min_games=9)
+
+    assert [r["params"]["k_factor"] for r in results] == [32, 4, 0]
+    # K=0이면 모든 예측이 50% → log-loss = ln 2
+    assert results[-1]["log_loss"] == pytest.approx(math.log(2))
+    assert results[0]["accuracy"] > 0.7
+
+
+def test_parallel_sweep_matches_sequential():
+    matches = _synthetic_matches(count=400)
+    grid = build_grid([16, 32], [1000, 1200], [0, 1.5])
+    assert run_sweep(grid, matches, workers=2) == run_sweep(grid, matches, workers=1)
+    assert simulate(matches, SimParams())["evaluated"] == sum(evaluation_mask(matches))
@@ -0,0 +1,54 @@
+"""과거 시점 Rating (메모리 스냅샷 + 부분 재생)"""
+
+from datetime import datetime
+
+import pytest
+
+import data_manager
+
+
+def _match(day, p1, s1, p2, s2):
+    return {"date": f"2025. 1. {day}. 오후 1:00:00", "game": "sf2",
+            "player1": p1, "score1": s1, "player2": p2, "score2": s2}
+
+
+def _as_of(day):
+    return datetime(2025, 1, day, 23, 59)
+
+
+@pytest.fixture
+def snapshot_state(tmp_path, monkeypatch):
+    """빈 데이터 디렉터리 + 작은 스냅샷 간격"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, "RATING_SNAPSHOT_INTERVAL", 3)
+    monkeypatch.setattr(data_manager, "_snapshot_cache", {"snapshots": []})
+
+
+def _fresh(day, monkeypatch):
+    """스냅샷 없이 처음부터 재생한 결과"""
+    with monkeypatch.context() as m:
+        m.setattr(data_manager, "_snapshot_cache", {"snapshots": []})
+        return data_manager.get_ratings_as_of(_as_of(day))
+
+
+def test_snapshots_follow_new_ingests(snapshot_state, monkeypatch):
+    data_manager.ingest_match_batches([[_match(day, "alice", 2, "bob", 1) for day in range(1, 11)]])
+    before = data_manager.get_ratings_as_of(_as_of(10))
+    snapshots = data_manager._snapshot_cache["snapshots"]
+    assert [snap["count"] for snap in snapshots] == [3, 6, 9]
+    assert before["alice"]["games"] == 10
+
+    # 이후 날짜 매치 추가: 기존 스냅샷 재사용, 과거 시점 결과는 그대로
+    data_manager.ingest_match_batches([[_match(20, "bob", 2, "carol", 0)]])
+    assert data_manager.get_ratings_as_of(_as_of(10)) == before
+    assert data_manager._snapshot_cache["snapshots"][:3] == snapshots
+    assert data_manager.get_ratings_as_of(_as_of(20))["carol"]["games"] == 1
+
+    # 과거 날짜 매치 추가: 그 뒤 스냅샷은 버리고 새 히스토리로 다시 계산
+    data_manager.ingest_match_batches([[_match(2, "bob", 2, "alice", 0)]])
+    after = data_manager.get_ratings_as_of(_as_of(10))
+    assert after != before
+    assert after["alice"]["games"] == 11 and after["alice"]["losses"] == 12
+    assert after == _fresh(10, monkeypatch)
+    assert [snap["count"] for snap in data_manager._snapshot_cache["snapshots"]] == [3, 6, 9]
+    assert data_manager._snapshot_cache["snapshots"][0] != snapshots[0]
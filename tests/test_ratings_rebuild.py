@@ -0,0 +1,46 @@
+"""앱 시작 시 Rating 파생 데이터 재계산 판단 (구버전 데이터 마이그레이션)"""
+
+import json
+import os
+
+import data_manager
+
+
+def _match(day, s1, s2, game="sf2"):
+    return {"date": f"2025. 1. {day}. 오후 1:00:00", "game": game,
+            "player1": "alice", "score1": s1, "player2": "bob", "score2": s2}
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_missing_game_ratings_trigger_rebuild(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert not data_manager.ratings_need_rebuild()      # 히스토리가 없으면 할 일 없음
+
+    # 게임별 래더 도입 전 데이터: 전체 Rating만 있음
+    (tmp_path / "data").mkdir()
+    _write(tmp_path / "data" / "match_history.json", [_match(day, 2, 1) for day in range(1, 6)])
+    _write(tmp_path / "data" / "player_ratings.json",
+           {"alice": {"rating": 1100.0, "rd": 200.0, "games": 5, "last_played": "2025-01-05"}})
+    assert data_manager.ratings_need_rebuild()
+
+    data_manager.recalculate_all_ratings()
+    assert not data_manager.ratings_need_rebuild()
+    assert data_manager.load_game_ratings()["sf2"]["alice"]["games"] == 5
+
+
+def test_ingest_keeps_game_ratings_current(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data_manager.ingest_match_batches([[_match(1, 2, 0)]])
+    assert not data_manager.ratings_need_rebuild()
+
+    # 게임 없는 매치만 들어와도 게임별 Rating 파일이 히스토리보다 오래되지 않음
+    data_manager.ingest_match_batches([[_match(2, 2, 0, game="")]])
+    assert not data_manager.ratings_need_rebuild()
+
+    # 다른 경로로 히스토리만 바뀌면 재계산 대상
+    stat = os.stat(data_manager.GAME_RATINGS_FILE)
+    os.utime(data_manager.MATCH_HISTORY_FILE, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert data_manager.ratings_need_rebuild()
@@ -0,0 +1,47 @@
+"""오프라인 HTML 스냅샷 파서 (tests/fixtures/replay_page.html 픽스처)"""
+
+import os
+
+import pytest
+
+pytest.importorskip("lxml")
+
+import snapshot_parser
+from snapshot_parser import parse_snapshot_file, parse_snapshot_html, parse_snapshot_files
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "replay_page.html")
+
+
+def _fixture_bytes() -> bytes:
+    with open(FIXTURE, "rb") as f:
+        return f.read()
+
+
+def test_fixture_rows_follow_absolute_xpath():
+    import lxml.html
+
+    rows = snapshot_parser._parse_rows_absolute(lxml.html.fromstring(_fixture_bytes()))
+    assert len(rows) == 5
+    assert rows[0] == {"id1": "alpha", "id2": "beta", "score1": 2, "score2": 1, "winner": "alpha"}
+
+
+def test_pair_filter_is_case_insensitive():
+    rows = parse_snapshot_file(FIXTURE, "ALPHA", "Beta")
+    assert len(rows) == 4
+    assert all({r["id1"], r["id2"]} == {"alpha", "beta"} for r in rows)
+
+
+def test_wrapped_page_falls_back_to_relative_rows():
+    wrapped = _fixture_bytes().replace(b"<body>", b"<body><div id='saved-wrapper'>", 1)
+    assert parse_snapshot_html(wrapped) == parse_snapshot_file(FIXTURE)
+
+
+def test_unreadable_and_empty_files_are_reported(tmp_path):
+    empty_doc = tmp_path / "comment_only.html"
+    empty_doc.write_text("<!-- nothing -->")
+    missing = tmp_path / "missing.html"
+
+    result = parse_snapshot_files([FIXTURE, str(empty_doc), str(missing)])
+    assert result["files"] == 1
+    assert len(result["matches"]) == 5
+    assert result["failed"] == [str(empty_doc), str(missing)]
@@ -0,0 +1,79 @@
+"""연승/연패 트래커 (Rating 재계산 재생 vs 매치 추가 증분 갱신)"""
+
+import random
+
+import data_manager
+from streaks import StreakTracker
+
+PLAYERS = ["alice", "Alice", "bob", "carol", "dave", ""]
+
+
+def _random_matches(seed, count):
+    """무승부, 같은 플레이어(대소문자만 다름), 빈 ID, 같은 시각, 날짜 없는 매치 포함"""
+    rng = random.Random(seed)
+    matches = []
+    for i in range(count):
+        day = rng.randint(1, 20)
+        minute = rng.choice([0, 0, i % 60])       # 같은 시각 매치를 자주 만듦
+        date = "날짜 없음" if rng.random() < 0.05 else f"2025. 1. {day}. 오후 1:{minute:02d}:00"
+        score1, score2 = rng.choice([(2, 0), (2, 1), (1, 2), (0, 2), (1, 1), (0, 0)])
+        matches.append({
+            "date": date, "game": "sf2",
+            "player1": rng.choice(PLAYERS), "score1": score1,
+            "player2": rng.choice(PLAYERS), "score2": score2,
+        })
+    return matches
+
+
+def _snapshot():
+    """모든 플레이어/쌍의 전체 기록 (폼 길이를 크게 해 결과 순서까지 비교)"""
+    ids = sorted({p.lower() for p in PLAYERS if p})
+    return (
+        {p: data_manager.get_player_streak(p, form_length=1000) for p in ids},
+        {(a, b): data_manager.get_pair_streak(a, b, form_length=1000) for a in ids for b in ids if a != b},
+    )
+
+
+def test_incremental_ingest_matches_rating_replay(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    matches = _random_matches(3, 400)
+
+    # 첫 배치 후 트래커를 만들어 두고, 이후 배치(과거 날짜 포함)는 증분 반영
+    data_manager.ingest_match_batches([matches[:100]])
+    tracker = data_manager._get_match_aggregate("streaks")
+    for start in range(100, len(matches), 60):
+        data_manager.ingest_match_batches([matches[start:start + 60]])
+    assert data_manager._get_match_aggregate("streaks") is tracker
+    incremental = _snapshot()
+
+    # Rating 재계산 루프에서 함께 쌓은 트래커
+    data_manager.recalculate_all_ratings()
+    assert data_manager._get_match_aggregate("streaks") is not tracker
+    assert _snapshot() == incremental
+
+    # 히스토리 한 번에 반영한 트래커
+    fresh = StreakTracker(data_manager._timeline_timestamp)
+    fresh.add_matches(data_manager.load_match_history())
+    monkeypatch.setitem(data_manager._match_aggregates["streaks"], "value", fresh)
+    assert _snapshot() == incremental
+
+    players, _ = incremental
+    assert players["alice"]["matches"] > 0 and "D" in players["alice"]["form"]
+
+
+def test_ties_break_streaks_and_self_matches_are_ignored():
+    tracker = StreakTracker(lambda m: m["ts"])
+    tracker.add_matches([
+        {"ts": 1, "player1": "a", "score1": 2, "player2": "b", "score2": 0},
+        {"ts": 2, "player1": "b", "score1": 0, "player2": "a", "score2": 2},
+        {"ts": 3, "player1": "A", "score1": 2, "player2": "a", "score2": 0},
+        {"ts": 4, "player1": "a", "score1": 1, "player2": "b", "score2": 1},
+        {"ts": 5, "player1": "a", "score1": 2, "player2": "", "score2": 0},
+    ])
+    assert tracker.player("a") == {"matches": 3, "current": 0, "best_win": 2, "best_loss": 0, "form": "WWD"}
+    assert tracker.pair("b", "a") == {"matches": 3, "current": 0, "best_win": 0, "best_loss": 2, "form": "LLD"}
+
+    # 과거 시각 매치가 끼어들면 해당 플레이어만 다시 계산
+    tracker.add_matches([{"ts": 1.5, "player1": "a", "score1": 0, "player2": "c", "score2": 2}])
+    assert tracker.player("a")["form"] == "WLWD" and tracker.player("a")["best_win"] == 1
+    assert tracker.player("b")["form"] == "LLD"
@@ -0,0 +1,23 @@
+"""랭킹 ID 부분 문자열 필터 (트라이그램 역색인)"""
+
+import random
+
+import pytest
+
+from badmanner_index import SubstringIndex
+
+IDS = ["Alpha", "alphabet", "BETA_1", "gamma", "al", "zeta_alp"]
+
+
+@pytest.mark.parametrize("query", ["", "a", "al", "alp", "ALPHA", "ta_", "eta", "nope", "  Gam "])
+def test_find_matches_linear_scan_in_list_order(query):
+    expected = [pos for pos, user_id in enumerate(IDS) if query.strip().lower() in user_id.lower()]
+    assert SubstringIndex(IDS).find(query) == expected
+
+
+def test_find_on_random_ids():
+    rng = random.Random(7)
+    ids = ["".join(rng.choice("abc_1") for _ in range(rng.randint(1, 10))) for _ in range(2000)]
+    index = SubstringIndex(ids)
+    for query in ["ab", "abc", "c_1", "1ab_", "aaaa"]:
+        assert index.find(query) == [pos for pos, user_id in enumerate(ids) if query in user_id]
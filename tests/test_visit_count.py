@@ -0,0 +1,58 @@
+"""방문수 메모리 버퍼 + 주기적 / 종료 시 flush"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import data_manager
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def visit_state(tmp_path, monkeypatch):
+    """빈 데이터 디렉터리 + 초기 방문수 상태 (flush 스레드/atexit는 띄우지 않음)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, "_visit_daily", None)
+    monkeypatch.setattr(data_manager, "_visit_pending", {})
+    monkeypatch.setattr(data_manager, "_visit_flusher", object())
+
+
+def test_increments_stay_in_memory_until_flush(visit_state):
+    today = data_manager.get_today_str()
+    assert data_manager.increment_visit_count() == 1
+    assert data_manager.increment_visit_count() == 2
+    assert data_manager.load_visit_count() == {}
+
+    assert data_manager.flush_visit_count()
+    assert data_manager.load_visit_count() == {today: 2}
+    assert data_manager.get_visit_count() == 2
+
+
+def test_flush_adds_to_counts_written_by_other_processes(visit_state):
+    today = data_manager.get_today_str()
+    data_manager.increment_visit_count()
+
+    # 다른 프로세스가 그 사이에 기록
+    data_manager.save_visit_count({today: 5, "2025-01-01": 3})
+    data_manager.increment_visit_count()
+    assert data_manager.flush_visit_count()
+
+    assert data_manager.load_visit_count() == {today: 7, "2025-01-01": 3}
+    assert data_manager.get_visit_history(days=1) == [(today, 7)]
+
+
+def test_pending_visits_are_flushed_on_exit(tmp_path, monkeypatch):
+    """flush 주기 전에 프로세스가 끝나도 atexit에서 저장"""
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1])\n"
+        "import data_manager\n"
+        "for _ in range(3):\n"
+        "    data_manager.increment_visit_count()\n"
+    )
+    subprocess.run([sys.executable, "-c", script, REPO_ROOT], cwd=tmp_path, check=True, timeout=60)
+
+    monkeypatch.chdir(tmp_path)
+    assert data_manager.load_visit_count() == {data_manager.get_today_str(): 3}
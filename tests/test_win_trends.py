@@ -0,0 +1,70 @@
+"""롤링 승률 (누적합 구간 합)"""
+
+import random
+
+from win_trends import DAY_SECONDS, WinTrends
+
+
+def _match(ts, p1, s1, p2, s2):
+    return {"ts": ts, "player1": p1, "score1": s1, "player2": p2, "score2": s2}
+
+
+def _brute(results, start, end):
+    won = sum(w for _, w, _ in results[start:end])
+    lost = sum(l for _, _, l in results[start:end])
+    return won, lost
+
+
+def _build(seed=5, count=400):
+    """과거 시각 매치가 섞여 들어오는 히스토리 (삽입 재계산 경로 포함)"""
+    rng = random.Random(seed)
+    matches = [
+        _match(rng.randrange(0, 60) * DAY_SECONDS + rng.randrange(3600), "a", rng.randint(0, 3),
+               rng.choice(["b", "c"]), rng.randint(0, 3))
+        for _ in range(count)
+    ]
+    trends = WinTrends(lambda m: m["ts"])
+    for i in range(0, count, 37):
+        trends.add_matches(matches[i:i + 37])
+
+    ordered = sorted(((m["ts"], m["score1"], m["score2"]) for m in matches), key=lambda r: r[0])
+    return trends, ordered
+
+
+def test_last_matches_matches_brute_force():
+    trends, ordered = _build()
+    assert trends.match_count("A") == len(ordered)
+    for n in (1, 10, 57, len(ordered), len(ordered) + 5):
+        start = max(0, len(ordered) - n)
+        won, lost = _brute(ordered, start, len(ordered))
+        result = trends.last_matches("a", n)
+        assert (result["matches"], result["wins"], result["losses"]) == (len(ordered) - start, won, lost)
+
+
+def test_last_days_window_is_inclusive_of_both_ends():
+    trends, ordered = _build()
+    now = 40 * DAY_SECONDS
+    for days in (0.5, 3, 14):
+        picked = [r for r in ordered if now - days * DAY_SECONDS <= r[0] <= now]
+        result = trends.last_days("a", days, now)
+        assert result["matches"] == len(picked)
+        assert (result["wins"], result["losses"]) == _brute(picked, 0, len(picked))
+
+
+def test_rolling_series_windows_and_empty_player():
+    trends = WinTrends(lambda m: m["ts"])
+    trends.add_matches([
+        _match(3 * DAY_SECONDS, "a", 2, "b", 0),
+        _match(1 * DAY_SECONDS, "a", 0, "b", 2),
+        _match(2 * DAY_SECONDS, "a", 1, "b", 1),
+    ])
+
+    by_matches = trends.rolling_series("a", window_matches=2)
+    assert by_matches["ts"] == [DAY_SECONDS, 2 * DAY_SECONDS, 3 * DAY_SECONDS]
+    assert by_matches["win_rate"] == [0.0, 25.0, 75.0]
+
+    by_days = trends.rolling_series("b", window_days=1)
+    assert by_days["win_rate"] == [100.0, 75.0, 25.0]
+
+    assert trends.last_matches("nobody", 5)["win_rate"] is None
+    assert trends.rolling_series("nobody") == {"ts": [], "win_rate": []}
@@ -0,0 +1,89 @@
+"""기간 리더보드 (일자 버킷 슬라이딩 윈도우)"""
+
+import random
+from datetime import date, datetime, time
+
+from window_leaderboard import DailyBuckets
+
+BASE_DAY = date(2025, 1, 1).toordinal()
+
+
+def _ts(day):
+    return datetime.combine(date.fromordinal(day), time(12)).timestamp()
+
+
+def _match(day, p1, s1, p2, s2):
+    return {"day": day, "player1": p1, "score1": s1, "player2": p2, "score2": s2}
+
+
+def _timestamp(m):
+    return _ts(m["day"]) if m["day"] is not None else float("-inf")
+
+
+def _brute(matches, start, end):
+    totals = {}
+    for m in matches:
+        if m["day"] is None or not start <= m["day"] <= end:
+            continue
+        for player, won, lost in ((m["player1"], m["score1"], m["score2"]),
+                                  (m["player2"], m["score2"], m["score1"])):
+            record = totals.setdefault(player.lower(), [0, 0, 0])
+            record[0] += 1
+            record[1] += won
+            record[2] += lost
+    return totals
+
+
+def _random_matches(rng, count):
+    players = ["a", "B", "c", "d", "e"]
+    return [
+        _match(BASE_DAY + rng.randrange(60), *rng.sample(players, 1), rng.randint(0, 3),
+               *rng.sample(players, 1), rng.randint(0, 3))
+        for _ in range(count)
+    ]
+
+
+def test_sliding_window_matches_fresh_sum():
+    rng = random.Random(9)
+    matches = [m for m in _random_matches(rng, 800) if m["player1"] != m["player2"]]
+    buckets = DailyBuckets(_timestamp)
+    buckets.add_matches(matches)
+
+    # 앞으로 / 뒤로 / 겹치지 않게 / 늘이고 줄이며 이동
+    for start, end in [(0, 6), (3, 9), (1, 4), (20, 49), (25, 40), (55, 70), (-10, 2), (0, 59)]:
+        window = buckets.slide("w", BASE_DAY + start, BASE_DAY + end)
+        assert window.totals == _brute(matches, BASE_DAY + start, BASE_DAY + end)
+
+
+def test_new_matches_update_covering_windows_only():
+    buckets = DailyBuckets(_timestamp)
+    buckets.add_matches([_match(BASE_DAY, "a", 2, "b", 1)])
+    buckets.slide("week", BASE_DAY, BASE_DAY + 6)
+    buckets.slide("later", BASE_DAY + 10, BASE_DAY + 12)
+
+    buckets.add_matches([
+        _match(BASE_DAY + 3, "a", 0, "c", 2),
+        _match(BASE_DAY + 11, "b", 2, "c", 0),
+        _match(None, "a", 2, "b", 0),          # 날짜 없는 매치는 제외
+    ])
+
+    assert buckets.windows["week"].totals == {"a": [2, 2, 3], "b": [1, 1, 2], "c": [1, 2, 0]}
+    assert buckets.windows["later"].totals == {"b": [1, 2, 0], "c": [1, 0, 2]}
+
+
+def test_ranking_order_min_games_and_cache_refresh():
+    buckets = DailyBuckets(_timestamp)
+    buckets.add_matches([
+        _match(BASE_DAY, "a", 2, "b", 0),
+        _match(BASE_DAY, "c", 2, "b", 0),
+        _match(BASE_DAY + 1, "a", 2, "c", 1),
+    ])
+
+    rows = buckets.ranking("w", BASE_DAY, BASE_DAY + 1)
+    assert [row["user_id"] for row in rows] == ["a", "c", "b"]
+    assert rows[0] == {"user_id": "a", "games": 2, "wins": 4, "losses": 1, "win_rate": 80.0}
+    assert [row["user_id"] for row in buckets.ranking("w", BASE_DAY + 1, BASE_DAY + 1, min_games=1)] == ["a", "c"]
+    assert buckets.ranking("w", BASE_DAY, BASE_DAY + 1, min_games=3) == []
+
+    buckets.add_matches([_match(BASE_DAY + 1, "b", 20, "c", 0)])
+    assert buckets.ranking("w", BASE_DAY, BASE_DAY + 1)[0]["user_id"] == "b"
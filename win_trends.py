@@ -0,0 +1,151 @@
+"""
+플레이어별 롤링 승률 (누적합 기반)
+- 플레이어마다 시간순 매치 시각 + 라운드 승/패 누적합(prefix sum) 보관
+- 최근 N판 / 최근 N일 등 임의 구간 승률을 O(1) (일 단위는 이진 탐색 O(log n))로 계산
+- 매치 추가 시 해당 플레이어만 갱신 (시간순 뒤에 붙으면 O(1), 과거 매치가 끼어들면 그 플레이어만 재계산)
+"""
+
+import bisect
+from typing import List, Dict, Any, Optional, Callable, Iterable, Tuple
+
+DAY_SECONDS = 86400
+
+
+class _PlayerSeries:
+    """플레이어 한 명의 시간순 결과 + 누적합"""
+
+    __slots__ = ("ts", "wins", "losses", "won_prefix", "lost_prefix")
+
+    def __init__(self):
+        self.ts: List[float] = []
+        self.wins: List[int] = []
+        self.losses: List[int] = []
+        self.won_prefix: List[int] = [0]
+        self.lost_prefix: List[int] = [0]
+
+    def add(self, ts: float, won: int, lost: int) -> None:
+        if not self.ts or ts >= self.ts[-1]:
+            self.ts.append(ts)
+            self.wins.append(won)
+            self.losses.append(lost)
+            self.won_prefix.append(self.won_prefix[-1] + won)
+            self.lost_prefix.append(self.lost_prefix[-1] + lost)
+            return
+
+        # 과거 시각의 매치: 삽입 위치 이후 누적합만 다시 계산
+        pos = bisect.bisect_right(self.ts, ts)
+        self.ts.insert(pos, ts)
+        self.wins.insert(pos, won)
+        self.losses.insert(pos, lost)
+        del self.won_prefix[pos + 1:]
+        del self.lost_prefix[pos + 1:]
+        for i in range(pos, len(self.ts)):
+            self.won_prefix.append(self.won_prefix[-1] + self.wins[i])
+            self.lost_prefix.append(self.lost_prefix[-1] + self.losses[i])
+
+    def window(self, start: int, end: int) -> Tuple[int, int]:
+        """[start, end) 구간 라운드 (승, 패)"""
+        return (
+            self.won_prefix[end] - self.won_prefix[start],
+            self.lost_prefix[end] - self.lost_prefix[start],
+        )
+
+
+def _rate(won: int, lost: int) -> Optional[float]:
+    total = won + lost
+    return round(won / total * 100, 1) if total else None
+
+
+class WinTrends:
+    """플레이어별 롤링 승률 인덱스"""
+
+    def __init__(self, timestamp: Callable[[Dict[str, Any]], float]):
+        """
+        Args:
+            timestamp: 매치 dict → 정렬용 Unix timestamp
+        """
+        self.timestamp = timestamp
+        self.players: Dict[str, _PlayerSeries] = {}
+
+    def add_matches(self, matches: Iterable[Dict[str, Any]]) -> None:
+        """매치 dict 목록 반영"""
+        for m in matches:
+            p1 = m.get("player1", "").lower()
+            p2 = m.get("player2", "").lower()
+            if not p1 or not p2:
+                continue
+            ts = self.timestamp(m)
+            s1 = m.get("score1", 0)
+            s2 = m.get("score2", 0)
+            self.players.setdefault(p1, _PlayerSeries()).add(ts, s1, s2)
+            self.players.setdefault(p2, _PlayerSeries()).add(ts, s2, s1)
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+    def match_count(self, player_id: str) -> int:
+        series = self.players.get(player_id.lower())
+        return len(series.ts) if series else 0
+
+    def last_matches(self, player_id: str, n: int) -> Dict[str, Any]:
+        """최근 N판 라운드 승률"""
+        series = self.players.get(player_id.lower())
+        if series is None:
+            return {"matches": 0, "wins": 0, "losses": 0, "win_rate": None}
+
+        end = len(series.ts)
+        start = max(0, end - n)
+        won, lost = series.window(start, end)
+        return {"matches": end - start, "wins": won, "losses": lost, "win_rate": _rate(won, lost)}
+
+    def last_days(self, player_id: str, days: float, now: float) -> Dict[str, Any]:
+        """최근 N일 (now 기준) 라운드 승률"""
+        series = self.players.get(player_id.lower())
+        if series is None:
+            return {"matches": 0, "wins": 0, "losses": 0, "win_rate": None}
+
+        start = bisect.bisect_left(series.ts, now - days * DAY_SECONDS)
+        end = bisect.bisect_right(series.ts, now)
+        won, lost = series.window(start, end)
+        return {"matches": end - start, "wins": won, "losses": lost, "win_rate": _rate(won, lost)}
+
+    def rolling_series(
+        self,
+        player_id: str,
+        window_matches: Optional[int] = None,
+        window_days: Optional[float] = None,
+        max_points: int = 200
+    ) -> Dict[str, List[Any]]:
+        """
+        매치 시점별 롤링 승률 (최근 window_matches판 또는 최근 window_days일)
+        포인트가 많으면 균등 간격으로 max_points개만 계산 (포인트당 O(1) / O(log n))
+
+        Returns:
+            {"ts": [...], "win_rate": [...]}
+        """
+        series = self.players.get(player_id.lower())
+        if series is None or not series.ts:
+            return {"ts": [], "win_rate": []}
+
+        n = len(series.ts)
+        if n <= max_points:
+            indices = range(n)
+        else:
+            step = (n - 1) / max(max_points - 1, 1)
+            indices = sorted({round(i * step) for i in range(max_points)})
+
+        ts_out: List[float] = []
+        rate_out: List[Optional[float]] = []
+        for idx in indices:
+            # 날짜를 알 수 없는 매치는 구간 계산에만 포함하고 포인트로는 그리지 않음
+            if series.ts[idx] == float("-inf"):
+                continue
+            end = idx + 1
+            if window_days is not None:
+                start = bisect.bisect_left(series.ts, series.ts[idx] - window_days * DAY_SECONDS)
+            else:
+                start = max(0, end - (window_matches or n))
+            ts_out.append(series.ts[idx])
+            rate_out.append(_rate(*series.window(start, end)))
+
+        return {"ts": ts_out, "win_rate": rate_out}
@@ -0,0 +1,149 @@
+"""
+기간 리더보드 (일 단위 버킷 + 슬라이딩 윈도우)
+- 매치를 날짜(로컬 기준 일자)별 버킷에 플레이어별 [매치 수, 라운드 승, 라운드 패]로 누적
+- 윈도우(최근 7일, 최근 30일, 시즌 등)는 구간 합계를 유지하고,
+  구간이 이동하면 빠지는 날짜 버킷은 빼고 새로 들어오는 버킷만 더함 (전체 재집계 없음)
+- 매치 추가 시 해당 날짜 버킷과, 그 날짜를 포함하는 윈도우 합계만 갱신
+"""
+
+import bisect
+from datetime import date
+from typing import List, Dict, Any, Optional, Callable, Iterable, Tuple
+
+
+def _add_record(totals: Dict[str, List[int]], player: str, record: List[int], sign: int = 1) -> None:
+    """플레이어 합계에 [매치 수, 승, 패]를 더하거나 뺌 (0이 되면 제거)"""
+    current = totals.get(player)
+    if current is None:
+        current = totals[player] = [0, 0, 0]
+    current[0] += sign * record[0]
+    current[1] += sign * record[1]
+    current[2] += sign * record[2]
+    if current[0] == 0:
+        del totals[player]
+
+
+class _Window:
+    """[start, end] 일자 구간의 플레이어별 합계"""
+
+    def __init__(self):
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self.totals: Dict[str, List[int]] = {}
+        self.revision = 0           # 합계가 바뀔 때마다 증가 (정렬 결과 캐시용)
+        self._ranked: Optional[Tuple[int, int, List[Dict[str, Any]]]] = None
+
+    def covers(self, day: int) -> bool:
+        return self.start is not None and self.start <= day <= self.end
+
+
+class DailyBuckets:
+    """일자별 버킷 + 기간 윈도우"""
+
+    def __init__(self, timestamp: Callable[[Dict[str, Any]], float]):
+        """
+        Args:
+            timestamp: 매치 dict → Unix timestamp (날짜를 알 수 없으면 -inf)
+        """
+        self.timestamp = timestamp
+        self.buckets: Dict[int, Dict[str, List[int]]] = {}
+        self.days: List[int] = []                  # 버킷 일자 (정렬)
+        self.windows: Dict[str, _Window] = {}
+
+    def add_matches(self, matches: Iterable[Dict[str, Any]]) -> None:
+        """매치 dict 목록 반영 (날짜를 알 수 없는 매치는 제외)"""
+        for m in matches:
+            p1 = m.get("player1", "").lower()
+            p2 = m.get("player2", "").lower()
+            ts = self.timestamp(m)
+            if not p1 or not p2 or ts == float("-inf"):
+                continue
+
+            day = date.fromtimestamp(ts).toordinal()
+            bucket = self.buckets.get(day)
+            if bucket is None:
+                bucket = self.buckets[day] = {}
+                bisect.insort(self.days, day)
+
+            s1 = m.get("score1", 0)
+            s2 = m.get("score2", 0)
+            records = ((p1, [1, s1, s2]), (p2, [1, s2, s1]))
+            for player, record in records:
+                _add_record(bucket, player, record)
+
+            # 이 날짜를 포함하는 윈도우 합계도 바로 갱신
+            for window in self.windows.values():
+                if window.covers(day):
+                    for player, record in records:
+                        _add_record(window.totals, player, record)
+                    window.revision += 1
+
+    # -------------------------------------------------------------------------
+    # 윈도우 이동
+    # -------------------------------------------------------------------------
+    def _apply_days(self, window: _Window, first: int, last: int, sign: int) -> None:
+        """[first, last] 일자 버킷을 윈도우 합계에 더하거나 뺌"""
+        if first > last:
+            return
+        lo = bisect.bisect_left(self.days, first)
+        hi = bisect.bisect_right(self.days, last)
+        for day in self.days[lo:hi]:
+            for player, record in self.buckets[day].items():
+                _add_record(window.totals, player, record, sign)
+
+    def slide(self, key: str, start: int, end: int) -> _Window:
+        """
+        윈도우를 [start, end] 일자 구간으로 이동
+        겹치는 구간은 그대로 두고 빠지는/들어오는 날짜 버킷만 반영
+        """
+        window = self.windows.get(key)
+        if window is None:
+            window = self.windows[key] = _Window()
+
+        if window.start == start and window.end == end:
+            return window
+
+        if window.start is None or start > window.end or end < window.start:
+            # 겹치지 않으면 새 구간을 처음부터 합산
+            window.totals = {}
+            self._apply_days(window, start, end, 1)
+        else:
+            old_start, old_end = window.start, window.end
+            self._apply_days(window, old_start, min(old_end, start - 1), -1)
+            self._apply_days(window, max(old_start, end + 1), old_end, -1)
+            self._apply_days(window, start, min(end, old_start - 1), 1)
+            self._apply_days(window, max(start, old_end + 1), end, 1)
+
+        window.start = start
+        window.end = end
+        window.revision += 1
+        return window
+
+    def ranking(self, key: str, start: int, end: int, min_games: int = 0) -> List[Dict[str, Any]]:
+        """
+        기간 랭킹 (승률 > 라운드 승 > 매치 수 내림차순, 동률은 ID순)
+
+        Returns:
+            [{"user_id", "games", "wins", "losses", "win_rate"}, ...]
+        """
+        window = self.slide(key, start, end)
+        cached = window._ranked
+        if cached is not None and cached[0] == window.revision and cached[1] == min_games:
+            return cached[2]
+
+        rows = []
+        for user_id, (games, wins, losses) in window.totals.items():
+            if games < min_games:
+                continue
+            rounds = wins + losses
+            rows.append({
+                "user_id": user_id,
+                "games": games,
+                "wins": wins,
+                "losses": losses,
+                "win_rate": round(wins / rounds * 100, 1) if rounds else 0.0,
+            })
+        rows.sort(key=lambda row: (-row["win_rate"], -row["wins"], -row["games"], row["user_id"]))
+
+        window._ranked = (window.revision, min_games, rows)
+        return rows